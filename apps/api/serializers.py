@@ -0,0 +1,95 @@
+from rest_framework import serializers
+
+from apps.planta_docente.models import Asignatura, Cargo, Docente, Resolucion
+
+
+class DocenteSerializer(serializers.ModelSerializer):
+    correos = serializers.SlugRelatedField(
+        many=True, read_only=True, slug_field="email"
+    )
+
+    class Meta:
+        model = Docente
+        fields = [
+            "id",
+            "apellido",
+            "nombre",
+            "documento",
+            "legajo",
+            "fecha_nacimiento",
+            "cv_confirmado",
+            "cv_fecha_confirmacion",
+            "correos",
+            "fecha_modificacion",
+        ]
+
+
+class AsignaturaSerializer(serializers.ModelSerializer):
+    departamento_nombre = serializers.CharField(source="departamento.nombre")
+    carrera_nombre = serializers.CharField(source="carrera.nombre")
+
+    class Meta:
+        model = Asignatura
+        fields = [
+            "id",
+            "codigo",
+            "nombre",
+            "nivel",
+            "puntaje",
+            "horas_semanales",
+            "horas_totales",
+            "departamento",
+            "departamento_nombre",
+            "carrera",
+            "carrera_nombre",
+            "es_obligatoria",
+            "forma_dictado",
+            "areas",
+            "bloques",
+        ]
+
+
+class ResolucionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Resolucion
+        fields = [
+            "id",
+            "numero",
+            "anio",
+            "objeto",
+            "origen",
+            "fecha_emision",
+            "archivo_digital",
+            "detalle_funciones_sustantivas",
+            "observaciones",
+        ]
+
+
+class CargoSerializer(serializers.ModelSerializer):
+    docente_nombre = serializers.CharField(source="docente.__str__")
+    asignatura_nombre = serializers.CharField(source="asignatura.nombre")
+    departamento = serializers.IntegerField(source="asignatura.departamento_id")
+    resolucion_alta_numero = serializers.CharField(source="resolucion_alta.__str__")
+
+    class Meta:
+        model = Cargo
+        fields = [
+            "id",
+            "docente",
+            "docente_nombre",
+            "asignatura",
+            "asignatura_nombre",
+            "departamento",
+            "comision",
+            "caracter",
+            "categoria",
+            "dedicacion",
+            "cantidad_horas",
+            "estado",
+            "fecha_inicio",
+            "fecha_final",
+            "fecha_vencimiento",
+            "resolucion_alta",
+            "resolucion_alta_numero",
+            "observaciones",
+        ]
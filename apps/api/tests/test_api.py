@@ -0,0 +1,77 @@
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from apps.core.models import Departamento
+from apps.planta_docente.models import Asignatura
+from apps.usuarios.models import UserProfile
+
+
+@pytest.fixture
+def cliente_departamento(client, departamento):
+    user = User.objects.create_user(username="api", password="clave")
+    UserProfile.objects.create(user=user).departamentos.add(departamento)
+    client.force_login(user)
+    return client
+
+
+@pytest.fixture
+def cargo_otro_departamento(asignatura, crear_cargo):
+    otro = Departamento.objects.create(nombre="Mecánica")
+    ajena = Asignatura.objects.create(
+        nombre="Termodinámica",
+        nivel="III",
+        puntaje=10,
+        horas_semanales=6,
+        horas_totales=192,
+        departamento=otro,
+        carrera=asignatura.carrera,
+        forma_dictado="anual",
+    )
+    return crear_cargo(asignatura=ajena)
+
+
+@pytest.mark.django_db
+def test_api_limitada_a_departamentos_del_usuario(
+    cliente_departamento, crear_cargo, cargo_otro_departamento
+):
+    propio = crear_cargo()
+
+    cargos = cliente_departamento.get(reverse("api:cargo-list")).json()["results"]
+    docentes = cliente_departamento.get(reverse("api:docente-list")).json()["results"]
+    resoluciones = cliente_departamento.get(reverse("api:resolucion-list")).json()
+
+    assert [c["id"] for c in cargos] == [propio.pk]
+    assert [d["id"] for d in docentes] == [propio.docente_id]
+    # La resolución es compartida, pero no se duplica por tener dos cargos
+    assert len(resoluciones["results"]) == 1
+    assert (
+        cliente_departamento.get(
+            reverse("api:cargo-detail", args=[cargo_otro_departamento.pk])
+        ).status_code
+        == 404
+    )
+
+
+@pytest.mark.django_db
+def test_api_pagina_por_cursor_con_consultas_constantes(
+    cliente_departamento, crear_cargo, django_assert_max_num_queries
+):
+    for _ in range(5):
+        crear_cargo()
+
+    with django_assert_max_num_queries(5):
+        pagina = cliente_departamento.get(
+            reverse("api:cargo-list"), {"page_size": 3}
+        ).json()
+
+    assert len(pagina["results"]) == 3
+    assert "cursor=" in pagina["next"]
+    siguiente = cliente_departamento.get(pagina["next"]).json()
+    assert len(siguiente["results"]) == 2
+    assert siguiente["next"] is None
+
+
+@pytest.mark.django_db
+def test_api_requiere_autenticacion(client):
+    assert client.get(reverse("api:docente-list")).status_code == 403
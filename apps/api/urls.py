@@ -0,0 +1,13 @@
+from rest_framework.routers import DefaultRouter
+
+from . import views
+
+app_name = "api"
+
+router = DefaultRouter()
+router.register("docentes", views.DocenteViewSet, basename="docente")
+router.register("asignaturas", views.AsignaturaViewSet, basename="asignatura")
+router.register("resoluciones", views.ResolucionViewSet, basename="resolucion")
+router.register("cargos", views.CargoViewSet, basename="cargo")
+
+urlpatterns = router.urls
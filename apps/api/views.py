@@ -0,0 +1,68 @@
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import authentication, viewsets
+
+from apps.planta_docente.models import Asignatura, Cargo, Docente, Resolucion
+
+from .serializers import (
+    AsignaturaSerializer,
+    CargoSerializer,
+    DocenteSerializer,
+    ResolucionSerializer,
+)
+
+
+class DepartamentoReadOnlyViewSet(viewsets.ReadOnlyModelViewSet):
+    """ViewSet de solo lectura limitado a los departamentos del usuario"""
+
+    model = None
+    select_related = ()
+    prefetch_related = ()
+    authentication_classes = [
+        authentication.SessionAuthentication,
+        authentication.BasicAuthentication,
+    ]
+    # Sin OrderingFilter: el orden lo fija la paginación por cursor
+    filter_backends = [DjangoFilterBackend]
+
+    def get_queryset(self):
+        return (
+            self.model.objects.for_user(self.request.user)
+            .select_related(*self.select_related)
+            .prefetch_related(*self.prefetch_related)
+        )
+
+
+class DocenteViewSet(DepartamentoReadOnlyViewSet):
+    model = Docente
+    serializer_class = DocenteSerializer
+    prefetch_related = ["correos"]
+    filterset_fields = ["documento", "legajo", "cv_confirmado"]
+
+
+class AsignaturaViewSet(DepartamentoReadOnlyViewSet):
+    model = Asignatura
+    serializer_class = AsignaturaSerializer
+    select_related = ["departamento", "carrera"]
+    prefetch_related = ["areas", "bloques"]
+    filterset_fields = ["departamento", "carrera", "nivel", "es_obligatoria"]
+
+
+class ResolucionViewSet(DepartamentoReadOnlyViewSet):
+    model = Resolucion
+    serializer_class = ResolucionSerializer
+    filterset_fields = ["anio", "objeto", "origen"]
+
+
+class CargoViewSet(DepartamentoReadOnlyViewSet):
+    model = Cargo
+    serializer_class = CargoSerializer
+    select_related = ["docente", "asignatura", "resolucion_alta"]
+    filterset_fields = {
+        "docente": ["exact"],
+        "asignatura": ["exact"],
+        "asignatura__departamento": ["exact"],
+        "estado": ["exact"],
+        "caracter": ["exact"],
+        "dedicacion": ["exact"],
+        "fecha_vencimiento": ["gte", "lte"],
+    }
@@ -1,5 +1,11 @@
 from django.contrib import admin
-from .models import CarreraAcademica, JuntaEvaluadora, Evaluacion, Formulario
+from .models import (
+    CarreraAcademica,
+    JuntaEvaluadora,
+    Evaluacion,
+    Formulario,
+    NovedadVencimiento,
+)
 
 
 class JuntaEvaluadoraInline(admin.StackedInline):
@@ -13,6 +19,13 @@ class EvaluacionInline(admin.TabularInline):
     readonly_fields = ["fecha_iniciada"]
 
 
+class NovedadVencimientoInline(admin.TabularInline):
+    model = NovedadVencimiento
+    extra = 0
+    # En las licencias `dias` se calcula con las fechas (ver clean y save)
+    readonly_fields = ["fecha_registro"]
+
+
 @admin.register(CarreraAcademica)
 class CarreraAcademicaAdmin(admin.ModelAdmin):
     list_display = [
@@ -28,8 +41,12 @@ class CarreraAcademicaAdmin(admin.ModelAdmin):
         "cargo__docente__apellido",
         "cargo__docente__nombre",
     ]
-    inlines = [JuntaEvaluadoraInline, EvaluacionInline]
-    readonly_fields = ["anios_activa", "dias_hasta_vencimiento"]
+    inlines = [JuntaEvaluadoraInline, NovedadVencimientoInline, EvaluacionInline]
+    readonly_fields = [
+        "fecha_vencimiento_actual",
+        "anios_activa",
+        "dias_hasta_vencimiento",
+    ]
 
 
 class FormularioInline(admin.TabularInline):
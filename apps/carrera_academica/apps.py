@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CarreraAcademicaConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.carrera_academica"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -12,7 +12,6 @@ class CarreraAcademicaForm(forms.ModelForm):
             "numero_expediente",
             "fecha_inicio",
             "fecha_vencimiento_original",
-            "fecha_vencimiento_actual",
             "resolucion_designacion",
             "resolucion_puesta_en_funcion",
             "observaciones",
@@ -26,9 +25,6 @@ class CarreraAcademicaForm(forms.ModelForm):
             "fecha_vencimiento_original": forms.DateInput(
                 attrs={"type": "date", "class": "form-control"}
             ),
-            "fecha_vencimiento_actual": forms.DateInput(
-                attrs={"type": "date", "class": "form-control"}
-            ),
             "resolucion_designacion": forms.TextInput(attrs={"class": "form-control"}),
             "resolucion_puesta_en_funcion": forms.TextInput(
                 attrs={"class": "form-control"}
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("carrera_academica", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="carreraacademica",
+            name="fecha_modificacion",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="evaluacion",
+            name="fecha_modificacion",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="juntaevaluadora",
+            name="fecha_modificacion",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def registrar_diferencias_previas(apps, schema_editor):
+    """
+    Las prórrogas y licencias previas sólo quedaron en fecha_vencimiento_actual;
+    se registran como un ajuste para que recalcular conserve esas fechas.
+    """
+    CarreraAcademica = apps.get_model("carrera_academica", "CarreraAcademica")
+    NovedadVencimiento = apps.get_model("carrera_academica", "NovedadVencimiento")
+    ajustes = []
+    for carrera in CarreraAcademica.objects.exclude(
+        fecha_vencimiento_actual=models.F("fecha_vencimiento_original")
+    ).iterator():
+        ajustes.append(
+            NovedadVencimiento(
+                carrera_academica=carrera,
+                tipo="ajuste",
+                fecha_desde=carrera.fecha_modificacion.date(),
+                dias=(
+                    carrera.fecha_vencimiento_actual
+                    - carrera.fecha_vencimiento_original
+                ).days,
+                observaciones="Diferencia registrada antes de las novedades",
+            )
+        )
+    NovedadVencimiento.objects.bulk_create(ajustes, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("carrera_academica", "0002_fecha_modificacion"),
+        ("planta_docente", "0008_indices_resolucion"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NovedadVencimiento",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "tipo",
+                    models.CharField(
+                        choices=[
+                            ("licencia", "Licencia"),
+                            ("prorroga", "Prórroga"),
+                            ("ajuste", "Ajuste"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("fecha_desde", models.DateField()),
+                ("fecha_hasta", models.DateField(blank=True, null=True)),
+                ("meses", models.IntegerField(default=0)),
+                ("dias", models.IntegerField(default=0)),
+                ("resolucion", models.CharField(blank=True, max_length=100)),
+                ("observaciones", models.TextField(blank=True)),
+                ("fecha_registro", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Novedad de Vencimiento",
+                "verbose_name_plural": "Novedades de Vencimiento",
+                "ordering": ["fecha_desde", "id"],
+            },
+        ),
+        migrations.AlterField(
+            model_name="carreraacademica",
+            name="fecha_vencimiento_actual",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="carreraacademica",
+            index=models.Index(
+                fields=["estado", "fecha_vencimiento_actual"],
+                name="ca_estado_vencimiento_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="novedadvencimiento",
+            name="carrera_academica",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="novedades",
+                to="carrera_academica.carreraacademica",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="novedadvencimiento",
+            index=models.Index(
+                fields=["carrera_academica", "fecha_desde"],
+                name="novedad_carrera_fecha_idx",
+            ),
+        ),
+        migrations.RunPython(registrar_diferencias_previas, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,20 @@
-from django.db import models
+from functools import cached_property
+
+from django.db import models, transaction
+from django.db.models import Count, Prefetch
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 from datetime import date
 from dateutil.relativedelta import relativedelta
 
+from apps.core.cache import invalidar_modelo
+
+
+class CarreraAcademicaQuerySet(models.QuerySet):
+    def con_evaluaciones_count(self):
+        """Anota la cantidad de evaluaciones en la misma consulta"""
+        return self.annotate(evaluaciones_count=Count("evaluaciones"))
+
 
 class CarreraAcademica(models.Model):
     """Expediente de carrera académica de un docente"""
@@ -21,21 +33,52 @@ class CarreraAcademica(models.Model):
     numero_expediente = models.CharField(max_length=100, unique=True)
     fecha_inicio = models.DateField()
     fecha_vencimiento_original = models.DateField()
-    fecha_vencimiento_actual = models.DateField()
+    # Vencimiento original más las novedades registradas; lo mantienen
+    # registrar_novedad y recalcular_vencimiento, no se edita a mano
+    fecha_vencimiento_actual = models.DateField(editable=False)
     estado = models.CharField(max_length=20, choices=ESTADO_CHOICES, default="activa")
     resolucion_designacion = models.CharField(max_length=100)
     resolucion_puesta_en_funcion = models.CharField(max_length=100)
     fecha_finalizacion = models.DateField(null=True, blank=True)
     observaciones = models.TextField(blank=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
+
+    objects = CarreraAcademicaQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Carrera Académica"
         verbose_name_plural = "Carreras Académicas"
         ordering = ["-fecha_inicio"]
+        indexes = [
+            models.Index(
+                fields=["estado", "fecha_vencimiento_actual"],
+                name="ca_estado_vencimiento_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"CA {self.numero_expediente} - {self.cargo.docente}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instancia = super().from_db(db, field_names, values)
+        instancia._vencimiento_original_cargado = instancia.__dict__.get(
+            "fecha_vencimiento_original"
+        )
+        return instancia
+
+    def save(self, *args, **kwargs):
+        original_cargado = getattr(
+            self, "_vencimiento_original_cargado", self.fecha_vencimiento_original
+        )
+        if (
+            self.fecha_vencimiento_actual is None
+            or self.fecha_vencimiento_original != original_cargado
+        ):
+            self.fecha_vencimiento_actual = self.vencimiento_al()
+        super().save(*args, **kwargs)
+        self._vencimiento_original_cargado = self.fecha_vencimiento_original
+
     @property
     def docente(self):
         return self.cargo.docente
@@ -54,21 +97,208 @@ class CarreraAcademica(models.Model):
         """Días hasta el vencimiento actual"""
         return (self.fecha_vencimiento_actual - date.today()).days
 
-    def aplicar_prorroga(self, meses):
-        """Aplica una prórroga a la carrera académica"""
-        self.fecha_vencimiento_actual = self.fecha_vencimiento_actual + relativedelta(
-            months=meses
+    def vencimiento_al(self, fecha=None):
+        """
+        Vencimiento que regía en `fecha`: el original más las novedades
+        vigentes desde esa fecha o antes. Sin fecha, con todas las novedades.
+        """
+        vencimiento = self.fecha_vencimiento_original
+        if self.pk is None:
+            return vencimiento
+        novedades = self.novedades.all()
+        if fecha is not None:
+            novedades = novedades.filter(fecha_desde__lte=fecha)
+        for novedad in novedades.order_by("fecha_desde", "id"):
+            vencimiento = novedad.aplicar(vencimiento)
+        return vencimiento
+
+    def calendario_vencimiento(self):
+        """Las novedades en orden, con el vencimiento que resultó de cada una"""
+        vencimiento = self.fecha_vencimiento_original
+        calendario = []
+        for novedad in self.novedades.order_by("fecha_desde", "id"):
+            vencimiento = novedad.aplicar(vencimiento)
+            calendario.append((novedad, vencimiento))
+        return calendario
+
+    def recalcular_vencimiento(self):
+        """Vuelve a calcular el vencimiento materializado con todas las novedades"""
+        self.fecha_vencimiento_actual = self.vencimiento_al()
+        self._guardar_vencimiento()
+
+    def _guardar_vencimiento(self):
+        self.fecha_modificacion = timezone.now()
+        CarreraAcademica.objects.filter(pk=self.pk).update(
+            fecha_vencimiento_actual=self.fecha_vencimiento_actual,
+            fecha_modificacion=self.fecha_modificacion,
         )
-        self.save()
-
-    def aplicar_licencia(self, fecha_inicio_licencia, fecha_fin_licencia):
-        """Aplica una licencia y ajusta el vencimiento"""
-        dias_licencia = (fecha_fin_licencia - fecha_inicio_licencia).days
-        self.fecha_vencimiento_actual = self.fecha_vencimiento_actual + relativedelta(
-            days=dias_licencia
+        invalidar_modelo(CarreraAcademica)
+
+    @classmethod
+    def registrar_novedad(cls, novedad, creada=True):
+        """
+        Actualiza el vencimiento de la carrera de `novedad`. Una novedad nueva
+        posterior a las demás se suma al vencimiento actual; si se modificó o
+        es anterior a otra ya registrada, se recalcula con todas.
+        """
+        with transaction.atomic():
+            carrera = cls.objects.select_for_update().get(
+                pk=novedad.carrera_academica_id
+            )
+            posteriores = carrera.novedades.filter(
+                fecha_desde__gt=novedad.fecha_desde
+            ).exists()
+            if creada and not posteriores:
+                carrera.fecha_vencimiento_actual = novedad.aplicar(
+                    carrera.fecha_vencimiento_actual
+                )
+                carrera._guardar_vencimiento()
+            else:
+                carrera.recalcular_vencimiento()
+        return carrera
+
+    def aplicar_prorroga(self, meses, fecha=None, resolucion=""):
+        """Registra una prórroga y corre el vencimiento"""
+        novedad = self.novedades.create(
+            tipo="prorroga",
+            fecha_desde=fecha or date.today(),
+            meses=meses,
+            resolucion=resolucion,
+        )
+        self.refresh_from_db(fields=["fecha_vencimiento_actual", "fecha_modificacion"])
+        return novedad
+
+    def aplicar_licencia(
+        self, fecha_inicio_licencia, fecha_fin_licencia, resolucion=""
+    ):
+        """Registra una licencia, corre el vencimiento y pasa la carrera a licencia"""
+        novedad = self.novedades.create(
+            tipo="licencia",
+            fecha_desde=fecha_inicio_licencia,
+            fecha_hasta=fecha_fin_licencia,
+            resolucion=resolucion,
         )
+        self.refresh_from_db(fields=["fecha_vencimiento_actual"])
         self.estado = "licencia"
-        self.save()
+        self.save(update_fields=["estado", "fecha_modificacion"])
+        return novedad
+
+    @property
+    def anios_actividad(self):
+        """Años calendario de actividad, del inicio a la finalización (u hoy)"""
+        fin = self.fecha_finalizacion or date.today()
+        return list(
+            range(self.fecha_inicio.year, max(fin.year, self.fecha_inicio.year) + 1)
+        )
+
+    def matriz_formularios(self, anios=None):
+        """
+        Formularios presentados por tipo y año, con una sola consulta agrupada.
+
+        Devuelve (años, filas); cada fila tiene el tipo, su nombre, si es anual,
+        la cantidad por año (en el orden de `años`) y los años faltantes. Los
+        formularios anuales faltan en cada año sin presentar; CV y ENC, con
+        faltantes [None], si no hay ninguno.
+        """
+        anios = list(anios if anios is not None else self.anios_actividad)
+        presentados = {
+            (fila["tipo"], fila["anio_actividad"]): fila["cantidad"]
+            for fila in self.formulario_set.order_by()
+            .values("tipo", "anio_actividad")
+            .annotate(cantidad=Count("id"))
+        }
+
+        filas = []
+        for tipo, nombre in Formulario.TIPO_FORMULARIO_CHOICES:
+            cantidades = [presentados.get((tipo, anio), 0) for anio in anios]
+            anual = tipo in Formulario.TIPOS_ANUALES
+            if anual:
+                faltantes = [a for a, n in zip(anios, cantidades) if not n]
+            else:
+                total = sum(n for (t, _), n in presentados.items() if t == tipo)
+                faltantes = [] if total else [None]
+            filas.append(
+                {
+                    "tipo": tipo,
+                    "nombre": nombre,
+                    "anual": anual,
+                    "cantidades": cantidades,
+                    "faltantes": faltantes,
+                }
+            )
+        return anios, filas
+
+
+class NovedadVencimiento(models.Model):
+    """Licencia, prórroga o ajuste que corre el vencimiento de una carrera"""
+
+    TIPO_CHOICES = [
+        ("licencia", "Licencia"),
+        ("prorroga", "Prórroga"),
+        ("ajuste", "Ajuste"),
+    ]
+
+    carrera_academica = models.ForeignKey(
+        CarreraAcademica, on_delete=models.CASCADE, related_name="novedades"
+    )
+    tipo = models.CharField(max_length=20, choices=TIPO_CHOICES)
+    # Desde cuándo rige; las novedades se aplican en este orden
+    fecha_desde = models.DateField()
+    fecha_hasta = models.DateField(null=True, blank=True)
+    meses = models.IntegerField(default=0)
+    # En las licencias se calcula con fecha_desde y fecha_hasta
+    dias = models.IntegerField(default=0)
+    resolucion = models.CharField(max_length=100, blank=True)
+    observaciones = models.TextField(blank=True)
+    fecha_registro = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Novedad de Vencimiento"
+        verbose_name_plural = "Novedades de Vencimiento"
+        ordering = ["fecha_desde", "id"]
+        indexes = [
+            models.Index(
+                fields=["carrera_academica", "fecha_desde"],
+                name="novedad_carrera_fecha_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_tipo_display()} desde {self.fecha_desde}"
+
+    def clean(self):
+        """Cada tipo usa sus campos: fechas la licencia, meses la prórroga"""
+        errores = {}
+        if self.tipo == "licencia":
+            if not self.fecha_hasta:
+                errores["fecha_hasta"] = "La licencia requiere fecha de fin"
+            elif self.fecha_desde and self.fecha_hasta < self.fecha_desde:
+                errores["fecha_hasta"] = (
+                    "La licencia no puede terminar antes de empezar"
+                )
+            if self.meses:
+                errores["meses"] = "La duración de la licencia sale de sus fechas"
+        else:
+            if self.fecha_hasta:
+                errores["fecha_hasta"] = "Sólo las licencias tienen fecha de fin"
+            if self.tipo == "prorroga":
+                if not self.meses:
+                    errores["meses"] = "La prórroga requiere la cantidad de meses"
+                if self.dias:
+                    errores["dias"] = "La prórroga se indica en meses"
+            elif not (self.meses or self.dias):
+                errores["meses"] = "El ajuste requiere meses o días"
+        if errores:
+            raise ValidationError(errores)
+
+    def save(self, *args, **kwargs):
+        if self.tipo == "licencia" and self.fecha_hasta:
+            self.dias = (self.fecha_hasta - self.fecha_desde).days
+        super().save(*args, **kwargs)
+
+    def aplicar(self, vencimiento):
+        """El vencimiento corrido por esta novedad"""
+        return vencimiento + relativedelta(months=self.meses, days=self.dias)
 
 
 class JuntaEvaluadora(models.Model):
@@ -100,6 +330,7 @@ class JuntaEvaluadora(models.Model):
     veedor_alumno = models.CharField(max_length=255, blank=True)
     veedor_graduado = models.CharField(max_length=255, blank=True)
     fecha_conformacion = models.DateField()
+    fecha_modificacion = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Junta Evaluadora"
@@ -109,6 +340,20 @@ class JuntaEvaluadora(models.Model):
         return f"Junta - {self.carrera_academica.numero_expediente}"
 
 
+class EvaluacionQuerySet(models.QuerySet):
+    def con_formularios(self):
+        """Precarga tipo y año de los formularios en una sola consulta"""
+        return self.prefetch_related(
+            Prefetch(
+                "formulario_set",
+                queryset=Formulario.objects.order_by().only(
+                    "evaluacion_id", "tipo", "anio_actividad"
+                ),
+                to_attr="formularios_precargados",
+            )
+        )
+
+
 class Evaluacion(models.Model):
     """Evaluaciones periódicas de la carrera académica"""
 
@@ -145,6 +390,9 @@ class Evaluacion(models.Model):
         upload_to="evaluaciones/informes/", null=True, blank=True
     )
     observaciones = models.TextField(blank=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
+
+    objects = EvaluacionQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Evaluación"
@@ -155,13 +403,56 @@ class Evaluacion(models.Model):
     def __str__(self):
         return f"Evaluación {self.numero_evaluacion} - {self.carrera_academica.numero_expediente}"
 
+    @cached_property
+    def formularios_faltantes(self):
+        """
+        Años faltantes por tipo, como en CarreraAcademica.matriz_formularios.
+
+        F01-F13 faltan en cada año evaluado sin presentar; CV y ENC, con
+        [None], si no hay ninguno. Usa `formularios_precargados` si existe.
+        """
+        if hasattr(self, "formularios_precargados"):
+            pares = {(f.tipo, f.anio_actividad) for f in self.formularios_precargados}
+        else:
+            pares = set(
+                self.formulario_set.order_by().values_list("tipo", "anio_actividad")
+            )
+        tipos = {tipo for tipo, _ in pares}
+
+        faltantes = {}
+        for tipo, _ in Formulario.TIPO_FORMULARIO_CHOICES:
+            if tipo in Formulario.TIPOS_ANUALES:
+                faltantes[tipo] = [
+                    anio for anio in self._anios if (tipo, anio) not in pares
+                ]
+            else:
+                faltantes[tipo] = [] if tipo in tipos else [None]
+        return faltantes
+
+    @property
+    def _anios(self):
+        return list(dict.fromkeys(self.anios_evaluados or []))
+
+    @property
+    def formularios_requeridos(self):
+        """F01-F13 por cada año evaluado, más CV y ENC"""
+        anuales = len(Formulario.TIPOS_ANUALES)
+        unicos = len(Formulario.TIPO_FORMULARIO_CHOICES) - anuales
+        return anuales * len(self._anios) + unicos
+
+    @property
+    def formularios_presentados(self):
+        faltantes = sum(len(anios) for anios in self.formularios_faltantes.values())
+        return self.formularios_requeridos - faltantes
+
+    @property
+    def porcentaje_completitud(self):
+        return self.formularios_presentados * 100 // self.formularios_requeridos
+
     @property
     def esta_completa(self):
         """Verifica si todos los formularios obligatorios están presentados"""
-        # F01-F13 + CV + ENC
-        formularios_requeridos = 15
-        formularios_presentados = self.formulario_set.filter(evaluacion=self).count()
-        return formularios_presentados >= formularios_requeridos
+        return not any(self.formularios_faltantes.values())
 
 
 class Formulario(models.Model):
@@ -185,6 +476,9 @@ class Formulario(models.Model):
         ("ENC", "Encuesta Estudiantil"),
     ]
 
+    # Formularios que se presentan uno por año de actividad
+    TIPOS_ANUALES = [f"F{numero:02}" for numero in range(1, 14)]
+
     carrera_academica = models.ForeignKey(CarreraAcademica, on_delete=models.CASCADE)
     evaluacion = models.ForeignKey(
         Evaluacion,
@@ -216,21 +510,7 @@ class Formulario(models.Model):
     def clean(self):
         """Validaciones del formulario"""
         # Validar límites de formularios según tipo
-        if self.tipo in [
-            "F01",
-            "F02",
-            "F03",
-            "F04",
-            "F05",
-            "F06",
-            "F07",
-            "F08",
-            "F09",
-            "F10",
-            "F11",
-            "F12",
-            "F13",
-        ]:
+        if self.tipo in self.TIPOS_ANUALES:
             # Formularios anuales: máximo uno por año
             if self.anio_actividad:
                 formularios_existentes = Formulario.objects.filter(
@@ -0,0 +1,24 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import CarreraAcademica, NovedadVencimiento
+
+
+@receiver(post_save, sender=NovedadVencimiento)
+def actualizar_vencimiento_al_guardar(sender, instance, created, raw=False, **kwargs):
+    """Mantiene el vencimiento materializado de la carrera"""
+    if raw:
+        return
+    CarreraAcademica.registrar_novedad(instance, creada=created)
+
+
+@receiver(post_delete, sender=NovedadVencimiento)
+def actualizar_vencimiento_al_eliminar(sender, instance, **kwargs):
+    """Recalcula el vencimiento sin la novedad eliminada"""
+    origen = kwargs.get("origin")
+    if getattr(origen, "model", type(origen)) is not NovedadVencimiento:
+        # Borrado en cascada de la carrera o del cargo
+        return
+    carrera = CarreraAcademica.objects.filter(pk=instance.carrera_academica_id).first()
+    if carrera:
+        carrera.recalcular_vencimiento()
@@ -0,0 +1,112 @@
+from datetime import date
+
+import pytest
+from django.urls import reverse
+
+from apps.carrera_academica.models import CarreraAcademica, Evaluacion, Formulario
+from apps.usuarios.models import UserProfile
+
+
+@pytest.fixture
+def evaluacion(carrera):
+    evaluacion = Evaluacion.objects.create(
+        carrera_academica=carrera,
+        numero_evaluacion=1,
+        fecha_iniciada=date(2024, 3, 1),
+        anios_evaluados=[2022, 2023],
+    )
+    for tipo, anio in [("F01", 2022), ("F01", 2023), ("F02", 2022), ("CV", None)]:
+        Formulario.objects.create(
+            carrera_academica=carrera,
+            evaluacion=evaluacion,
+            tipo=tipo,
+            anio_actividad=anio,
+            archivo="formularios_ca/f.pdf",
+        )
+    return evaluacion
+
+
+def _presentar(evaluacion, tipo, anio=None):
+    Formulario.objects.create(
+        carrera_academica=evaluacion.carrera_academica,
+        evaluacion=evaluacion,
+        tipo=tipo,
+        anio_actividad=anio,
+        archivo="formularios_ca/f.pdf",
+    )
+
+
+@pytest.mark.django_db
+def test_formularios_presentados_precargados(evaluacion, django_assert_num_queries):
+    with django_assert_num_queries(2):
+        precargada = Evaluacion.objects.con_formularios().get()
+        # F01-F13 se requieren una vez por año evaluado, CV y ENC una vez
+        assert precargada.formularios_requeridos == 28
+        assert precargada.formularios_presentados == 4
+        assert not precargada.esta_completa
+        assert precargada.porcentaje_completitud == 14
+        assert precargada.formularios_faltantes["F02"] == [2023]
+
+    assert evaluacion.formularios_presentados == 4
+
+    with django_assert_num_queries(1):
+        carrera = CarreraAcademica.objects.con_evaluaciones_count().get()
+        assert carrera.evaluaciones_count == 1
+
+
+@pytest.mark.django_db
+def test_completa_con_un_formulario_anual_por_anio_evaluado(evaluacion):
+    for tipo in Formulario.TIPOS_ANUALES:
+        _presentar(evaluacion, tipo, 2022)
+    _presentar(evaluacion, "ENC")
+
+    # Un tipo por año no alcanza: faltan F02-F13 de 2023
+    evaluacion = Evaluacion.objects.con_formularios().get()
+    assert evaluacion.formularios_presentados == 16
+    assert not evaluacion.esta_completa
+
+    for tipo in Formulario.TIPOS_ANUALES[1:]:
+        _presentar(evaluacion, tipo, 2023)
+    # Un año fuera de los evaluados no cuenta
+    _presentar(evaluacion, "F02", 2021)
+
+    evaluacion = Evaluacion.objects.con_formularios().get()
+    assert evaluacion.formularios_presentados == 28
+    assert evaluacion.esta_completa
+    assert evaluacion.porcentaje_completitud == 100
+
+
+@pytest.mark.django_db
+def test_matriz_de_formularios_faltantes(
+    carrera, evaluacion, django_assert_num_queries
+):
+    carrera.fecha_finalizacion = date(2023, 12, 31)
+    with django_assert_num_queries(1):
+        anios, filas = carrera.matriz_formularios()
+
+    assert anios == [2022, 2023]
+    por_tipo = {fila["tipo"]: fila for fila in filas}
+    assert len(por_tipo) == 15
+    assert por_tipo["F01"]["cantidades"] == [1, 1]
+    assert por_tipo["F01"]["faltantes"] == []
+    assert por_tipo["F02"]["faltantes"] == [2023]
+    assert por_tipo["F13"]["faltantes"] == [2022, 2023]
+    assert por_tipo["CV"]["faltantes"] == []
+    assert por_tipo["ENC"]["faltantes"] == [None]
+
+
+@pytest.mark.django_db
+def test_detalle_de_evaluacion(client, admin_user, evaluacion):
+    UserProfile.objects.create(user=admin_user, es_superadmin=True)
+    client.force_login(admin_user)
+
+    response = client.get(
+        reverse("carrera_academica:evaluacion_detail", args=[evaluacion.pk])
+    )
+
+    assert response.status_code == 200
+    faltantes = {tipo: anios for tipo, _, anios in response.context["requeridos"]}
+    assert [tipo for tipo, anios in faltantes.items() if not anios] == ["F01", "CV"]
+    assert faltantes["F02"] == [2023]
+    assert faltantes["ENC"] == [None]
+    assert "4 / 28" in response.content.decode()
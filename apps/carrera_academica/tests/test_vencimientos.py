@@ -0,0 +1,123 @@
+from datetime import date, timedelta
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+
+from apps.carrera_academica.models import CarreraAcademica, NovedadVencimiento
+
+
+def _vencimiento(carrera):
+    return CarreraAcademica.objects.values_list(
+        "fecha_vencimiento_actual", flat=True
+    ).get(pk=carrera.pk)
+
+
+@pytest.mark.django_db
+def test_registra_prorrogas_y_licencias_sin_perder_historia(carrera):
+    assert carrera.fecha_vencimiento_actual == date(2029, 1, 30)
+
+    carrera.aplicar_prorroga(1, fecha=date(2025, 1, 1), resolucion="R 10/2025")
+    assert carrera.fecha_vencimiento_actual == date(2029, 2, 28)
+
+    carrera.aplicar_licencia(date(2026, 3, 1), date(2026, 3, 4))
+    assert carrera.estado == "licencia"
+    assert carrera.fecha_vencimiento_actual == _vencimiento(carrera)
+    assert _vencimiento(carrera) == date(2029, 3, 3)
+
+    assert [n.tipo for n, _ in carrera.calendario_vencimiento()] == [
+        "prorroga",
+        "licencia",
+    ]
+    assert carrera.vencimiento_al(date(2024, 12, 31)) == date(2029, 1, 30)
+    assert carrera.vencimiento_al(date(2025, 6, 1)) == date(2029, 2, 28)
+    assert carrera.vencimiento_al(date(2026, 3, 1)) == date(2029, 3, 3)
+
+
+@pytest.mark.django_db
+def test_novedad_anterior_o_eliminada_recalcula_en_orden(carrera):
+    carrera.aplicar_prorroga(1, fecha=date(2025, 1, 1))
+    licencia = carrera.aplicar_licencia(date(2026, 3, 1), date(2026, 3, 4))
+
+    # Aplicada antes de la prórroga, corre el vencimiento al 1/2 y no al 28/2
+    NovedadVencimiento.objects.create(
+        carrera_academica=carrera,
+        tipo="licencia",
+        fecha_desde=date(2024, 5, 1),
+        fecha_hasta=date(2024, 5, 3),
+    )
+    assert _vencimiento(carrera) == date(2029, 3, 4)
+
+    licencia.delete()
+    assert _vencimiento(carrera) == date(2029, 3, 1)
+
+
+@pytest.mark.django_db
+def test_cambiar_vencimiento_original_conserva_las_novedades(carrera):
+    carrera.aplicar_prorroga(6, fecha=date(2025, 1, 1))
+
+    carrera = CarreraAcademica.objects.get(pk=carrera.pk)
+    carrera.fecha_vencimiento_original = date(2030, 1, 1)
+    carrera.save()
+    assert _vencimiento(carrera) == date(2030, 7, 1)
+
+
+@pytest.mark.django_db
+def test_ajuste_en_dias_corre_el_vencimiento(carrera):
+    ajuste = NovedadVencimiento(
+        carrera_academica=carrera, tipo="ajuste", fecha_desde=date(2025, 1, 1), dias=10
+    )
+    ajuste.full_clean()
+    ajuste.save()
+
+    assert _vencimiento(carrera) == date(2029, 2, 9)
+
+
+@pytest.mark.parametrize(
+    "tipo, datos, campo",
+    [
+        ("licencia", {"fecha_hasta": date(2025, 2, 1), "meses": 2}, "meses"),
+        ("licencia", {"fecha_hasta": date(2024, 12, 1)}, "fecha_hasta"),
+        ("prorroga", {}, "meses"),
+        ("prorroga", {"meses": 1, "dias": 5}, "dias"),
+        ("prorroga", {"meses": 1, "fecha_hasta": date(2025, 2, 1)}, "fecha_hasta"),
+        ("ajuste", {}, "meses"),
+    ],
+)
+@pytest.mark.django_db
+def test_cada_tipo_de_novedad_usa_sus_campos(carrera, tipo, datos, campo):
+    novedad = NovedadVencimiento(
+        carrera_academica=carrera, tipo=tipo, fecha_desde=date(2025, 1, 1), **datos
+    )
+
+    with pytest.raises(ValidationError) as error:
+        novedad.full_clean()
+    assert campo in error.value.message_dict
+
+
+@pytest.mark.django_db
+def test_reporte_usa_el_vencimiento_materializado(client, admin_user, carrera):
+    hoy = date.today()
+    carrera.fecha_vencimiento_original = hoy - timedelta(days=10)
+    carrera.save()
+    client.force_login(admin_user)
+
+    respuesta = client.get(reverse("carrera_academica:reporte_vencimientos"))
+    assert list(respuesta.context["vencidas"]) == [carrera]
+
+    carrera.aplicar_prorroga(2, fecha=hoy)
+    respuesta = client.get(reverse("carrera_academica:reporte_vencimientos"))
+    assert list(respuesta.context["vencidas"]) == []
+    assert list(respuesta.context["proximos_6_meses"]) == [carrera]
+
+
+@pytest.mark.django_db
+def test_detalle_muestra_el_vencimiento_a_una_fecha(client, admin_user, carrera):
+    carrera.aplicar_prorroga(1, fecha=date(2025, 1, 1))
+    client.force_login(admin_user)
+    url = reverse("carrera_academica:carrera_detail", args=[carrera.pk])
+
+    respuesta = client.get(url, {"al": "2024-06-01"})
+    assert respuesta.context["vencimiento_al"] == date(2029, 1, 30)
+    assert len(respuesta.context["calendario_vencimiento"]) == 1
+    assert client.get(url, {"al": "no"}).context["consulta_al"] is None
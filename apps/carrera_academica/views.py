@@ -7,7 +7,7 @@ from django.views.generic import (
 )
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse_lazy
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.contrib import messages
 from datetime import date, timedelta
 
@@ -18,6 +18,9 @@ from .forms import (
     EvaluacionForm,
     FormularioUploadForm,
 )
+from apps.core.busqueda import filtrar_busqueda
+from apps.core.cache import estadisticas_cacheadas
+from apps.core.mixins import RespuestaCondicionalMixin
 
 
 class CarreraAcademicaDashboardView(LoginRequiredMixin, TemplateView):
@@ -28,14 +31,13 @@ class CarreraAcademicaDashboardView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        context["total_carreras"] = CarreraAcademica.objects.count()
-        context["activas"] = CarreraAcademica.objects.filter(estado="activa").count()
-        context["en_licencia"] = CarreraAcademica.objects.filter(
-            estado="licencia"
-        ).count()
-        context["evaluaciones_pendientes"] = Evaluacion.objects.filter(
-            estado="pendiente"
-        ).count()
+        context.update(
+            estadisticas_cacheadas(
+                "carrera_academica",
+                [CarreraAcademica, Evaluacion],
+                self.estadisticas,
+            )
+        )
 
         # Carreras próximas a vencer
         hoy = date.today()
@@ -49,17 +51,37 @@ class CarreraAcademicaDashboardView(LoginRequiredMixin, TemplateView):
 
         return context
 
+    @staticmethod
+    def estadisticas():
+        estadisticas = CarreraAcademica.objects.aggregate(
+            total_carreras=Count("id"),
+            activas=Count("id", filter=Q(estado="activa")),
+            en_licencia=Count("id", filter=Q(estado="licencia")),
+        )
+        estadisticas["evaluaciones_pendientes"] = Evaluacion.objects.filter(
+            estado="pendiente"
+        ).count()
+        return estadisticas
+
 
-class CarreraAcademicaListView(LoginRequiredMixin, ListView):
+class CarreraAcademicaListView(LoginRequiredMixin, RespuestaCondicionalMixin, ListView):
     """Lista de carreras académicas"""
 
     model = CarreraAcademica
     template_name = "carrera_academica/carrera_list.html"
     context_object_name = "carreras"
     paginate_by = 20
+    campos_modificacion = [
+        "fecha_modificacion",
+        "cargo__fecha_modificacion",
+        "cargo__docente__fecha_modificacion",
+        "evaluaciones__fecha_modificacion",
+    ]
 
     def get_queryset(self):
-        queryset = CarreraAcademica.objects.select_related("cargo__docente")
+        queryset = CarreraAcademica.objects.select_related(
+            "cargo__docente"
+        ).con_evaluaciones_count()
 
         # Filtros
         estado = self.request.GET.get("estado")
@@ -68,33 +90,58 @@ class CarreraAcademicaListView(LoginRequiredMixin, ListView):
 
         search = self.request.GET.get("search")
         if search:
-            queryset = queryset.filter(
-                Q(numero_expediente__icontains=search)
-                | Q(cargo__docente__apellido__icontains=search)
-                | Q(cargo__docente__nombre__icontains=search)
+            queryset = filtrar_busqueda(
+                queryset,
+                search,
+                "cargo__docente__busqueda",
+                extra=["numero_expediente"],
             )
 
         return queryset.order_by("-fecha_inicio")
 
 
-class CarreraAcademicaDetailView(LoginRequiredMixin, DetailView):
+class CarreraAcademicaDetailView(
+    LoginRequiredMixin, RespuestaCondicionalMixin, DetailView
+):
     """Detalle de una carrera académica"""
 
     model = CarreraAcademica
     template_name = "carrera_academica/carrera_detail.html"
     context_object_name = "carrera"
+    campos_modificacion = [
+        "fecha_modificacion",
+        "novedades__fecha_registro",
+        "cargo__fecha_modificacion",
+        "cargo__docente__fecha_modificacion",
+        "cargo__asignatura__fecha_modificacion",
+        "junta__fecha_modificacion",
+        "evaluaciones__fecha_modificacion",
+        "formulario__fecha_entrega",
+    ]
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["evaluaciones"] = self.object.evaluaciones.all().order_by(
+        context["evaluaciones"] = self.object.evaluaciones.con_formularios().order_by(
             "numero_evaluacion"
         )
+        context["anios"], context["matriz_formularios"] = (
+            self.object.matriz_formularios()
+        )
+        context["calendario_vencimiento"] = self.object.calendario_vencimiento()
+        try:
+            context["consulta_al"] = date.fromisoformat(self.request.GET.get("al", ""))
+        except ValueError:
+            context["consulta_al"] = None
+        else:
+            context["vencimiento_al"] = self.object.vencimiento_al(
+                context["consulta_al"]
+            )
         context["formularios_recientes"] = self.object.formulario_set.all().order_by(
             "-fecha_entrega"
         )[:10]
         try:
             context["junta"] = self.object.junta
-        except self.object.junta.DoesNotExist:
+        except JuntaEvaluadora.DoesNotExist:
             context["junta"] = None
         return context
 
@@ -161,12 +208,21 @@ class EvaluacionDetailView(LoginRequiredMixin, DetailView):
     """Detalle de una evaluación"""
 
     model = Evaluacion
+    queryset = Evaluacion.objects.select_related("carrera_academica__cargo__docente")
     template_name = "carrera_academica/evaluacion_detail.html"
     context_object_name = "evaluacion"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["formularios"] = self.object.formulario_set.all().order_by("tipo")
+        formularios = list(self.object.formulario_set.all().order_by("tipo"))
+        # La completitud se calcula con los mismos formularios del listado
+        self.object.formularios_precargados = formularios
+        faltantes = self.object.formularios_faltantes
+        context["formularios"] = formularios
+        context["requeridos"] = [
+            (tipo, nombre, faltantes[tipo])
+            for tipo, nombre in Formulario.TIPO_FORMULARIO_CHOICES
+        ]
         return context
 
 
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Bloque, Area, Departamento, Carrera
+from .models import Bloque, Area, Departamento, Carrera, CorreoPendiente, Tarea
 
 
 @admin.register(Bloque)
@@ -25,3 +25,33 @@ class CarreraAdmin(admin.ModelAdmin):
     list_display = ["nombre", "departamento_cabecera", "codigo"]
     list_filter = ["departamento_cabecera"]
     search_fields = ["nombre", "codigo"]
+
+
+@admin.register(CorreoPendiente)
+class CorreoPendienteAdmin(admin.ModelAdmin):
+    list_display = [
+        "destinatario",
+        "asunto",
+        "estado",
+        "intentos",
+        "proximo_intento",
+        "fecha_envio",
+    ]
+    list_filter = ["estado"]
+    search_fields = ["destinatario", "asunto"]
+    readonly_fields = ["fecha_creacion", "fecha_envio", "ultimo_error"]
+
+
+@admin.register(Tarea)
+class TareaAdmin(admin.ModelAdmin):
+    list_display = [
+        "funcion",
+        "estado",
+        "intentos",
+        "max_intentos",
+        "disponible_desde",
+        "fecha_fin",
+    ]
+    list_filter = ["estado"]
+    search_fields = ["funcion"]
+    readonly_fields = ["fecha_creacion", "fecha_fin", "ultimo_error"]
@@ -0,0 +1,51 @@
+import unicodedata
+
+from django.db import models
+from django.db.models import Q
+
+
+def normalizar(texto):
+    """Pasa a minúsculas y quita acentos ("Núñez" -> "nunez")"""
+    descompuesto = unicodedata.normalize("NFKD", texto or "")
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).lower()
+
+
+def texto_busqueda(obj, campos):
+    """Texto normalizado con los valores no vacíos de `campos`"""
+    valores = (getattr(obj, campo) for campo in campos)
+    return normalizar(" ".join(str(valor) for valor in valores if valor))
+
+
+def filtrar_busqueda(queryset, texto, campo="busqueda", extra=()):
+    """
+    Filtra por cada palabra de `texto` sobre la columna normalizada `campo`
+    (indexada con pg_trgm en PostgreSQL). `extra` son campos adicionales que
+    se comparan con icontains.
+    """
+    for palabra in texto.split():
+        condicion = Q(**{f"{campo}__contains": normalizar(palabra)})
+        for nombre in extra:
+            condicion |= Q(**{f"{nombre}__icontains": palabra})
+        queryset = queryset.filter(condicion)
+    return queryset
+
+
+class ModeloConBusqueda(models.Model):
+    """Modelo abstracto con una columna de búsqueda normalizada"""
+
+    campos_busqueda = []
+
+    busqueda = models.TextField(editable=False, blank=True, default="")
+
+    class Meta:
+        abstract = True
+
+    def texto_busqueda(self):
+        return texto_busqueda(self, self.campos_busqueda)
+
+    def save(self, *args, **kwargs):
+        self.busqueda = self.texto_busqueda()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and set(update_fields) & set(self.campos_busqueda):
+            kwargs["update_fields"] = {*update_fields, "busqueda"}
+        super().save(*args, **kwargs)
@@ -0,0 +1,66 @@
+import time
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _clave_version(model):
+    return f"version:{model._meta.label_lower}"
+
+
+def versiones_modelos(*modelos):
+    """Devuelve las versiones actuales de los modelos indicados"""
+    claves = [_clave_version(model) for model in modelos]
+    versiones = cache.get_many(claves)
+    faltantes = {clave: time.time_ns() for clave in claves if clave not in versiones}
+    if faltantes:
+        # Una versión nueva (y no 1) evita reutilizar entradas si la clave expiró
+        cache.set_many(faltantes, None)
+        versiones.update(faltantes)
+    return [versiones[clave] for clave in claves]
+
+
+def invalidar_modelo(model):
+    """Incrementa la versión del modelo, invalidando lo que dependa de él"""
+    try:
+        cache.incr(_clave_version(model))
+    except ValueError:
+        cache.set(_clave_version(model), time.time_ns(), None)
+
+
+def alcance_usuario(user):
+    """Identificador del conjunto de departamentos que puede ver el usuario"""
+    if not user.is_authenticated or not hasattr(user, "profile"):
+        return "ninguno"
+    if user.profile.es_superadmin:
+        return "todos"
+    ids = sorted(user.profile.departamentos_ids)
+    return "d" + "-".join(str(pk) for pk in ids) if ids else "ninguno"
+
+
+def estadisticas_cacheadas(nombre, modelos, calcular, alcance="todos"):
+    """Resultado de `calcular()` cacheado por alcance y versión de los modelos"""
+    timeout = settings.DASHBOARD_CACHE_TIMEOUT
+    if not timeout:
+        return calcular()
+
+    versiones = "-".join(str(v) for v in versiones_modelos(*modelos))
+    clave = f"estadisticas:{nombre}:{alcance}:{versiones}"
+    return cache.get_or_set(clave, calcular, timeout)
+
+
+def fragmento_cacheado(nombre, modelos, renderizar, alcance="todos"):
+    """HTML de `renderizar()` cacheado por alcance, día y versión de los modelos"""
+    timeout = settings.FRAGMENTOS_CACHE_TIMEOUT
+    if not timeout:
+        return renderizar()
+
+    versiones = "-".join(str(v) for v in versiones_modelos(*modelos))
+    # El día forma parte de la clave: los fragmentos muestran plazos relativos a hoy
+    clave = f"fragmento:{nombre}:{alcance}:{date.today().isoformat()}:{versiones}"
+    html = cache.get(clave)
+    if html is None:
+        html = renderizar()
+        cache.set(clave, html, timeout)
+    return html
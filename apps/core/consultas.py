@@ -0,0 +1,125 @@
+import json
+import logging
+import re
+import sys
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+from django.template.base import Node
+
+logger = logging.getLogger(__name__)
+
+_LISTA_IN = re.compile(r"IN \((?:%s, )*%s\)")
+
+# Módulos de instrumentación que no cuentan como origen de una consulta
+_INSTRUMENTACION = {__name__, "apps.core.perfilado"}
+
+
+def forma_sql(sql):
+    """El SQL con las listas de IN colapsadas, para agrupar consultas iguales"""
+    if "IN (" in sql:
+        return _LISTA_IN.sub("IN (...)", sql)
+    return sql
+
+
+def origen_consulta():
+    """Líneas de las apps y del template (o None) que originan la consulta"""
+    apps = str(settings.BASE_DIR / "apps")
+    codigo = template = None
+    frame = sys._getframe(1)
+    while frame is not None and (codigo is None or template is None):
+        archivo = frame.f_code.co_filename
+        if (
+            codigo is None
+            and archivo.startswith(apps)
+            and frame.f_globals.get("__name__") not in _INSTRUMENTACION
+        ):
+            relativo = archivo[len(str(settings.BASE_DIR)) + 1 :]
+            codigo = f"{relativo}:{frame.f_lineno} ({frame.f_code.co_name})"
+        if template is None and frame.f_code.co_name == "render_annotated":
+            nodo = frame.f_locals.get("self")
+            if isinstance(nodo, Node) and nodo.origin is not None:
+                template = f"{nodo.origin.template_name}:{nodo.token.lineno}"
+        frame = frame.f_back
+    return codigo, template
+
+
+class MonitorConsultas:
+    """execute_wrapper que mide las consultas y avisa de las lentas y repetidas"""
+
+    def __init__(self, contexto=None):
+        # Vista o comando que se está ejecutando, para el log
+        self.contexto = contexto
+        self.consultas = 0
+        self.sql_ms = 0.0
+        self.formas = Counter()
+        self.repetidas = {}
+        self.umbral_ms = settings.CONSULTAS_LENTAS_MS
+        self.max_repeticiones = settings.CONSULTAS_REPETIDAS_MAX
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            ms = (time.perf_counter() - inicio) * 1000
+            self.sql_ms += ms
+            self.consultas += 1
+            forma = forma_sql(sql)
+            self.formas[forma] += 1
+            if self.umbral_ms and ms >= self.umbral_ms:
+                self._avisar("lenta", forma, ms=round(ms, 1))
+            if (
+                self.max_repeticiones
+                and self.formas[forma] == self.max_repeticiones + 1
+            ):
+                # El origen se toma una sola vez, al superar el máximo
+                self.repetidas[forma] = origen_consulta()
+
+    def duplicadas(self, cantidad=3):
+        """Las consultas ejecutadas más de una vez, de la más repetida a la menos"""
+        return [
+            (veces, sql)
+            for sql, veces in self.formas.most_common(cantidad)
+            if veces > 1
+        ]
+
+    def _avisar(self, tipo, forma, origen=None, **datos):
+        codigo, template = origen or origen_consulta()
+        registro = {
+            "tipo": tipo,
+            "contexto": self.contexto,
+            **datos,
+            "origen": codigo,
+            "template": template,
+            "sql": forma[:500],
+        }
+        logger.warning(json.dumps(registro, ensure_ascii=False))
+
+    def finalizar(self):
+        """Avisa de las formas que superaron el máximo de repeticiones"""
+        for forma, origen in self.repetidas.items():
+            self._avisar("repetida", forma, origen, veces=self.formas[forma])
+
+
+@contextmanager
+def instalar_monitor(monitor):
+    """Instala el monitor en todas las conexiones mientras dura el bloque"""
+    with ExitStack() as pila:
+        for conexion in connections.all():
+            pila.enter_context(conexion.execute_wrapper(monitor))
+        yield monitor
+
+
+@contextmanager
+def monitorear_consultas(contexto=None, monitor=None):
+    """Como instalar_monitor, y al salir avisa de las consultas repetidas"""
+    monitor = monitor or MonitorConsultas(contexto)
+    try:
+        with instalar_monitor(monitor):
+            yield monitor
+    finally:
+        monitor.finalizar()
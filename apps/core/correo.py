@@ -0,0 +1,115 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import CorreoPendiente
+
+logger = logging.getLogger(__name__)
+
+
+def encolar_correos(asunto, mensaje, destinatarios, remitente=None):
+    """Encola un correo individual por destinatario"""
+    remitente = remitente or settings.DEFAULT_FROM_EMAIL
+    return CorreoPendiente.objects.bulk_create(
+        CorreoPendiente(
+            asunto=asunto,
+            mensaje=mensaje,
+            remitente=remitente,
+            destinatario=destinatario,
+        )
+        for destinatario in dict.fromkeys(destinatarios)
+    )
+
+
+def reservar_correos(limite, reserva=None):
+    """Marca como enviando hasta ``limite`` correos vencidos y devuelve sus IDs"""
+    reserva = reserva or settings.CORREO_RESERVA_SEGUNDOS
+    ahora = timezone.now()
+
+    with transaction.atomic():
+        # Reservas vencidas que ya agotaron sus intentos
+        CorreoPendiente.objects.filter(
+            estado="enviando",
+            proximo_intento__lte=ahora,
+            intentos__gte=settings.CORREO_MAX_INTENTOS,
+        ).update(estado="fallido", ultimo_error="Se agotó el tiempo de reserva")
+
+        ids = list(
+            CorreoPendiente.objects.select_for_update(skip_locked=True)
+            .filter(estado__in=["pendiente", "enviando"], proximo_intento__lte=ahora)
+            .order_by("proximo_intento", "id")
+            .values_list("id", flat=True)[:limite]
+        )
+        CorreoPendiente.objects.filter(id__in=ids).update(
+            estado="enviando",
+            intentos=F("intentos") + 1,
+            proximo_intento=ahora + timedelta(seconds=reserva),
+        )
+    return ids
+
+
+def _guardar_resultado(correo, **campos):
+    """Guarda el resultado si el correo sigue con la reserva de este envío"""
+    return CorreoPendiente.objects.filter(
+        pk=correo.pk, estado="enviando", intentos=correo.intentos
+    ).update(**campos)
+
+
+def _registrar_fallo(correo, error):
+    if correo.intentos >= settings.CORREO_MAX_INTENTOS:
+        _guardar_resultado(correo, estado="fallido", ultimo_error=str(error))
+    else:
+        espera = settings.CORREO_BACKOFF_SEGUNDOS * 2 ** (correo.intentos - 1)
+        _guardar_resultado(
+            correo,
+            estado="pendiente",
+            ultimo_error=str(error),
+            proximo_intento=timezone.now() + timedelta(seconds=espera),
+        )
+
+
+def enviar_pendientes(limite=100):
+    """Envía un lote de correos vencidos y devuelve (enviados, con_error)"""
+    # Se envía fuera de la transacción de la reserva, sin bloquear filas
+    ids = reservar_correos(limite)
+    if not ids:
+        return 0, 0
+    correos = list(CorreoPendiente.objects.filter(id__in=ids).order_by("id"))
+    enviados = errores = 0
+
+    conexion = get_connection(fail_silently=False)
+    try:
+        conexion.open()
+    except Exception as error:
+        logger.warning("No se pudo abrir la conexión de correo: %s", error)
+        for correo in correos:
+            _registrar_fallo(correo, error)
+        return 0, len(correos)
+
+    try:
+        for correo in correos:
+            email = EmailMessage(
+                correo.asunto,
+                correo.mensaje,
+                correo.remitente,
+                [correo.destinatario],
+                connection=conexion,
+            )
+            try:
+                conexion.send_messages([email])
+            except Exception as error:
+                logger.warning("Error enviando correo %s: %s", correo.pk, error)
+                _registrar_fallo(correo, error)
+                errores += 1
+            else:
+                _guardar_resultado(correo, estado="enviado", fecha_envio=timezone.now())
+                enviados += 1
+    finally:
+        conexion.close()
+
+    return enviados, errores
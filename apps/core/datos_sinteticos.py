@@ -0,0 +1,427 @@
+import random
+from datetime import date, timedelta
+
+from django.apps import apps
+from django.db import transaction
+
+from .cache import invalidar_modelo
+
+CANTIDADES = {
+    "departamentos": 4,
+    "carreras": 6,
+    "asignaturas": 300,
+    "docentes": 2000,
+    "resoluciones": 400,
+    "cargos": 3000,
+    "estudiantes": 3000,
+    "solicitudes": 2000,
+    "practicas": 500,
+    "carreras_academicas": 400,
+}
+
+APELLIDOS = [
+    "González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez",
+    "Pérez", "García", "Sánchez", "Romero", "Sosa", "Álvarez", "Torres", "Ruiz",
+    "Ramírez", "Flores", "Benítez", "Acosta", "Medina", "Herrera", "Suárez",
+    "Aguirre", "Giménez", "Gutiérrez", "Pereyra", "Molina", "Castro", "Ortiz",
+    "Núñez",
+]  # fmt: skip
+
+NOMBRES = [
+    "María", "Juan", "Ana", "Carlos", "Laura", "Jorge", "Sofía", "Luis",
+    "Valeria", "Martín", "Lucía", "Diego", "Paula", "Pablo", "Carolina",
+    "Federico", "Florencia", "Gustavo", "Natalia", "Ricardo",
+]  # fmt: skip
+
+
+def _lotes(model, objetos, lote):
+    return model.objects.bulk_create(objetos, batch_size=lote)
+
+
+def _siguiente(model, campo, prefijo="", base=0):
+    """Número desde el que seguir, después del mayor valor de ``campo`` numerado."""
+    mayor = base - 1
+    valores = model.objects.filter(**{f"{campo}__startswith": prefijo})
+    for valor in valores.values_list(campo, flat=True).iterator():
+        sufijo = (valor or "")[len(prefijo) :]
+        if sufijo.isdigit():
+            mayor = max(mayor, int(sufijo))
+    return mayor + 1 - base
+
+
+def generar_datos(cantidades=None, semilla=0, fecha_base=None, lote=500):
+    """
+    Crea datos sintéticos de todas las apps y devuelve un diccionario con
+    la cantidad de filas creadas por modelo.
+    """
+    cantidades = {**CANTIDADES, **(cantidades or {})}
+    rnd = random.Random(semilla)
+    hoy = fecha_base or date.today()
+    modelo = apps.get_model
+
+    Departamento = modelo("core", "Departamento")
+    Carrera = modelo("core", "Carrera")
+    Docente = modelo("planta_docente", "Docente")
+    Correo = modelo("planta_docente", "Correo")
+    Asignatura = modelo("planta_docente", "Asignatura")
+    Resolucion = modelo("planta_docente", "Resolucion")
+    Cargo = modelo("planta_docente", "Cargo")
+    ResumenPlanta = modelo("planta_docente", "ResumenPlanta")
+    Estudiante = modelo("equivalencias", "Estudiante")
+    AsignaturaParaEquivalencia = modelo("equivalencias", "AsignaturaParaEquivalencia")
+    SolicitudEquivalencia = modelo("equivalencias", "SolicitudEquivalencia")
+    DetalleSolicitud = modelo("equivalencias", "DetalleSolicitud")
+    PSolicitud = modelo("practica_supervisada", "PSolicitud")
+    JuradoPS = modelo("practica_supervisada", "JuradoPS")
+    CarreraAcademica = modelo("carrera_academica", "CarreraAcademica")
+    JuntaEvaluadora = modelo("carrera_academica", "JuntaEvaluadora")
+    Evaluacion = modelo("carrera_academica", "Evaluacion")
+    Formulario = modelo("carrera_academica", "Formulario")
+    NovedadVencimiento = modelo("carrera_academica", "NovedadVencimiento")
+
+    def persona():
+        return rnd.choice(APELLIDOS), rnd.choice(NOMBRES)
+
+    def fecha_entre(desde_dias, hasta_dias):
+        return hoy + timedelta(days=rnd.randint(desde_dias, hasta_dias))
+
+    with transaction.atomic():
+        # Los valores únicos siguen al mayor existente, no a la cantidad de filas
+        n = max(
+            _siguiente(Departamento, "nombre", "Departamento "),
+            _siguiente(Departamento, "codigo", "DEP"),
+        )
+        departamentos = _lotes(
+            Departamento,
+            [
+                Departamento(nombre=f"Departamento {n + i}", codigo=f"DEP{n + i}")
+                for i in range(cantidades["departamentos"])
+            ],
+            lote,
+        ) or list(Departamento.objects.all())
+
+        # Sin las filas de las que dependen, las entidades se omiten
+        n = max(
+            _siguiente(Carrera, "nombre", "Carrera "),
+            _siguiente(Carrera, "codigo", "CAR"),
+        )
+        carreras = _lotes(
+            Carrera,
+            [
+                Carrera(
+                    nombre=f"Carrera {n + i}",
+                    codigo=f"CAR{n + i}",
+                    departamento_cabecera=departamentos[i % len(departamentos)],
+                )
+                for i in range(cantidades["carreras"] if departamentos else 0)
+            ],
+            lote,
+        ) or list(Carrera.objects.all())
+
+        n = _siguiente(Asignatura, "codigo", "ASG")
+        asignaturas = []
+        for i in range(cantidades["asignaturas"] if departamentos and carreras else 0):
+            horas = rnd.choice([2, 3, 4, 4, 6, 6, 8, 10])
+            asignaturas.append(
+                Asignatura(
+                    nombre=f"Asignatura {n + i}",
+                    codigo=f"ASG{n + i:05}",
+                    nivel=rnd.choice(Asignatura.NIVEL_CHOICES)[0],
+                    puntaje=rnd.randint(4, 15),
+                    horas_semanales=horas,
+                    horas_totales=horas * 32,
+                    departamento=rnd.choice(departamentos),
+                    carrera=rnd.choice(carreras),
+                    es_obligatoria=rnd.random() < 0.8,
+                    forma_dictado=rnd.choice(Asignatura.FORMA_DICTADO_CHOICES)[0],
+                )
+            )
+        asignaturas = _lotes(Asignatura, asignaturas, lote)
+
+        n = max(
+            _siguiente(Docente, "documento", base=20_000_000),
+            _siguiente(Docente, "legajo", "LEG"),
+        )
+        docentes = []
+        for i in range(cantidades["docentes"]):
+            apellido, nombre = persona()
+            docente = Docente(
+                apellido=apellido,
+                nombre=nombre,
+                documento=str(20_000_000 + n + i),
+                legajo=f"LEG{n + i:06}",
+                fecha_nacimiento=date(1950, 1, 1)
+                + timedelta(days=rnd.randint(0, 365 * 45)),
+            )
+            docente.busqueda = docente.texto_busqueda()
+            docentes.append(docente)
+        docentes = _lotes(Docente, docentes, lote)
+
+        correos = []
+        for docente in docentes:
+            for j in range(rnd.choice([1, 1, 2])):
+                correos.append(
+                    Correo(
+                        docente=docente,
+                        email=f"{docente.legajo.lower()}.{j}@example.com",
+                        es_principal=j == 0,
+                    )
+                )
+        _lotes(Correo, correos, lote)
+
+        n = _siguiente(Resolucion, "numero", "S")
+        resoluciones = []
+        for i in range(cantidades["resoluciones"]):
+            emision = fecha_entre(-3650, 0)
+            resoluciones.append(
+                Resolucion(
+                    numero=f"S{n + i}",
+                    anio=emision.year,
+                    objeto=rnd.choice(Resolucion.OBJETO_CHOICES)[0],
+                    origen=rnd.choice(Resolucion.ORIGEN_CHOICES)[0],
+                    fecha_emision=emision,
+                    detalle_funciones_sustantivas="Funciones de docencia",
+                )
+            )
+        resoluciones = _lotes(Resolucion, resoluciones, lote)
+
+        cargos = []
+        if docentes and asignaturas and resoluciones:
+            for i in range(cantidades["cargos"]):
+                # La comisión distingue los cargos de un mismo docente (Cargo.clean)
+                cargo = Cargo(
+                    docente=docentes[i % len(docentes)],
+                    asignatura=rnd.choice(asignaturas),
+                    comision=f"S{i // len(docentes) + 1}",
+                    caracter=rnd.choices(
+                        ["ordinario", "regular", "interino", "extraordinario"],
+                        weights=[2, 4, 5, 1],
+                    )[0],
+                    categoria=rnd.choice(Cargo.CATEGORIA_CHOICES)[0],
+                    dedicacion=rnd.choices(
+                        ["simple", "semiexclusiva", "exclusiva"], weights=[6, 3, 1]
+                    )[0],
+                    cantidad_horas=rnd.choice([4, 6, 8, 10, 20, 40]),
+                    estado=rnd.choices(
+                        ["activo", "licencia", "baja"], weights=[85, 5, 10]
+                    )[0],
+                    fecha_inicio=fecha_entre(-3000, -30),
+                    resolucion_alta=rnd.choice(resoluciones),
+                )
+                cargo.fecha_vencimiento = cargo.calcular_vencimiento() or fecha_entre(
+                    30, 900
+                )
+                cargos.append(cargo)
+            cargos = _lotes(Cargo, cargos, lote)
+        ResumenPlanta.reconstruir()
+
+        configs = _lotes(
+            AsignaturaParaEquivalencia,
+            [
+                AsignaturaParaEquivalencia(
+                    asignatura=asignatura, docente_responsable=rnd.choice(docentes)
+                )
+                for asignatura in (asignaturas if docentes else [])
+            ],
+            lote,
+        )
+
+        n = _siguiente(Estudiante, "dni_pasaporte", base=40_000_000)
+        estudiantes = []
+        for i in range(cantidades["estudiantes"] if carreras else 0):
+            apellido, nombre = persona()
+            estudiante = Estudiante(
+                nombre_completo=f"{nombre} {apellido}",
+                dni_pasaporte=str(40_000_000 + n + i),
+                email_estudiante=f"estudiante{n + i}@example.com",
+                carrera=rnd.choice(carreras),
+            )
+            estudiante.busqueda = estudiante.texto_busqueda()
+            estudiantes.append(estudiante)
+        estudiantes = _lotes(Estudiante, estudiantes, lote)
+
+        solicitudes = []
+        if estudiantes and configs:
+            solicitudes = _lotes(
+                SolicitudEquivalencia,
+                [
+                    SolicitudEquivalencia(
+                        estudiante=rnd.choice(estudiantes),
+                        estado_general=rnd.choices(
+                            ["proceso", "completada", "cancelada"], weights=[6, 3, 1]
+                        )[0],
+                    )
+                    for _ in range(cantidades["solicitudes"])
+                ],
+                lote,
+            )
+        detalles = [
+            DetalleSolicitud(
+                solicitud=solicitud,
+                asignatura=config,
+                estado_asignatura=rnd.choice(
+                    DetalleSolicitud.ESTADO_ASIGNATURA_CHOICES
+                )[0],
+            )
+            for solicitud in solicitudes
+            for config in rnd.sample(configs, min(len(configs), rnd.randint(1, 6)))
+        ]
+        _lotes(DetalleSolicitud, detalles, lote)
+        SolicitudEquivalencia.objects.filter(
+            pk__in=[solicitud.pk for solicitud in solicitudes]
+        ).recalcular_progreso()
+
+        practicas = []
+        if estudiantes and docentes:
+            practicas = _lotes(
+                PSolicitud,
+                [
+                    PSolicitud(
+                        estudiante=rnd.choice(estudiantes),
+                        tema=f"Práctica supervisada {i}",
+                        tutor=rnd.choice(docentes),
+                        empresa_institucion=f"Empresa {rnd.randint(1, 50)}",
+                        plan_trabajo="ps/planes/plan.pdf",
+                        estado_general=rnd.choice(PSolicitud.ESTADO_CHOICES)[0],
+                    )
+                    for i in range(cantidades["practicas"])
+                ],
+                lote,
+            )
+        jurados = []
+        for practica in practicas:
+            for docente in rnd.sample(docentes, min(len(docentes), 2)):
+                jurados.append(JuradoPS(solicitud=practica, docente=docente))
+            jurados.append(
+                JuradoPS(
+                    solicitud=practica,
+                    nombre_externo=" ".join(persona()),
+                    institucion_externa="UNLP",
+                )
+            )
+        _lotes(JuradoPS, jurados, lote)
+
+        # Carreras académicas sobre cargos regulares u ordinarios sin expediente
+        n = _siguiente(CarreraAcademica, "numero_expediente", "EXP-")
+        candidatos = [
+            cargo
+            for cargo in cargos
+            if cargo.caracter in ("regular", "ordinario") and cargo.estado == "activo"
+        ]
+        elegidos = rnd.sample(
+            candidatos, min(len(candidatos), cantidades["carreras_academicas"])
+        )
+        carreras_academicas = _lotes(
+            CarreraAcademica,
+            [
+                CarreraAcademica(
+                    cargo=cargo,
+                    numero_expediente=f"EXP-{n + i:06}",
+                    fecha_inicio=cargo.fecha_inicio,
+                    fecha_vencimiento_original=cargo.fecha_vencimiento,
+                    fecha_vencimiento_actual=cargo.fecha_vencimiento,
+                    estado=rnd.choices(
+                        ["activa", "licencia", "finalizada"], weights=[8, 1, 1]
+                    )[0],
+                    resolucion_designacion=f"RD {n + i}",
+                    resolucion_puesta_en_funcion=f"RPF {n + i}",
+                )
+                for i, cargo in enumerate(elegidos)
+            ],
+            lote,
+        )
+        juntas = [
+            JuntaEvaluadora(
+                carrera_academica=ca,
+                titular_frlp=rnd.choice(docentes),
+                titular_externo1=" ".join(persona()),
+                titular_externo2=" ".join(persona()),
+                fecha_conformacion=ca.fecha_inicio + timedelta(days=180),
+            )
+            for ca in carreras_academicas
+            if rnd.random() < 0.8
+        ]
+        _lotes(JuntaEvaluadora, juntas, lote)
+
+        evaluaciones = []
+        for ca in carreras_academicas:
+            for numero in range(1, rnd.randint(1, 3) + 1):
+                iniciada = ca.fecha_inicio + timedelta(days=730 * numero)
+                evaluaciones.append(
+                    Evaluacion(
+                        carrera_academica=ca,
+                        numero_evaluacion=numero,
+                        fecha_iniciada=iniciada,
+                        anios_evaluados=[iniciada.year - 2, iniciada.year - 1],
+                        estado=rnd.choice(Evaluacion.ESTADO_CHOICES)[0],
+                    )
+                )
+        evaluaciones = _lotes(Evaluacion, evaluaciones, lote)
+
+        tipos = [tipo for tipo, _ in Formulario.TIPO_FORMULARIO_CHOICES]
+        formularios = [
+            Formulario(
+                carrera_academica=evaluacion.carrera_academica,
+                evaluacion=evaluacion,
+                tipo=tipo,
+                anio_actividad=evaluacion.anios_evaluados[-1],
+                archivo="formularios_ca/formulario.pdf",
+                validado=rnd.random() < 0.5,
+            )
+            for evaluacion in evaluaciones
+            for tipo in rnd.sample(tipos, rnd.randint(0, len(tipos)))
+        ]
+        _lotes(Formulario, formularios, lote)
+
+        # Licencias y prórrogas, con el vencimiento materializado que resulta
+        novedades = []
+        for ca in carreras_academicas:
+            desde = ca.fecha_inicio
+            for _ in range(rnd.choices([0, 1, 2], weights=[6, 3, 1])[0]):
+                desde += timedelta(days=rnd.randint(90, 720))
+                if rnd.random() < 0.5:
+                    novedad = NovedadVencimiento(
+                        tipo="licencia",
+                        fecha_desde=desde,
+                        fecha_hasta=desde + timedelta(days=rnd.randint(30, 365)),
+                    )
+                    novedad.dias = (novedad.fecha_hasta - desde).days
+                else:
+                    novedad = NovedadVencimiento(
+                        tipo="prorroga", fecha_desde=desde, meses=rnd.choice([6, 12])
+                    )
+                novedad.carrera_academica = ca
+                ca.fecha_vencimiento_actual = novedad.aplicar(
+                    ca.fecha_vencimiento_actual
+                )
+                novedades.append(novedad)
+        _lotes(NovedadVencimiento, novedades, lote)
+        CarreraAcademica.objects.bulk_update(
+            carreras_academicas, ["fecha_vencimiento_actual"], batch_size=lote
+        )
+
+        creados = {
+            "departamentos": len(departamentos) if cantidades["departamentos"] else 0,
+            "carreras": len(carreras) if cantidades["carreras"] else 0,
+            "asignaturas": len(asignaturas),
+            "docentes": len(docentes),
+            "correos": len(correos),
+            "resoluciones": len(resoluciones),
+            "cargos": len(cargos),
+            "estudiantes": len(estudiantes),
+            "solicitudes": len(solicitudes),
+            "detalles de solicitud": len(detalles),
+            "prácticas supervisadas": len(practicas),
+            "jurados": len(jurados),
+            "carreras académicas": len(carreras_academicas),
+            "evaluaciones": len(evaluaciones),
+            "formularios": len(formularios),
+            "novedades de vencimiento": len(novedades),
+        }
+
+        # bulk_create no dispara las señales que invalidan la caché
+        for model in apps.get_models():
+            if model.__module__.startswith("apps."):
+                invalidar_modelo(model)
+
+    return creados
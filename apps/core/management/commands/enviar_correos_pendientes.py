@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.core.correo import enviar_pendientes
+
+
+class Command(BaseCommand):
+    help = "Envía los correos encolados en la bandeja de salida"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limite", type=int, default=100, help="Correos por lote (default 100)"
+        )
+        parser.add_argument(
+            "--continuo",
+            action="store_true",
+            help="Seguir procesando la cola indefinidamente",
+        )
+        parser.add_argument(
+            "--intervalo",
+            type=int,
+            default=30,
+            help="Segundos de espera entre lotes en modo continuo (default 30)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            total_enviados = total_errores = 0
+            while True:
+                enviados, errores = enviar_pendientes(options["limite"])
+                total_enviados += enviados
+                total_errores += errores
+                if enviados + errores < options["limite"]:
+                    break
+
+            if total_enviados or total_errores or not options["continuo"]:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"✓ {total_enviados} correos enviados, "
+                        f"{total_errores} con error"
+                    )
+                )
+            if not options["continuo"]:
+                break
+            time.sleep(options["intervalo"])
@@ -0,0 +1,52 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.datos_sinteticos import CANTIDADES, generar_datos
+
+
+class Command(BaseCommand):
+    help = "Genera datos sintéticos reproducibles para pruebas de carga"
+
+    def add_arguments(self, parser):
+        for entidad, cantidad in CANTIDADES.items():
+            parser.add_argument(
+                f"--{entidad.replace('_', '-')}",
+                dest=entidad,
+                type=int,
+                default=cantidad,
+                help=f"Cantidad de {entidad.replace('_', ' ')} (default {cantidad})",
+            )
+        parser.add_argument(
+            "--semilla", type=int, default=0, help="Semilla aleatoria (default 0)"
+        )
+        parser.add_argument(
+            "--fecha-base",
+            type=date.fromisoformat,
+            help="Fecha de referencia de los datos (AAAA-MM-DD, default hoy)",
+        )
+        parser.add_argument(
+            "--lote", type=int, default=500, help="Filas por INSERT (default 500)"
+        )
+
+    def handle(self, *args, **options):
+        cantidades = {entidad: options[entidad] for entidad in CANTIDADES}
+        if any(cantidad < 0 for cantidad in cantidades.values()):
+            raise CommandError("Las cantidades no pueden ser negativas")
+        if options["lote"] < 1:
+            raise CommandError("--lote debe ser mayor que cero")
+
+        creados = generar_datos(
+            cantidades,
+            semilla=options["semilla"],
+            fecha_base=options["fecha_base"],
+            lote=options["lote"],
+        )
+        for modelo, cantidad in creados.items():
+            self.stdout.write(f"  {modelo}: {cantidad}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Datos generados: {sum(creados.values())} filas "
+                f"(semilla {options['semilla']})"
+            )
+        )
@@ -0,0 +1,116 @@
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from apps.core.tareas import ejecutar_tarea, reservar_tareas
+
+
+def _inicializar_proceso():
+    # Con el método "spawn" los procesos hijos arrancan sin Django configurado
+    django.setup()
+
+
+def _ejecutar(tarea_id):
+    close_old_connections()
+    try:
+        return tarea_id, ejecutar_tarea(tarea_id)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = "Ejecuta las tareas encoladas en segundo plano"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrencia",
+            type=int,
+            default=settings.TAREAS_CONCURRENCIA,
+            help="Tareas ejecutadas en paralelo",
+        )
+        parser.add_argument(
+            "--procesos",
+            action="store_true",
+            help="Usar un pool de procesos en lugar de hilos",
+        )
+        parser.add_argument(
+            "--visibilidad",
+            type=int,
+            default=settings.TAREAS_VISIBILIDAD_SEGUNDOS,
+            help="Segundos tras los cuales una tarea reservada vuelve a la cola",
+        )
+        parser.add_argument(
+            "--intervalo",
+            type=float,
+            default=2,
+            help="Segundos de espera cuando la cola está vacía (default 2)",
+        )
+        parser.add_argument(
+            "--una-vez",
+            action="store_true",
+            help="Terminar cuando no queden tareas disponibles",
+        )
+
+    def handle(self, *args, **options):
+        concurrencia = max(1, options["concurrencia"])
+        if options["procesos"]:
+            # Los procesos hijos no deben heredar las conexiones abiertas
+            connections.close_all()
+            pool = ProcessPoolExecutor(concurrencia, initializer=_inicializar_proceso)
+        else:
+            pool = ThreadPoolExecutor(concurrencia)
+
+        self.stdout.write(
+            self.style.HTTP_INFO(
+                f"Worker iniciado ({concurrencia} "
+                f"{'procesos' if options['procesos'] else 'hilos'})"
+            )
+        )
+        en_curso = set()
+        resultados = {}
+        try:
+            while True:
+                libres = concurrencia - len(en_curso)
+                ids = reservar_tareas(libres, options["visibilidad"]) if libres else []
+                en_curso.update(pool.submit(_ejecutar, tarea_id) for tarea_id in ids)
+
+                if not en_curso:
+                    if options["una_vez"]:
+                        break
+                    time.sleep(options["intervalo"])
+                    continue
+
+                listas, en_curso = wait(
+                    en_curso, timeout=options["intervalo"], return_when=FIRST_COMPLETED
+                )
+                for futuro in listas:
+                    try:
+                        tarea_id, estado = futuro.result()
+                    except Exception as error:
+                        # La reserva vence y la tarea vuelve a la cola
+                        self.stderr.write(
+                            self.style.ERROR(f"Error del worker: {error}")
+                        )
+                        continue
+                    resultados[estado] = resultados.get(estado, 0) + 1
+                    self.stdout.write(f"Tarea {tarea_id}: {estado}")
+        except KeyboardInterrupt:
+            self.stdout.write(
+                self.style.WARNING("Deteniendo; esperando las tareas en curso...")
+            )
+        finally:
+            pool.shutdown(wait=True)
+
+        resumen = ", ".join(f"{n} {estado}" for estado, n in resultados.items())
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Worker finalizado ({resumen or 'sin tareas'})")
+        )
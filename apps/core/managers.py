@@ -4,6 +4,21 @@ from django.db import models
 class DepartamentoFilterManager(models.Manager):
     """Manager que filtra por departamento del usuario"""
 
+    def __init__(self, campo_departamento="departamento"):
+        super().__init__()
+        # Ruta hasta el departamento, p. ej. "asignatura__departamento"
+        self.campo_departamento = campo_departamento
+
+    def _es_multivaluado(self):
+        """Indica si la ruta al departamento atraviesa relaciones inversas o M2M"""
+        model = self.model
+        for nombre in self.campo_departamento.split("__"):
+            field = model._meta.get_field(nombre)
+            if field.one_to_many or field.many_to_many:
+                return True
+            model = field.related_model
+        return False
+
     def for_user(self, user):
         """Retorna queryset filtrado por departamentos del usuario"""
         if not user.is_authenticated:
@@ -15,6 +30,12 @@ class DepartamentoFilterManager(models.Manager):
 
         # Filtrar por departamentos asignados
         if hasattr(user, "profile"):
-            return self.filter(departamento__in=user.profile.departamentos.all())
+            filtro = {f"{self.campo_departamento}__in": user.profile.departamentos_ids}
+            if self._es_multivaluado():
+                # Subconsulta en lugar de JOIN para no duplicar filas
+                return self.filter(
+                    pk__in=self.model._base_manager.filter(**filtro).values("pk")
+                )
+            return self.filter(**filtro)
 
         return self.none()
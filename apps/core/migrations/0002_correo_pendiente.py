@@ -0,0 +1,63 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:15
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CorreoPendiente",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("asunto", models.CharField(max_length=255)),
+                ("mensaje", models.TextField()),
+                ("remitente", models.CharField(max_length=255)),
+                ("destinatario", models.EmailField(max_length=254)),
+                (
+                    "estado",
+                    models.CharField(
+                        choices=[
+                            ("pendiente", "Pendiente"),
+                            ("enviado", "Enviado"),
+                            ("fallido", "Fallido"),
+                        ],
+                        default="pendiente",
+                        max_length=20,
+                    ),
+                ),
+                ("intentos", models.PositiveIntegerField(default=0)),
+                (
+                    "proximo_intento",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("ultimo_error", models.TextField(blank=True)),
+                ("fecha_creacion", models.DateTimeField(auto_now_add=True)),
+                ("fecha_envio", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Correo pendiente",
+                "verbose_name_plural": "Correos pendientes",
+                "ordering": ["-fecha_creacion"],
+                "indexes": [
+                    models.Index(
+                        fields=["estado", "proximo_intento"],
+                        name="correo_estado_proximo_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:17
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_correo_pendiente"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tarea",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "funcion",
+                    models.CharField(
+                        help_text="Ruta importable de la función a ejecutar",
+                        max_length=255,
+                    ),
+                ),
+                ("argumentos", models.JSONField(blank=True, default=dict)),
+                (
+                    "estado",
+                    models.CharField(
+                        choices=[
+                            ("pendiente", "Pendiente"),
+                            ("en_curso", "En curso"),
+                            ("completada", "Completada"),
+                            ("fallida", "Fallida"),
+                        ],
+                        default="pendiente",
+                        max_length=20,
+                    ),
+                ),
+                ("intentos", models.PositiveIntegerField(default=0)),
+                ("max_intentos", models.PositiveIntegerField(default=3)),
+                (
+                    "disponible_desde",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Inicio del próximo intento o vencimiento de la reserva en curso",
+                    ),
+                ),
+                ("ultimo_error", models.TextField(blank=True)),
+                ("fecha_creacion", models.DateTimeField(auto_now_add=True)),
+                ("fecha_fin", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Tarea",
+                "verbose_name_plural": "Tareas",
+                "ordering": ["-fecha_creacion"],
+                "indexes": [
+                    models.Index(
+                        fields=["estado", "disponible_desde"],
+                        name="tarea_estado_disponible_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-18 02:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_tarea"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="correopendiente",
+            name="estado",
+            field=models.CharField(
+                choices=[
+                    ("pendiente", "Pendiente"),
+                    ("enviando", "Enviando"),
+                    ("enviado", "Enviado"),
+                    ("fallido", "Fallido"),
+                ],
+                default="pendiente",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -1,7 +1,16 @@
+import hashlib
+from datetime import date
+
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.db.models import Count, Max
 from django.shortcuts import redirect
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from .cache import alcance_usuario
 
 
 class DepartamentoAccessMixin(LoginRequiredMixin):
@@ -51,3 +60,80 @@ class SuperadminRequiredMixin(UserPassesTestMixin):
             self.request, "Solo los superadministradores pueden acceder a esta sección."
         )
         return redirect("home")
+
+
+class RespuestaCondicionalMixin:
+    """
+    Responde 304 Not Modified a GETs condicionales cuando la página no cambió.
+
+    La marca sale del máximo y la cantidad de cada campo de
+    `campos_modificacion` (rutas tipo "cargos__fecha_modificacion") sobre el
+    objeto del detalle o las filas de la página del listado.
+    """
+
+    campos_modificacion = ["fecha_modificacion"]
+
+    def get_filas_modificacion(self):
+        """Filas que muestra la página; la del listado se reutiliza al renderizar"""
+        pk = self.kwargs.get(getattr(self, "pk_url_kwarg", "pk"))
+        if pk is not None:
+            return [pk]
+        queryset = self.get_queryset()
+        self._paginacion = self.paginate_queryset(
+            queryset, self.get_paginate_by(queryset)
+        )
+        filas = self._paginacion[2] if self._paginacion else queryset
+        return [fila.pk for fila in filas]
+
+    def paginate_queryset(self, queryset, page_size):
+        if getattr(self, "_paginacion", None) is not None:
+            return self._paginacion
+        return super().paginate_queryset(queryset, page_size)
+
+    def get_marca_modificacion(self):
+        """Devuelve (última modificación, valores que identifican la versión)"""
+        filas = self.get_filas_modificacion()
+        agregados = {}
+        for indice, campo in enumerate(self.campos_modificacion):
+            relacion = campo.rpartition("__")[0] or "pk"
+            agregados[f"max_{indice}"] = Max(campo)
+            agregados[f"cuenta_{indice}"] = Count(relacion, distinct=True)
+        marca = self.model._default_manager.filter(pk__in=filas).aggregate(**agregados)
+
+        fechas = [
+            valor
+            for clave, valor in marca.items()
+            if clave.startswith("max_") and hasattr(valor, "timestamp")
+        ]
+        return (max(fechas) if fechas else None), (filas, sorted(marca.items()))
+
+    def get(self, request, *args, **kwargs):
+        # Con mensajes pendientes hay que renderizar para mostrarlos
+        if messages.get_messages(request):
+            return super().get(request, *args, **kwargs)
+
+        ultima_modificacion, version = self.get_marca_modificacion()
+        identidad = (
+            request.get_full_path(),
+            request.user.pk,
+            alcance_usuario(request.user),
+            request.COOKIES.get(settings.CSRF_COOKIE_NAME, ""),
+            date.today().isoformat(),
+            repr(version),
+        )
+        etag = quote_etag(hashlib.md5(repr(identidad).encode()).hexdigest())
+        last_modified = (
+            int(ultima_modificacion.timestamp()) if ultima_modificacion else None
+        )
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response.headers["ETag"] = etag
+        if last_modified is not None:
+            response.headers["Last-Modified"] = http_date(last_modified)
+        # Páginas por usuario: el navegador puede guardarlas pero debe revalidar
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
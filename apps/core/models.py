@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 
 class Bloque(models.Model):
@@ -60,3 +61,82 @@ class Carrera(models.Model):
 
     def __str__(self):
         return self.nombre
+
+
+class CorreoPendiente(models.Model):
+    """Correos encolados para envío en segundo plano (ver apps.core.correo)"""
+
+    ESTADO_CHOICES = [
+        ("pendiente", "Pendiente"),
+        ("enviando", "Enviando"),
+        ("enviado", "Enviado"),
+        ("fallido", "Fallido"),
+    ]
+
+    asunto = models.CharField(max_length=255)
+    mensaje = models.TextField()
+    remitente = models.CharField(max_length=255)
+    destinatario = models.EmailField()
+    estado = models.CharField(
+        max_length=20, choices=ESTADO_CHOICES, default="pendiente"
+    )
+    intentos = models.PositiveIntegerField(default=0)
+    proximo_intento = models.DateTimeField(default=timezone.now)
+    ultimo_error = models.TextField(blank=True)
+    fecha_creacion = models.DateTimeField(auto_now_add=True)
+    fecha_envio = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Correo pendiente"
+        verbose_name_plural = "Correos pendientes"
+        ordering = ["-fecha_creacion"]
+        indexes = [
+            models.Index(
+                fields=["estado", "proximo_intento"], name="correo_estado_proximo_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.destinatario} - {self.asunto}"
+
+
+class Tarea(models.Model):
+    """Tareas en segundo plano ejecutadas por manage.py run_worker"""
+
+    ESTADO_CHOICES = [
+        ("pendiente", "Pendiente"),
+        ("en_curso", "En curso"),
+        ("completada", "Completada"),
+        ("fallida", "Fallida"),
+    ]
+
+    funcion = models.CharField(
+        max_length=255, help_text="Ruta importable de la función a ejecutar"
+    )
+    argumentos = models.JSONField(default=dict, blank=True)
+    estado = models.CharField(
+        max_length=20, choices=ESTADO_CHOICES, default="pendiente"
+    )
+    intentos = models.PositiveIntegerField(default=0)
+    max_intentos = models.PositiveIntegerField(default=3)
+    disponible_desde = models.DateTimeField(
+        default=timezone.now,
+        help_text="Inicio del próximo intento o vencimiento de la reserva en curso",
+    )
+    ultimo_error = models.TextField(blank=True)
+    fecha_creacion = models.DateTimeField(auto_now_add=True)
+    fecha_fin = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Tarea"
+        verbose_name_plural = "Tareas"
+        ordering = ["-fecha_creacion"]
+        indexes = [
+            models.Index(
+                fields=["estado", "disponible_desde"],
+                name="tarea_estado_disponible_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.funcion} ({self.get_estado_display()})"
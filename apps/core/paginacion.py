@@ -0,0 +1,199 @@
+import base64
+import binascii
+import json
+from functools import cached_property
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+
+
+def _codificar_cursor(direccion, valores):
+    datos = json.dumps([direccion, valores], cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(datos.encode()).decode().rstrip("=")
+
+
+def _decodificar_cursor(cursor):
+    """Devuelve (dirección, valores) o None si el cursor es inválido"""
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        direccion, valores = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+    except (ValueError, TypeError, binascii.Error):
+        return None
+    if direccion not in ("despues", "antes") or not isinstance(valores, list):
+        return None
+    return direccion, valores
+
+
+def _campo_modelo(model, ruta):
+    """El campo del modelo al que apunta una ruta como docente__apellido"""
+    *relaciones, nombre = ruta.split("__")
+    for relacion in relaciones:
+        model = model._meta.get_field(relacion).related_model
+    if nombre == "pk":
+        return model._meta.pk
+    return model._meta.get_field(nombre)
+
+
+def _convertir_valores(model, campos, valores):
+    """Convierte los valores del cursor al tipo de cada campo, o None si no se puede"""
+    try:
+        return [
+            _campo_modelo(model, campo.lstrip("-")).to_python(valor)
+            for campo, valor in zip(campos, valores)
+        ]
+    except (ValidationError, ValueError, TypeError):
+        return None
+
+
+def _valor(obj, campo):
+    for nombre in campo.split("__"):
+        obj = getattr(obj, nombre)
+    return obj
+
+
+class PaginadorKeyset:
+    """Expone `count` y `per_page` como el Paginator de Django"""
+
+    def __init__(self, queryset, per_page, conteo_aproximado=False):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.conteo_aproximado = conteo_aproximado
+        self._aproximado = False
+
+    def _estimacion_pg_class(self):
+        queryset = self.queryset
+        if not self.conteo_aproximado or queryset.query.where:
+            return None
+        conexion = connections[queryset.db]
+        if conexion.vendor != "postgresql":
+            return None
+        with conexion.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            fila = cursor.fetchone()
+        # reltuples es -1 (o 0) si la tabla nunca fue analizada
+        if fila and fila[0] >= settings.PAGINACION_CONTEO_EXACTO_HASTA:
+            return fila[0]
+        return None
+
+    @cached_property
+    def count(self):
+        estimacion = self._estimacion_pg_class()
+        if estimacion is not None:
+            self._aproximado = True
+            return estimacion
+        return self.queryset.order_by().count()
+
+    @property
+    def es_aproximado(self):
+        """Indica si `count` es una estimación"""
+        return self.count is not None and self._aproximado
+
+
+class PaginaKeyset:
+    """Página de resultados con cursores hacia la anterior y la siguiente"""
+
+    def __init__(self, object_list, paginator, cursor_anterior, cursor_siguiente):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.cursor_anterior = cursor_anterior
+        self.cursor_siguiente = cursor_siguiente
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, indice):
+        return self.object_list[indice]
+
+    def has_next(self):
+        return self.cursor_siguiente is not None
+
+    def has_previous(self):
+        return self.cursor_anterior is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class PaginacionKeysetMixin:
+    """Reemplaza la paginación por OFFSET de un ListView por keyset"""
+
+    cursor_kwarg = "cursor"
+    conteo_aproximado = False
+
+    def _campos_orden(self, queryset):
+        # El orden del queryset (o Meta.ordering) con la pk como desempate;
+        # los campos de orden no deben admitir NULL
+        campos = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not all(isinstance(campo, str) for campo in campos):
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__} requiere un orden por nombres de campo."
+            )
+        if not any(campo.lstrip("-") in ("pk", "id") for campo in campos):
+            campos.append("-pk" if campos and campos[-1].startswith("-") else "pk")
+        return campos
+
+    @staticmethod
+    def _filtro_seek(campos, valores, hacia_atras):
+        """Condición lexicográfica "fila posterior a `valores`" según el orden"""
+        condicion = Q()
+        iguales = Q()
+        for campo, valor in zip(campos, valores):
+            nombre = campo.lstrip("-")
+            descendente = campo.startswith("-") != hacia_atras
+            condicion |= iguales & Q(
+                **{f"{nombre}__{'lt' if descendente else 'gt'}": valor}
+            )
+            iguales &= Q(**{nombre: valor})
+        return condicion
+
+    def paginate_queryset(self, queryset, page_size):
+        campos = self._campos_orden(queryset)
+        paginador = PaginadorKeyset(queryset, page_size, self.conteo_aproximado)
+
+        cursor = _decodificar_cursor(self.request.GET.get(self.cursor_kwarg) or "")
+        if cursor:
+            valores = None
+            if len(cursor[1]) == len(campos):
+                valores = _convertir_valores(queryset.model, campos, cursor[1])
+            cursor = (cursor[0], valores) if valores is not None else None
+        direccion = cursor[0] if cursor else "despues"
+        hacia_atras = direccion == "antes"
+
+        pagina = queryset
+        if cursor:
+            pagina = pagina.filter(self._filtro_seek(campos, cursor[1], hacia_atras))
+        if hacia_atras:
+            invertidos = [c[1:] if c.startswith("-") else f"-{c}" for c in campos]
+            pagina = pagina.order_by(*invertidos)
+        else:
+            pagina = pagina.order_by(*campos)
+
+        filas = list(pagina[: page_size + 1])
+        hay_mas = len(filas) > page_size
+        filas = filas[:page_size]
+        if hacia_atras:
+            filas.reverse()
+
+        def cursor_de(fila, sentido):
+            return _codificar_cursor(
+                sentido, [_valor(fila, c.lstrip("-")) for c in campos]
+            )
+
+        if hacia_atras:
+            anterior = cursor_de(filas[0], "antes") if hay_mas and filas else None
+            siguiente = cursor_de(filas[-1], "despues") if filas else None
+        else:
+            anterior = cursor_de(filas[0], "antes") if cursor and filas else None
+            siguiente = cursor_de(filas[-1], "despues") if hay_mas else None
+
+        page = PaginaKeyset(filas, paginador, anterior, siguiente)
+        return paginador, page, filas, page.has_other_pages()
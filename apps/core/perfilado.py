@@ -0,0 +1,230 @@
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import FileResponse
+
+from .consultas import MonitorConsultas, instalar_monitor
+
+logger = logging.getLogger(__name__)
+
+# Límites superiores (ms) de los intervalos del histograma; el último es abierto
+LIMITES_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+_pendientes = {}
+_lock = threading.Lock()
+_ultima_sincronizacion = 0.0
+
+
+class Medicion(MonitorConsultas):
+    """Costo de un request: las consultas más el tiempo total y de render"""
+
+    def __init__(self):
+        super().__init__()
+        self.inicio = time.perf_counter()
+        self.total_ms = 0.0
+        self.template_ms = 0.0
+
+    def registro(self, request, response, vista):
+        return {
+            "vista": vista,
+            "metodo": request.method,
+            "ruta": request.path,
+            "estado": response.status_code,
+            "ms": round(self.total_ms, 1),
+            "consultas": self.consultas,
+            "sql_ms": round(self.sql_ms, 1),
+            "template_ms": round(self.template_ms, 1),
+            "duplicadas": [
+                {"veces": veces, "sql": sql[:200]} for veces, sql in self.duplicadas()
+            ],
+        }
+
+
+def _intervalo(ms):
+    for indice, limite in enumerate(LIMITES_MS):
+        if ms <= limite:
+            return indice
+    return len(LIMITES_MS)
+
+
+def _nuevas_estadisticas():
+    return {
+        "requests": 0,
+        "ms": 0.0,
+        "max_ms": 0.0,
+        "consultas": 0,
+        "sql_ms": 0.0,
+        "template_ms": 0.0,
+        "histograma": [0] * (len(LIMITES_MS) + 1),
+    }
+
+
+def _acumular(destino, origen):
+    for campo in ("requests", "ms", "consultas", "sql_ms", "template_ms"):
+        destino[campo] += origen[campo]
+    destino["max_ms"] = max(destino["max_ms"], origen["max_ms"])
+    destino["histograma"] = [
+        a + b for a, b in zip(destino["histograma"], origen["histograma"])
+    ]
+
+
+def _clave_hora(hora):
+    return f"perfilado:{hora}"
+
+
+def registrar(vista, medicion):
+    """Suma la medición al histograma en memoria de la vista"""
+    global _ultima_sincronizacion
+    hora = int(time.time() // 3600)
+    with _lock:
+        estadisticas = _pendientes.setdefault((hora, vista), _nuevas_estadisticas())
+        estadisticas["requests"] += 1
+        estadisticas["ms"] += medicion.total_ms
+        estadisticas["max_ms"] = max(estadisticas["max_ms"], medicion.total_ms)
+        estadisticas["consultas"] += medicion.consultas
+        estadisticas["sql_ms"] += medicion.sql_ms
+        estadisticas["template_ms"] += medicion.template_ms
+        estadisticas["histograma"][_intervalo(medicion.total_ms)] += 1
+        vencida = (
+            time.monotonic() - _ultima_sincronizacion
+            >= settings.PERFILADO_SINCRONIZAR_SEGUNDOS
+        )
+    if vencida:
+        sincronizar()
+
+
+def sincronizar():
+    """Vuelca a la caché lo acumulado en memoria por este proceso"""
+    global _pendientes, _ultima_sincronizacion
+    with _lock:
+        pendientes, _pendientes = _pendientes, {}
+        _ultima_sincronizacion = time.monotonic()
+    if not pendientes:
+        return
+
+    por_hora = {}
+    for (hora, vista), estadisticas in pendientes.items():
+        por_hora.setdefault(hora, {})[vista] = estadisticas
+    timeout = (settings.PERFILADO_VENTANA_HORAS + 1) * 3600
+    for hora, vistas in por_hora.items():
+        guardadas = cache.get(_clave_hora(hora)) or {}
+        for vista, estadisticas in vistas.items():
+            _acumular(guardadas.setdefault(vista, _nuevas_estadisticas()), estadisticas)
+        cache.set(_clave_hora(hora), guardadas, timeout)
+
+
+def percentil(histograma, fraccion):
+    """Límite superior (ms) del intervalo que contiene el percentil, o None"""
+    objetivo = sum(histograma) * fraccion
+    acumulado = 0
+    for indice, cantidad in enumerate(histograma):
+        acumulado += cantidad
+        if cantidad and acumulado >= objetivo:
+            return LIMITES_MS[indice] if indice < len(LIMITES_MS) else None
+    return None
+
+
+def resumen_vistas(horas=None):
+    """Estadísticas por vista de las últimas `horas`, de mayor a menor tiempo total"""
+    sincronizar()
+    horas = horas or settings.PERFILADO_VENTANA_HORAS
+    actual = int(time.time() // 3600)
+    claves = [_clave_hora(hora) for hora in range(actual - horas + 1, actual + 1)]
+
+    vistas = {}
+    for guardadas in cache.get_many(claves).values():
+        for vista, estadisticas in guardadas.items():
+            _acumular(vistas.setdefault(vista, _nuevas_estadisticas()), estadisticas)
+
+    filas = []
+    for vista, e in vistas.items():
+        n = e["requests"]
+        filas.append(
+            {
+                "vista": vista,
+                "requests": n,
+                "total_s": e["ms"] / 1000,
+                "promedio_ms": e["ms"] / n,
+                "p50_ms": percentil(e["histograma"], 0.5),
+                "p95_ms": percentil(e["histograma"], 0.95),
+                "max_ms": e["max_ms"],
+                "consultas": e["consultas"] / n,
+                "sql_ms": e["sql_ms"] / n,
+                "template_ms": e["template_ms"] / n,
+                "histograma": e["histograma"],
+            }
+        )
+    return sorted(filas, key=lambda fila: fila["total_s"], reverse=True)
+
+
+class PerfiladoMiddleware:
+    """Mide cada request y lo registra en el log y en el histograma de su vista"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.PERFILADO_ACTIVO:
+            return self.get_response(request)
+
+        medicion = Medicion()
+        medicion.contexto = request.path
+        request._perfilado = medicion
+        with instalar_monitor(medicion):
+            response = self.get_response(request)
+
+        # El cuerpo (y sus consultas) se genera al enviarlo: se mide al final.
+        # Los archivos no se envuelven para no perder el wsgi.file_wrapper.
+        if (
+            response.streaming
+            and not response.is_async
+            and not isinstance(response, FileResponse)
+        ):
+            response.streaming_content = self._medir_contenido(
+                response.streaming_content, request, response, medicion
+            )
+        else:
+            self._finalizar(request, response, medicion)
+        return response
+
+    def _medir_contenido(self, contenido, request, response, medicion):
+        try:
+            with instalar_monitor(medicion):
+                yield from contenido
+        finally:
+            self._finalizar(request, response, medicion)
+
+    def _finalizar(self, request, response, medicion):
+        medicion.finalizar()
+        medicion.total_ms = (time.perf_counter() - medicion.inicio) * 1000
+
+        match = request.resolver_match
+        vista = match.view_name if match else "(sin ruta)"
+        if medicion.total_ms >= settings.PERFILADO_LOG_DESDE_MS:
+            logger.info(
+                json.dumps(
+                    medicion.registro(request, response, vista), ensure_ascii=False
+                )
+            )
+        registrar(vista, medicion)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        medicion = getattr(request, "_perfilado", None)
+        if medicion is not None:
+            medicion.contexto = request.resolver_match.view_name
+
+    def process_template_response(self, request, response):
+        # Es el último en llamarse, justo antes del render
+        medicion = getattr(request, "_perfilado", None)
+        if medicion is not None:
+            inicio = time.perf_counter()
+
+            def fin_render(response):
+                medicion.template_ms += (time.perf_counter() - inicio) * 1000
+
+            response.add_post_render_callback(fin_render)
+        return response
@@ -0,0 +1,21 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidar_modelo
+
+
+def _es_modelo_del_proyecto(sender):
+    # Excluye sesiones, auth y los modelos históricos de las migraciones
+    return sender.__module__.startswith("apps.")
+
+
+@receiver(post_save)
+def invalidar_cache_al_guardar(sender, raw=False, **kwargs):
+    if not raw and _es_modelo_del_proyecto(sender):
+        invalidar_modelo(sender)
+
+
+@receiver(post_delete)
+def invalidar_cache_al_eliminar(sender, **kwargs):
+    if _es_modelo_del_proyecto(sender):
+        invalidar_modelo(sender)
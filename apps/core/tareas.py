@@ -0,0 +1,107 @@
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .consultas import monitorear_consultas
+from .models import Tarea
+
+logger = logging.getLogger(__name__)
+
+
+def _ruta(funcion):
+    if isinstance(funcion, str):
+        return funcion
+    return f"{funcion.__module__}.{funcion.__qualname__}"
+
+
+def encolar_tarea(funcion, *args, max_intentos=None, demora=0, **kwargs):
+    """Encola la ejecución de una función importable con argumentos JSON"""
+    return Tarea.objects.create(
+        funcion=_ruta(funcion),
+        argumentos={"args": list(args), "kwargs": kwargs},
+        max_intentos=max_intentos or settings.TAREAS_MAX_INTENTOS,
+        disponible_desde=timezone.now() + timedelta(seconds=demora),
+    )
+
+
+def reservar_tareas(cantidad, visibilidad=None):
+    """Marca como en curso hasta ``cantidad`` tareas disponibles y devuelve sus IDs"""
+    visibilidad = visibilidad or settings.TAREAS_VISIBILIDAD_SEGUNDOS
+    ahora = timezone.now()
+
+    with transaction.atomic():
+        # Reservas vencidas que ya agotaron sus intentos
+        Tarea.objects.filter(
+            estado="en_curso",
+            disponible_desde__lte=ahora,
+            intentos__gte=F("max_intentos"),
+        ).update(
+            estado="fallida",
+            fecha_fin=ahora,
+            ultimo_error="Se agotó el tiempo de reserva",
+        )
+
+        ids = list(
+            Tarea.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(estado="pendiente") | Q(estado="en_curso"),
+                disponible_desde__lte=ahora,
+            )
+            .order_by("disponible_desde", "id")
+            .values_list("id", flat=True)[:cantidad]
+        )
+        Tarea.objects.filter(id__in=ids).update(
+            estado="en_curso",
+            intentos=F("intentos") + 1,
+            disponible_desde=ahora + timedelta(seconds=visibilidad),
+        )
+    return ids
+
+
+def ejecutar_tarea(tarea_id):
+    """Ejecuta una tarea reservada y registra su resultado"""
+    tarea = Tarea.objects.get(pk=tarea_id)
+    try:
+        funcion = import_string(tarea.funcion)
+        with monitorear_consultas(tarea.funcion):
+            funcion(
+                *tarea.argumentos.get("args", []), **tarea.argumentos.get("kwargs", {})
+            )
+    except Exception:
+        logger.warning("Falló la tarea %s (%s)", tarea.pk, tarea.funcion)
+        tarea.ultimo_error = traceback.format_exc()
+        if tarea.intentos >= tarea.max_intentos:
+            tarea.estado = "fallida"
+            tarea.fecha_fin = timezone.now()
+        else:
+            espera = settings.TAREAS_BACKOFF_SEGUNDOS * 2 ** (tarea.intentos - 1)
+            tarea.estado = "pendiente"
+            tarea.disponible_desde = timezone.now() + timedelta(seconds=espera)
+    else:
+        tarea.estado = "completada"
+        tarea.fecha_fin = timezone.now()
+        tarea.ultimo_error = ""
+
+    # Sólo si sigue con esta reserva: si venció y otro worker la tomó, no se pisa
+    actualizadas = Tarea.objects.filter(
+        pk=tarea.pk, estado="en_curso", intentos=tarea.intentos
+    ).update(
+        estado=tarea.estado,
+        disponible_desde=tarea.disponible_desde,
+        ultimo_error=tarea.ultimo_error,
+        fecha_fin=tarea.fecha_fin,
+    )
+    if not actualizadas:
+        logger.warning(
+            "La reserva de la tarea %s venció antes de terminar; "
+            "se descarta el resultado",
+            tarea.pk,
+        )
+        return "reserva_vencida"
+    return tarea.estado
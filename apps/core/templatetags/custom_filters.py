@@ -217,6 +217,9 @@ def url_replace(request, field, value):
 @register.inclusion_tag("components/pagination.html", takes_context=True)
 def pagination(context, page_obj, adjacent_pages=2):
     """Genera paginación completa"""
+    if hasattr(page_obj, "cursor_siguiente"):
+        # Paginación por keyset (apps.core.paginacion): sólo anterior/siguiente
+        return {"page_obj": page_obj, "keyset": True, "request": context.get("request")}
     start_page = max(page_obj.number - adjacent_pages, 1)
     end_page = min(page_obj.number + adjacent_pages, page_obj.paginator.num_pages)
     page_numbers = range(start_page, end_page + 1)
@@ -0,0 +1,41 @@
+from django import template
+from django.apps import apps
+
+from apps.core.cache import alcance_usuario, fragmento_cacheado
+
+register = template.Library()
+
+
+class FragmentoNode(template.Node):
+    def __init__(self, nodelist, nombre, modelos):
+        self.nodelist = nodelist
+        self.nombre = nombre
+        self.modelos = modelos
+
+    def render(self, context):
+        modelos = [apps.get_model(modelo.resolve(context)) for modelo in self.modelos]
+        request = context.get("request")
+        alcance = alcance_usuario(request.user) if request else "todos"
+        return fragmento_cacheado(
+            self.nombre.resolve(context),
+            modelos,
+            lambda: self.nodelist.render(context),
+            alcance=alcance,
+        )
+
+
+@register.tag
+def fragmento(parser, token):
+    """{% fragmento "nombre" "app.Modelo" ... %} ... {% endfragmento %}"""
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' requiere el nombre del fragmento y al menos un modelo"
+        )
+    nodelist = parser.parse(("endfragmento",))
+    parser.delete_first_token()
+    return FragmentoNode(
+        nodelist,
+        parser.compile_filter(bits[1]),
+        [parser.compile_filter(bit) for bit in bits[2:]],
+    )
@@ -0,0 +1,46 @@
+from datetime import date
+
+import pytest
+
+from apps.core.busqueda import filtrar_busqueda, normalizar
+from apps.planta_docente.models import Docente
+
+
+def test_normalizar_quita_acentos_y_mayusculas():
+    assert normalizar("José NÚÑEZ Güemes") == "jose nunez guemes"
+    assert normalizar(None) == ""
+
+
+@pytest.mark.django_db
+def test_busqueda_insensible_a_acentos_y_por_palabras():
+    nunez = Docente.objects.create(
+        apellido="Núñez",
+        nombre="José María",
+        documento="20111222",
+        legajo="L-77",
+        fecha_nacimiento=date(1975, 5, 5),
+    )
+    Docente.objects.create(
+        apellido="Perez",
+        nombre="Jose",
+        documento="20333444",
+        fecha_nacimiento=date(1980, 1, 1),
+    )
+
+    assert list(filtrar_busqueda(Docente.objects.all(), "nunez")) == [nunez]
+    assert list(filtrar_busqueda(Docente.objects.all(), "JOSÉ núñez")) == [nunez]
+    assert filtrar_busqueda(Docente.objects.all(), "jose").count() == 2
+    assert list(filtrar_busqueda(Docente.objects.all(), "l-77")) == [nunez]
+
+
+@pytest.mark.django_db
+def test_busqueda_se_actualiza_con_update_fields():
+    docente = Docente.objects.create(
+        apellido="Gomez", nombre="Ana", documento="1", fecha_nacimiento=date(1990, 1, 1)
+    )
+
+    docente.apellido = "Gómez Ruiz"
+    docente.save(update_fields=["apellido"])
+
+    docente.refresh_from_db()
+    assert docente.busqueda == "gomez ruiz ana 1"
@@ -0,0 +1,29 @@
+import pytest
+
+from apps.core.cache import estadisticas_cacheadas, versiones_modelos
+from apps.core.models import Departamento
+
+
+@pytest.mark.django_db
+def test_escrituras_incrementan_la_version_del_modelo():
+    (version,) = versiones_modelos(Departamento)
+
+    Departamento.objects.create(nombre="Civil")
+
+    assert versiones_modelos(Departamento) != [version]
+
+
+@pytest.mark.django_db
+def test_estadisticas_se_recalculan_solo_tras_escrituras():
+    def calcular():
+        return {"total": Departamento.objects.count()}
+
+    assert estadisticas_cacheadas("prueba", [Departamento], calcular) == {"total": 0}
+
+    departamento = Departamento.objects.create(nombre="Civil")
+    assert estadisticas_cacheadas("prueba", [Departamento], calcular) == {"total": 1}
+
+    Departamento.objects.filter(pk=departamento.pk).update(nombre="Mecánica")
+    llamadas = []
+    estadisticas_cacheadas("prueba", [Departamento], lambda: llamadas.append(1))
+    assert llamadas == []
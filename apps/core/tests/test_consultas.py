@@ -0,0 +1,71 @@
+import json
+from datetime import date
+
+import pytest
+from django.template import Context, Template
+from django.template.base import Origin
+
+from apps.core.consultas import forma_sql, monitorear_consultas
+from apps.planta_docente.models import Docente
+
+
+def _avisos(caplog):
+    return [
+        json.loads(registro.getMessage())
+        for registro in caplog.records
+        if registro.name == "apps.core.consultas"
+    ]
+
+
+def test_forma_sql_colapsa_listas_in():
+    assert forma_sql('SELECT 1 FROM "t" WHERE "id" IN (%s, %s, %s)') == forma_sql(
+        'SELECT 1 FROM "t" WHERE "id" IN (%s)'
+    )
+
+
+@pytest.mark.django_db
+def test_avisa_consultas_repetidas_con_su_template(settings, caplog):
+    settings.CONSULTAS_REPETIDAS_MAX = 2
+    for documento in "1234":
+        Docente.objects.create(
+            apellido="Pérez",
+            nombre="Ana",
+            documento=documento,
+            fecha_nacimiento=date(1980, 1, 1),
+        )
+    plantilla = Template(
+        "{% for docente in docentes %}\n{{ docente.cargos_activos_count }}{% endfor %}",
+        origin=Origin(name="prueba.html", template_name="prueba.html"),
+    )
+
+    with monitorear_consultas("prueba") as monitor:
+        plantilla.render(Context({"docentes": Docente.objects.all()}))
+
+    assert monitor.consultas == 5
+    (aviso,) = _avisos(caplog)
+    assert aviso["tipo"] == "repetida"
+    assert aviso["contexto"] == "prueba"
+    assert aviso["veces"] == 4
+    assert aviso["template"] == "prueba.html:2"
+    assert aviso["origen"].startswith("apps/planta_docente/models.py:")
+
+
+@pytest.mark.django_db
+def test_avisa_consultas_lentas(settings, caplog):
+    settings.CONSULTAS_LENTAS_MS = 0.000001
+    with monitorear_consultas("prueba"):
+        Docente.objects.count()
+
+    (aviso,) = _avisos(caplog)
+    assert aviso["tipo"] == "lenta"
+    assert aviso["origen"].startswith("apps/core/tests/test_consultas.py:")
+    assert aviso["template"] is None
+
+
+@pytest.mark.django_db
+def test_sin_avisos_por_debajo_de_los_umbrales(caplog):
+    with monitorear_consultas("prueba"):
+        for _ in range(3):
+            Docente.objects.count()
+
+    assert _avisos(caplog) == []
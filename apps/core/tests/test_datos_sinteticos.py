@@ -0,0 +1,113 @@
+import io
+from datetime import date
+
+import pytest
+from django.core.management import call_command
+
+from apps.carrera_academica.models import CarreraAcademica
+from apps.core.models import Departamento
+from apps.core.datos_sinteticos import generar_datos
+from apps.equivalencias.models import SolicitudEquivalencia
+from apps.planta_docente.models import Cargo, Docente, ResumenPlanta
+
+CHICO = {
+    "departamentos": 2,
+    "carreras": 2,
+    "asignaturas": 10,
+    "docentes": 30,
+    "resoluciones": 5,
+    "cargos": 60,
+    "estudiantes": 20,
+    "solicitudes": 15,
+    "practicas": 5,
+    "carreras_academicas": 8,
+}
+
+
+def _huella(desde=0):
+    return (
+        list(
+            Docente.objects.filter(pk__gt=desde)
+            .order_by("pk")
+            .values_list("apellido", "nombre")
+        ),
+        list(
+            Cargo.objects.filter(docente__pk__gt=desde)
+            .order_by("pk")
+            .values_list("caracter", "dedicacion", "estado", "fecha_vencimiento")
+        ),
+    )
+
+
+@pytest.mark.django_db
+def test_mismos_datos_con_la_misma_semilla():
+    fecha = date(2025, 6, 1)
+    creados = generar_datos(CHICO, semilla=7, fecha_base=fecha, lote=7)
+    huella = _huella()
+    assert creados["docentes"] == 30
+    assert creados["cargos"] == 60
+    assert creados["carreras académicas"] == CarreraAcademica.objects.count() <= 8
+
+    # Una segunda corrida continúa la numeración de los campos únicos
+    ultimo = Docente.objects.order_by("pk").last().pk
+    generar_datos(CHICO, semilla=7, fecha_base=fecha)
+    assert Docente.objects.count() == 60
+    assert _huella(ultimo) == huella
+
+
+@pytest.mark.django_db
+def test_numera_despues_del_mayor_valor_existente():
+    # Una sola fila de cada modelo, con números salteados
+    Departamento.objects.create(nombre="Departamento 3", codigo="DEP3")
+    Docente.objects.create(
+        apellido="Pérez",
+        nombre="Ana",
+        documento="20000009",
+        legajo="LEG000005",
+        fecha_nacimiento=date(1980, 1, 1),
+    )
+
+    creados = generar_datos(CHICO, semilla=4)
+    assert creados["docentes"] == 30
+    assert Departamento.objects.filter(codigo__in=["DEP4", "DEP5"]).count() == 2
+    assert Docente.objects.filter(legajo="LEG000010", documento="20000010").exists()
+
+
+@pytest.mark.django_db
+def test_mantiene_los_contadores_denormalizados():
+    generar_datos(CHICO, semilla=1)
+
+    activos = Cargo.objects.filter(estado="activo").count()
+    assert (
+        sum(ResumenPlanta.objects.values_list("cantidad_cargos", flat=True)) == activos
+    )
+    solicitud = SolicitudEquivalencia.objects.order_by("pk").first()
+    assert solicitud.total_asignaturas == solicitud.detallesolicitud_set.count()
+    assert Docente.objects.filter(busqueda="").count() == 0
+
+
+@pytest.mark.django_db
+def test_comando():
+    salida = io.StringIO()
+    call_command(
+        "generar_datos_sinteticos",
+        *[f"--{entidad.replace('_', '-')}={n}" for entidad, n in CHICO.items()],
+        "--semilla=3",
+        stdout=salida,
+    )
+    assert "✓ Datos generados" in salida.getvalue()
+    assert Docente.objects.count() == 30
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "ceros, omitidos",
+    [
+        ({"departamentos": 0}, ["carreras", "asignaturas", "estudiantes", "cargos"]),
+        ({"docentes": 0, "asignaturas": 5}, ["cargos", "prácticas supervisadas"]),
+        ({"carreras": 0}, ["asignaturas", "estudiantes", "solicitudes"]),
+    ],
+)
+def test_cantidades_en_cero_omiten_las_entidades_dependientes(ceros, omitidos):
+    creados = generar_datos({**CHICO, **ceros}, semilla=2)
+    assert all(creados[entidad] == 0 for entidad in omitidos)
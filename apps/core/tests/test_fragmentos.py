@@ -0,0 +1,44 @@
+import pytest
+from django.template import Context, Template, TemplateSyntaxError
+from django.urls import reverse
+
+from apps.core.models import Departamento
+
+PLANTILLA = Template(
+    '{% load fragmentos %}{% fragmento "prueba" "core.Departamento" %}'
+    "{{ departamentos.count }}{% endfragmento %}"
+)
+
+
+@pytest.mark.django_db
+def test_fragmento_se_invalida_al_modificar_el_modelo():
+    contexto = Context({"departamentos": Departamento.objects.all()})
+    assert PLANTILLA.render(contexto) == "0"
+
+    Departamento.objects.create(nombre="Civil")
+    assert PLANTILLA.render(contexto) == "1"
+
+    # Sin escrituras mediante el ORM se sirve la versión cacheada
+    Departamento.objects.bulk_create([Departamento(nombre="Mecánica")])
+    assert PLANTILLA.render(contexto) == "1"
+
+
+def test_fragmento_sin_modelos_no_se_acepta():
+    with pytest.raises(TemplateSyntaxError):
+        Template('{% load fragmentos %}{% fragmento "estatico" %}x{% endfragmento %}')
+
+
+@pytest.mark.django_db
+def test_reporte_planta_no_consulta_cargos_desde_la_cache(
+    client, admin_user, crear_cargo, django_assert_max_num_queries
+):
+    crear_cargo()
+    client.force_login(admin_user)
+    url = reverse("planta_docente:reporte_planta")
+    client.get(url)
+
+    # Sesión, usuario y perfil: totales y tabla salen de la caché
+    with django_assert_max_num_queries(3):
+        respuesta = client.get(url)
+
+    assert "Apellido1" in respuesta.content.decode()
@@ -0,0 +1,50 @@
+import pytest
+from django.urls import reverse
+
+from apps.core.paginacion import _codificar_cursor
+
+
+@pytest.mark.django_db
+def test_listado_recorre_paginas_con_cursores(
+    cliente, crear_cargo, django_assert_max_num_queries
+):
+    docentes = [crear_cargo().docente for _ in range(45)]
+    url = reverse("planta_docente:docente_list")
+
+    vistos = []
+    respuesta = cliente.get(url)
+    while True:
+        pagina = respuesta.context["page_obj"]
+        vistos.extend(pagina)
+        if not pagina.has_next():
+            break
+        with django_assert_max_num_queries(8) as consultas:
+            respuesta = cliente.get(url, {"cursor": pagina.cursor_siguiente})
+        assert not any("OFFSET" in q["sql"] for q in consultas.captured_queries)
+
+    esperados = sorted(docentes, key=lambda d: (d.apellido, d.nombre, d.pk))
+    assert [d.pk for d in vistos] == [d.pk for d in esperados]
+    assert respuesta.context["page_obj"].paginator.count == 45
+
+    anterior = cliente.get(url, {"cursor": pagina.cursor_anterior})
+    assert list(anterior.context["page_obj"]) == vistos[20:40]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "xx",
+        _codificar_cursor("despues", ["no-es-fecha", 1]),
+        _codificar_cursor("despues", ["2024-01-01", "x"]),
+        _codificar_cursor("antes", [["2024-01-01"], {"a": 1}]),
+    ],
+)
+def test_cursor_invalido_muestra_la_primera_pagina(cliente, crear_cargo, cursor):
+    for _ in range(3):
+        crear_cargo()
+    respuesta = cliente.get(reverse("planta_docente:cargo_list"), {"cursor": cursor})
+    assert respuesta.status_code == 200
+    pagina = respuesta.context["page_obj"]
+    assert len(pagina) == 3
+    assert not pagina.has_previous()
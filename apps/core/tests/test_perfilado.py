@@ -0,0 +1,113 @@
+import json
+import logging
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+
+from apps.core import perfilado
+from apps.usuarios.models import UserProfile
+
+
+@pytest.fixture(autouse=True)
+def perfilado_vacio(settings):
+    """Perfila y loguea todos los requests, sin lo acumulado por otros tests"""
+    settings.PERFILADO_ACTIVO = True
+    settings.PERFILADO_LOG_DESDE_MS = 0
+    perfilado.sincronizar()
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_loguea_costo_del_request(client, admin_user, crear_cargo, caplog):
+    crear_cargo()
+    client.force_login(admin_user)
+
+    with caplog.at_level(logging.INFO, logger="apps.core.perfilado"):
+        client.get(reverse("planta_docente:cargo_list"))
+
+    registro = json.loads(caplog.records[-1].getMessage())
+    assert registro["vista"] == "planta_docente:cargo_list"
+    assert registro["estado"] == 200
+    assert registro["consultas"] >= 3
+    assert registro["template_ms"] > 0
+    assert registro["ms"] >= registro["sql_ms"]
+
+
+@pytest.mark.django_db
+def test_detecta_consultas_duplicadas():
+    medicion = perfilado.Medicion()
+    with connection.execute_wrapper(medicion):
+        for _ in range(3):
+            User.objects.filter(pk=1).exists()
+        User.objects.count()
+
+    assert medicion.consultas == 4
+    assert [veces for veces, _ in medicion.duplicadas()] == [3]
+
+
+@pytest.mark.django_db
+def test_histograma_por_vista(client, admin_user, settings):
+    settings.PERFILADO_SINCRONIZAR_SEGUNDOS = 3600
+    client.force_login(admin_user)
+    for _ in range(3):
+        client.get(reverse("home"))
+
+    fila = next(f for f in perfilado.resumen_vistas() if f["vista"] == "home")
+    assert fila["requests"] == 3
+    assert sum(fila["histograma"]) == 3
+    assert fila["p95_ms"] in perfilado.LIMITES_MS or fila["p95_ms"] is None
+
+
+@pytest.mark.django_db
+def test_desactivado_no_mide(client, admin_user, settings, caplog):
+    settings.PERFILADO_ACTIVO = False
+    client.force_login(admin_user)
+
+    with caplog.at_level(logging.INFO, logger="apps.core.perfilado"):
+        client.get(reverse("home"))
+
+    assert not caplog.records
+    assert perfilado.resumen_vistas() == []
+
+
+def test_percentil():
+    histograma = [0, 90, 0, 5, 0, 0, 0, 5]
+    assert perfilado.percentil(histograma, 0.5) == 100
+    assert perfilado.percentil(histograma, 0.95) == 500
+    assert perfilado.percentil(histograma, 0.99) is None
+
+
+@pytest.mark.django_db
+def test_reporte_solo_para_superadmins(client, admin_user):
+    usuario = User.objects.create_user("comun", password="x")
+    client.force_login(usuario)
+    assert client.get(reverse("perfilado")).status_code == 302
+
+    UserProfile.objects.create(user=admin_user, es_superadmin=True)
+    client.force_login(admin_user)
+    client.get(reverse("home"))
+    respuesta = client.get(reverse("perfilado"))
+    assert respuesta.status_code == 200
+    assert any(fila["vista"] == "home" for fila in respuesta.context["vistas"])
+
+
+@pytest.mark.django_db
+def test_mide_el_cuerpo_de_las_respuestas_en_streaming(
+    client, admin_user, crear_cargo, caplog
+):
+    crear_cargo()
+    client.force_login(admin_user)
+
+    with caplog.at_level(logging.INFO, logger="apps.core.perfilado"):
+        respuesta = client.get(reverse("planta_docente:reporte_planta_exportar"))
+        assert not caplog.records
+        b"".join(respuesta.streaming_content)
+
+    registro = json.loads(caplog.records[-1].getMessage())
+    assert registro["vista"] == "planta_docente:reporte_planta_exportar"
+    # Sesión, usuario y el SELECT de los cargos, que corre al generar el CSV
+    assert registro["consultas"] == 3
+    assert registro["ms"] >= registro["sql_ms"] > 0
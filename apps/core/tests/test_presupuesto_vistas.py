@@ -0,0 +1,177 @@
+import os
+import re
+import time
+from collections import Counter
+from importlib import import_module
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.carrera_academica.models import CarreraAcademica, Evaluacion
+from apps.core.datos_sinteticos import generar_datos
+from apps.equivalencias.models import Estudiante, SolicitudEquivalencia
+from apps.planta_docente.models import Asignatura, Cargo, Docente
+from apps.practica_supervisada.models import PSolicitud
+from apps.usuarios.models import UserProfile
+
+# Multiplica los tiempos máximos, p. ej. en máquinas de CI lentas
+FACTOR_TIEMPO = float(os.environ.get("PRESUPUESTO_FACTOR_TIEMPO", "1"))
+
+# Nombre de la URL: (objeto de sus argumentos, consultas máximas, segundos máximos).
+# Los formularios con selects de todos los docentes y el reporte de planta
+# completa renderizan miles de filas y tienen más tiempo.
+PRESUPUESTOS = {
+    "planta_docente:dashboard": (None, 5, 1),
+    "planta_docente:docente_list": (None, 6, 1),
+    "planta_docente:docente_create": (None, 3, 1),
+    "planta_docente:docente_detail": ("docente", 8, 1),
+    "planta_docente:docente_update": ("docente", 4, 1),
+    "planta_docente:docente_delete": ("docente", 6, 1),
+    "planta_docente:asignatura_list": (None, 5, 1),
+    "planta_docente:asignatura_create": (None, 7, 1),
+    "planta_docente:asignatura_detail": ("asignatura", 10, 1),
+    "planta_docente:asignatura_update": ("asignatura", 10, 1),
+    "planta_docente:cargo_list": (None, 5, 1),
+    "planta_docente:cargo_create": (None, 6, 3),
+    "planta_docente:cargo_detail": ("cargo", 13, 1),
+    "planta_docente:cargo_update": ("cargo", 7, 3),
+    "planta_docente:cargo_baja": ("cargo", 6, 1),
+    "planta_docente:resolucion_list": (None, 5, 1),
+    "planta_docente:resolucion_create": (None, 3, 1),
+    "planta_docente:reporte_planta": (None, 6, 4),
+    "planta_docente:reporte_planta_exportar": (None, 3, 1),
+    "planta_docente:reporte_vencimientos": (None, 4, 1),
+    "equivalencias:dashboard": (None, 6, 1),
+    "equivalencias:estudiante_list": (None, 5, 1),
+    "equivalencias:estudiante_create": (None, 4, 1),
+    "equivalencias:estudiante_detail": ("estudiante", 5, 1),
+    "equivalencias:estudiante_update": ("estudiante", 5, 1),
+    "equivalencias:solicitud_list": (None, 6, 1),
+    "equivalencias:solicitud_create": (None, 4, 2),
+    "equivalencias:solicitud_detail": ("solicitud", 11, 1),
+    "equivalencias:solicitud_update": ("solicitud", 5, 2),
+    "equivalencias:solicitud_completar": ("solicitud", 5, 1),
+    "practica_supervisada:dashboard": (None, 5, 1),
+    "practica_supervisada:solicitud_list": (None, 5, 1),
+    "practica_supervisada:solicitud_create": (None, 6, 3),
+    "practica_supervisada:solicitud_detail": ("ps", 11, 1),
+    "practica_supervisada:solicitud_update": ("ps", 8, 3),
+    "practica_supervisada:dictaminar_plan": ("ps", 7, 1),
+    "practica_supervisada:dictaminar_informe": ("ps", 7, 1),
+    "carrera_academica:dashboard": (None, 6, 1),
+    "carrera_academica:carrera_list": (None, 6, 1),
+    "carrera_academica:carrera_create": (None, 2, 1),
+    "carrera_academica:carrera_detail": ("carrera", 15, 1),
+    "carrera_academica:carrera_update": ("carrera", 3, 1),
+    "carrera_academica:evaluacion_create": ("carrera", 7, 1),
+    "carrera_academica:evaluacion_detail": ("evaluacion", 5, 1),
+    "carrera_academica:formulario_upload": ("evaluacion", 7, 1),
+    "carrera_academica:reporte_vencimientos": (None, 2, 1),
+}
+
+# Problemas conocidos: la prueba falla hasta que se corrijan (xfail estricto)
+FALLAS_CONOCIDAS = {
+    "equivalencias:solicitud_completar": (
+        "no existe el template equivalencias/solicitud_completar.html"
+    ),
+}
+
+
+def _con_mas(model, relacion):
+    return (
+        model.objects.annotate(cantidad=Count(relacion))
+        .order_by("-cantidad", "pk")
+        .values_list("pk", flat=True)
+        .first()
+    )
+
+
+@pytest.fixture(scope="module")
+def datos(django_db_setup, django_db_blocker):
+    """Datos compartidos por el módulo, descartados al final con un rollback"""
+    with django_db_blocker.unblock():
+        atomico = transaction.atomic()
+        atomico.__enter__()
+        try:
+            generar_datos(semilla=0)
+            usuario = User.objects.create_user("presupuesto", password="x")
+            UserProfile.objects.create(user=usuario, es_superadmin=True)
+            # Los objetos con más filas relacionadas, donde un N+1 pesa más
+            objetos = {
+                "docente": _con_mas(Docente, "cargos"),
+                "asignatura": _con_mas(Asignatura, "cargo"),
+                "cargo": Cargo.objects.order_by("pk").first().pk,
+                "estudiante": _con_mas(Estudiante, "solicitudequivalencia"),
+                "solicitud": _con_mas(SolicitudEquivalencia, "detallesolicitud"),
+                "ps": _con_mas(PSolicitud, "jurados"),
+                "carrera": _con_mas(CarreraAcademica, "formulario"),
+                "evaluacion": _con_mas(Evaluacion, "formulario"),
+            }
+            yield usuario, objetos
+        finally:
+            transaction.set_rollback(True)
+            atomico.__exit__(None, None, None)
+
+
+def _parametros():
+    for nombre in PRESUPUESTOS:
+        marcas = []
+        if nombre in FALLAS_CONOCIDAS:
+            marcas.append(
+                pytest.mark.xfail(reason=FALLAS_CONOCIDAS[nombre], strict=True)
+            )
+        yield pytest.param(nombre, marks=marcas, id=nombre)
+
+
+def _resumen_consultas(consultas):
+    """Las consultas más repetidas, para el mensaje de error"""
+    repetidas = Counter(
+        re.sub(r"\b\d+\b", "?", q["sql"]) for q in consultas.captured_queries
+    )
+    return "\n".join(
+        f"  {cantidad}x {sql[:300]}" for sql, cantidad in repetidas.most_common(5)
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("nombre", _parametros())
+def test_presupuesto_de_la_vista(client, datos, nombre):
+    usuario, objetos = datos
+    objeto, max_consultas, max_segundos = PRESUPUESTOS[nombre]
+    client.force_login(usuario)
+    url = reverse(nombre, args=[objetos[objeto]] if objeto else [])
+
+    with CaptureQueriesContext(connection) as consultas:
+        inicio = time.perf_counter()
+        respuesta = client.get(url)
+        if respuesta.streaming:
+            b"".join(respuesta.streaming_content)
+        duracion = time.perf_counter() - inicio
+
+    assert respuesta.status_code == 200
+    assert len(consultas) <= max_consultas, (
+        f"{url}: {len(consultas)} consultas (máximo {max_consultas})\n"
+        + _resumen_consultas(consultas)
+    )
+    assert (
+        duracion <= max_segundos * FACTOR_TIEMPO
+    ), f"{url}: {duracion:.2f}s (máximo {max_segundos * FACTOR_TIEMPO:.2f}s)"
+
+
+@pytest.mark.parametrize(
+    "modulo",
+    [
+        "apps.planta_docente.urls",
+        "apps.equivalencias.urls",
+        "apps.practica_supervisada.urls",
+        "apps.carrera_academica.urls",
+    ],
+)
+def test_todas_las_urls_tienen_presupuesto(modulo):
+    urls = import_module(modulo)
+    nombres = {f"{urls.app_name}:{patron.name}" for patron in urls.urlpatterns}
+    assert nombres - set(PRESUPUESTOS) == set()
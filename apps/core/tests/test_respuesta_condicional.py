@@ -0,0 +1,85 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.planta_docente.models import Cargo
+
+
+@pytest.mark.django_db
+def test_detalle_responde_304_hasta_que_cambia_un_cargo(
+    cliente, crear_cargo, django_assert_max_num_queries
+):
+    cargo = crear_cargo()
+    url = reverse("planta_docente:docente_detail", args=[cargo.docente_id])
+
+    respuesta = cliente.get(url)
+    assert respuesta.status_code == 200
+    etag = respuesta.headers["ETag"]
+    assert "Last-Modified" in respuesta.headers
+
+    # Sesión, usuario, perfil y la consulta de la marca de modificación
+    with django_assert_max_num_queries(4):
+        respuesta = cliente.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert respuesta.status_code == 304
+
+    Cargo.objects.get(pk=cargo.pk).save()
+    respuesta = cliente.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert respuesta.status_code == 200
+    assert respuesta.headers["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_listado_cambia_de_etag_al_eliminar_filas(cliente, crear_cargo):
+    crear_cargo()
+    segundo = crear_cargo()
+    url = reverse("planta_docente:docente_list") + "?search=apellido"
+
+    etag = cliente.get(url).headers["ETag"]
+    assert cliente.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    segundo.docente.delete()
+    assert cliente.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_listado_solo_agrega_sobre_las_filas_de_la_pagina(cliente, crear_cargo):
+    cargos = [crear_cargo() for _ in range(21)]
+    url = reverse("planta_docente:docente_list")
+    etag = cliente.get(url).headers["ETag"]
+
+    # La página muestra 20 docentes: el último (por apellido) queda afuera
+    fuera_de_pagina = max(cargos, key=lambda cargo: cargo.docente.apellido)
+    Cargo.objects.get(pk=fuera_de_pagina.pk).save()
+    with CaptureQueriesContext(connection) as consultas:
+        assert cliente.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    # La página y la marca de sus filas, sin el render del listado
+    assert len(consultas) <= 5
+
+
+@pytest.mark.django_db
+def test_otro_proceso_no_responde_304_despues_de_una_escritura(cliente, crear_cargo):
+    cargo = crear_cargo()
+    url = reverse("planta_docente:docente_detail", args=[cargo.docente_id])
+    etag = cliente.get(url).headers["ETag"]
+
+    # update() no pasa por los contadores de la caché, como la escritura de otro
+    # proceso con locmem: la marca sale de la base de datos
+    Cargo.objects.filter(pk=cargo.pk).update(
+        dedicacion="exclusiva", fecha_modificacion=timezone.now()
+    )
+    assert cliente.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_progreso_de_solicitud_actualiza_su_fecha_de_modificacion(crear_solicitud):
+    solicitud = crear_solicitud("pendiente")
+    anterior = solicitud.fecha_modificacion
+
+    detalle = solicitud.detallesolicitud_set.get()
+    detalle.estado_asignatura = "aprobada"
+    detalle.save()
+
+    solicitud.refresh_from_db()
+    assert solicitud.fecha_modificacion > anterior
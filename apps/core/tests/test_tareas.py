@@ -0,0 +1,141 @@
+import pytest
+from concurrent.futures import Future
+from datetime import timedelta
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.core import tareas
+from apps.core.management.commands import run_worker
+from apps.core.models import Departamento, Tarea
+from apps.core.tareas import ejecutar_tarea, encolar_tarea, reservar_tareas
+
+
+def crear_departamento(nombre):
+    Departamento.objects.create(nombre=nombre)
+
+
+def fallar():
+    raise RuntimeError("falla de prueba")
+
+
+def vencer_reserva(tarea_id):
+    """Simula una tarea más larga que la reserva, retomada por otro worker"""
+    Tarea.objects.filter(pk=tarea_id).update(disponible_desde=timezone.now())
+    assert reservar_tareas(10) == [tarea_id]
+
+
+class PoolSincronico:
+    """Pool que ejecuta cada tarea al enviarla y registra cómo se lo creó"""
+
+    creados = []
+
+    def __init__(self, max_workers, initializer=None):
+        self.max_workers = max_workers
+        self.initializer = initializer
+        self.enviadas = []
+        self.creados.append(self)
+
+    def submit(self, funcion, *args):
+        self.enviadas.append(args)
+        futuro = Future()
+        futuro.set_result(funcion(*args))
+        return futuro
+
+    def shutdown(self, wait=True):
+        pass
+
+
+@pytest.fixture
+def pool_sincronico(monkeypatch):
+    PoolSincronico.creados = []
+    monkeypatch.setattr(run_worker, "ThreadPoolExecutor", PoolSincronico)
+    monkeypatch.setattr(run_worker, "ProcessPoolExecutor", PoolSincronico)
+    cantidades = []
+
+    def reservar(cantidad, visibilidad=None):
+        cantidades.append(cantidad)
+        return reservar_tareas(cantidad, visibilidad)
+
+    monkeypatch.setattr(run_worker, "reservar_tareas", reservar)
+    return cantidades
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_worker_ejecuta_las_tareas_encoladas():
+    for nombre in ["Civil", "Mecánica", "Eléctrica"]:
+        encolar_tarea(crear_departamento, nombre)
+
+    # Un solo hilo: SQLite en memoria bloquea tablas ante escrituras concurrentes
+    call_command("run_worker", "--una-vez", "--concurrencia=1", "--intervalo=0.1")
+
+    assert set(Tarea.objects.values_list("estado", flat=True)) == {"completada"}
+    assert Departamento.objects.count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("procesos", [False, True])
+def test_run_worker_reparte_las_tareas_en_el_pool(pool_sincronico, procesos):
+    for nombre in ["Civil", "Mecánica", "Eléctrica"]:
+        encolar_tarea(crear_departamento, nombre)
+
+    argumentos = ["--una-vez", "--concurrencia=2", "--intervalo=0.1"]
+    call_command("run_worker", *argumentos + (["--procesos"] if procesos else []))
+
+    (pool,) = PoolSincronico.creados
+    assert pool.max_workers == 2
+    assert (pool.initializer is run_worker._inicializar_proceso) == procesos
+    assert sorted(pool.enviadas) == [
+        (pk,) for pk in Tarea.objects.order_by("pk").values_list("pk", flat=True)
+    ]
+    # Reserva tantas tareas como lugares libres tiene el pool
+    assert pool_sincronico[0] == 2
+    assert set(Tarea.objects.values_list("estado", flat=True)) == {"completada"}
+
+
+@pytest.mark.django_db
+def test_tarea_fallida_se_reintenta_con_espera():
+    tarea = encolar_tarea(fallar, max_intentos=2)
+
+    assert reservar_tareas(10) == [tarea.pk]
+    assert reservar_tareas(10) == []
+    assert ejecutar_tarea(tarea.pk) == "pendiente"
+    tarea.refresh_from_db()
+    assert tarea.intentos == 1
+    assert tarea.disponible_desde > timezone.now()
+    assert "falla de prueba" in tarea.ultimo_error
+
+    Tarea.objects.filter(pk=tarea.pk).update(disponible_desde=timezone.now())
+    assert reservar_tareas(10) == [tarea.pk]
+    assert ejecutar_tarea(tarea.pk) == "fallida"
+
+
+@pytest.mark.django_db
+def test_reserva_vencida_vuelve_a_la_cola():
+    tarea = encolar_tarea(crear_departamento, "Civil")
+    reservar_tareas(10, visibilidad=60)
+
+    # El worker que la reservó murió sin terminarla
+    Tarea.objects.filter(pk=tarea.pk).update(
+        disponible_desde=timezone.now() - timedelta(seconds=1)
+    )
+
+    assert reservar_tareas(10) == [tarea.pk]
+    tarea.refresh_from_db()
+    assert tarea.intentos == 2
+
+
+@pytest.mark.django_db
+def test_reserva_vencida_no_pisa_la_del_otro_worker(caplog):
+    tarea = encolar_tarea(vencer_reserva)
+    reservar_tareas(10)
+    Tarea.objects.filter(pk=tarea.pk).update(
+        argumentos={"args": [tarea.pk], "kwargs": {}}
+    )
+
+    assert ejecutar_tarea(tarea.pk) == "reserva_vencida"
+    tarea.refresh_from_db()
+    assert tarea.estado == "en_curso"
+    assert tarea.intentos == 2
+    assert any(
+        "venció" in r.getMessage() for r in caplog.records if r.name == tareas.__name__
+    )
@@ -1,4 +1,9 @@
+from django.conf import settings
 from django.http import HttpResponse
+from django.views.generic import TemplateView
+
+from .mixins import SuperadminRequiredMixin
+from .perfilado import LIMITES_MS, resumen_vistas
 
 
 def index(request):
@@ -13,3 +18,31 @@ def index(request):
 
 # Para que esta vista funcione en el navegador, necesitarás
 # conectarla en un archivo urls.py de la aplicación.
+
+
+class PerfiladoView(SuperadminRequiredMixin, TemplateView):
+    """Tiempos y consultas por vista registrados por PerfiladoMiddleware"""
+
+    template_name = "core/perfilado.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        ventana = settings.PERFILADO_VENTANA_HORAS
+        try:
+            horas = min(max(int(self.request.GET.get("horas", ventana)), 1), ventana)
+        except ValueError:
+            horas = ventana
+
+        etiquetas = [f"≤{limite}" for limite in LIMITES_MS] + [f">{LIMITES_MS[-1]}"]
+        vistas = resumen_vistas(horas)
+        for fila in vistas:
+            fila["intervalos"] = list(zip(etiquetas, fila["histograma"]))
+            for campo in ("p50_ms", "p95_ms"):
+                valor = fila[campo]
+                fila[campo] = etiquetas[-1] if valor is None else f"≤{valor}"
+
+        context["horas"] = horas
+        context["opciones_horas"] = [h for h in (1, 6, 24, 72) if h < ventana]
+        context["opciones_horas"].append(ventana)
+        context["vistas"] = vistas
+        return context
@@ -38,4 +38,4 @@ class SolicitudEquivalenciaAdmin(admin.ModelAdmin):
     list_filter = ["estado_general", "fecha_inicio"]
     search_fields = ["estudiante__nombre_completo"]
     inlines = [DetalleSolicitudInline, DocumentoAdjuntoInline]
-    readonly_fields = ["fecha_inicio"]
+    readonly_fields = ["fecha_inicio", "total_asignaturas", "asignaturas_dictaminadas"]
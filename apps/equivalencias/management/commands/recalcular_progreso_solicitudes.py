@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.equivalencias.models import SolicitudEquivalencia
+
+
+class Command(BaseCommand):
+    help = "Recalcula los contadores de progreso de las solicitudes de equivalencia"
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.HTTP_INFO("Recalculando progreso..."))
+
+        actualizadas = SolicitudEquivalencia.objects.recalcular_progreso()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ {actualizadas} solicitudes actualizadas")
+        )
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:08
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def poblar_contadores(apps, schema_editor):
+    SolicitudEquivalencia = apps.get_model("equivalencias", "SolicitudEquivalencia")
+    DetalleSolicitud = apps.get_model("equivalencias", "DetalleSolicitud")
+    detalles = DetalleSolicitud.objects.filter(solicitud=OuterRef("pk"))
+    SolicitudEquivalencia.objects.update(
+        total_asignaturas=Coalesce(
+            Subquery(
+                detalles.values("solicitud").annotate(total=Count("id")).values("total")
+            ),
+            0,
+        ),
+        asignaturas_dictaminadas=Coalesce(
+            Subquery(
+                detalles.exclude(estado_asignatura="pendiente")
+                .values("solicitud")
+                .annotate(total=Count("id"))
+                .values("total")
+            ),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equivalencias", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="solicitudequivalencia",
+            name="asignaturas_dictaminadas",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="solicitudequivalencia",
+            name="total_asignaturas",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="solicitudequivalencia",
+            index=models.Index(
+                fields=["estado_general", "asignaturas_dictaminadas"],
+                name="solicitud_estado_dictam_idx",
+            ),
+        ),
+        migrations.RunPython(poblar_contadores, migrations.RunPython.noop),
+    ]
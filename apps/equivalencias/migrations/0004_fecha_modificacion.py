@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equivalencias", "0003_busqueda_normalizada"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="detallesolicitud",
+            name="fecha_modificacion",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="estudiante",
+            name="fecha_modificacion",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="solicitudequivalencia",
+            name="fecha_modificacion",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equivalencias", "0004_fecha_modificacion"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="solicitudequivalencia",
+            index=models.Index(
+                fields=["-fecha_inicio", "-id"], name="solicitud_inicio_idx"
+            ),
+        ),
+    ]
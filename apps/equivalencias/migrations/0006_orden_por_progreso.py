@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-18 02:12
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equivalencias", "0005_keyset_indices"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="solicitudequivalencia",
+            name="porcentaje_dictaminado",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(then=models.Value(0), total_asignaturas=0),
+                    default=django.db.models.expressions.CombinedExpression(
+                        django.db.models.expressions.CombinedExpression(
+                            models.F("asignaturas_dictaminadas"), "*", models.Value(100)
+                        ),
+                        "/",
+                        models.F("total_asignaturas"),
+                    ),
+                ),
+                output_field=models.PositiveSmallIntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="solicitudequivalencia",
+            index=models.Index(
+                fields=["porcentaje_dictaminado", "-fecha_inicio", "-id"],
+                name="solicitud_progreso_idx",
+            ),
+        ),
+    ]
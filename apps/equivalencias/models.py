@@ -1,11 +1,18 @@
 from django.db import models
+from django.db.models import Case, Count, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
+from apps.core.busqueda import ModeloConBusqueda
 
-class Estudiante(models.Model):
+
+class Estudiante(ModeloConBusqueda):
     """Estudiantes que solicitan equivalencias"""
 
+    campos_busqueda = ["nombre_completo", "dni_pasaporte", "email_estudiante"]
+
     nombre_completo = models.CharField(max_length=255)
     email_estudiante = models.EmailField(null=True, blank=True)
     dni_pasaporte = models.CharField(max_length=50, unique=True, null=True, blank=True)
@@ -14,6 +21,7 @@ class Estudiante(models.Model):
         "core.Carrera", on_delete=models.PROTECT, null=True, blank=True
     )
     fecha_creacion = models.DateTimeField(auto_now_add=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Estudiante"
@@ -63,6 +71,31 @@ class AsignaturaParaEquivalencia(models.Model):
         super().save(*args, **kwargs)
 
 
+class SolicitudEquivalenciaQuerySet(models.QuerySet):
+    def recalcular_progreso(self):
+        """Recalcula los contadores de progreso con un único UPDATE"""
+        detalles = DetalleSolicitud.objects.filter(solicitud=OuterRef("pk"))
+        return self.update(
+            total_asignaturas=Coalesce(
+                Subquery(
+                    detalles.values("solicitud")
+                    .annotate(total=Count("id"))
+                    .values("total")
+                ),
+                0,
+            ),
+            asignaturas_dictaminadas=Coalesce(
+                Subquery(
+                    detalles.exclude(estado_asignatura="pendiente")
+                    .values("solicitud")
+                    .annotate(total=Count("id"))
+                    .values("total")
+                ),
+                0,
+            ),
+        )
+
+
 class SolicitudEquivalencia(models.Model):
     """Solicitud de equivalencia de un estudiante"""
 
@@ -72,6 +105,8 @@ class SolicitudEquivalencia(models.Model):
         ("cancelada", "Cancelada"),
     ]
 
+    CAMPOS_PROGRESO = ["total_asignaturas", "asignaturas_dictaminadas"]
+
     estudiante = models.ForeignKey(Estudiante, on_delete=models.CASCADE)
     asignaturas = models.ManyToManyField(
         AsignaturaParaEquivalencia, through="DetalleSolicitud"
@@ -85,36 +120,79 @@ class SolicitudEquivalencia(models.Model):
     )
     fecha_completada = models.DateField(null=True, blank=True)
     observaciones = models.TextField(blank=True)
+    # Contadores desnormalizados, mantenidos por las señales de DetalleSolicitud
+    total_asignaturas = models.PositiveIntegerField(default=0, editable=False)
+    asignaturas_dictaminadas = models.PositiveIntegerField(default=0, editable=False)
+    # Porcentaje entero dictaminado, calculado por la base para ordenar por avance
+    porcentaje_dictaminado = models.GeneratedField(
+        expression=Case(
+            When(total_asignaturas=0, then=Value(0)),
+            default=F("asignaturas_dictaminadas") * 100 / F("total_asignaturas"),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+    )
+    fecha_modificacion = models.DateTimeField(auto_now=True)
+
+    objects = SolicitudEquivalenciaQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Solicitud de Equivalencia"
         verbose_name_plural = "Solicitudes de Equivalencia"
         ordering = ["-fecha_inicio"]
+        indexes = [
+            models.Index(
+                fields=["estado_general", "asignaturas_dictaminadas"],
+                name="solicitud_estado_dictam_idx",
+            ),
+            # Paginación por keyset del listado (orden + desempate por id)
+            models.Index(fields=["-fecha_inicio", "-id"], name="solicitud_inicio_idx"),
+            models.Index(
+                fields=["porcentaje_dictaminado", "-fecha_inicio", "-id"],
+                name="solicitud_progreso_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Solicitud {self.id} - {self.estudiante}"
 
+    def save(self, *args, **kwargs):
+        """Evita pisar los contadores de progreso con valores desactualizados"""
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not field.generated
+                and field.name not in self.CAMPOS_PROGRESO
+            ]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def ajustar_progreso(cls, solicitud_id, total=0, dictaminadas=0):
+        """Suma los deltas indicados a los contadores de progreso"""
+        cls.objects.filter(pk=solicitud_id).update(
+            total_asignaturas=F("total_asignaturas") + total,
+            asignaturas_dictaminadas=F("asignaturas_dictaminadas") + dictaminadas,
+            fecha_modificacion=timezone.now(),
+        )
+
     @property
     def progreso(self):
         """Calcula el progreso de la solicitud"""
-        total = self.detallesolicitud_set.count()
+        total = self.total_asignaturas
         if total == 0:
             return "0 de 0"
-        dictaminadas = self.detallesolicitud_set.exclude(
-            estado_asignatura="pendiente"
-        ).count()
-        return f"{dictaminadas} de {total}"
+        return f"{self.asignaturas_dictaminadas} de {total}"
 
     @property
     def porcentaje_progreso(self):
         """Porcentaje de avance"""
-        total = self.detallesolicitud_set.count()
+        total = self.total_asignaturas
         if total == 0:
             return 0
-        dictaminadas = self.detallesolicitud_set.exclude(
-            estado_asignatura="pendiente"
-        ).count()
-        return int((dictaminadas / total) * 100)
+        # Misma cuenta entera que porcentaje_dictaminado
+        return self.asignaturas_dictaminadas * 100 // total
 
 
 class DetalleSolicitud(models.Model):
@@ -138,6 +216,7 @@ class DetalleSolicitud(models.Model):
     )
     fecha_dictamen = models.DateField(null=True, blank=True)
     observaciones_docente = models.TextField(blank=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Detalle de Solicitud"
@@ -0,0 +1,63 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import DetalleSolicitud, SolicitudEquivalencia
+
+
+def _es_dictaminada(estado_asignatura):
+    return int(estado_asignatura != "pendiente")
+
+
+@receiver(pre_save, sender=DetalleSolicitud)
+def guardar_estado_previo(sender, instance, raw=False, **kwargs):
+    """Recuerda solicitud y estado anteriores del detalle"""
+    instance._estado_previo = None
+    if raw or not instance.pk:
+        return
+
+    instance._estado_previo = (
+        DetalleSolicitud.objects.filter(pk=instance.pk)
+        .values_list("solicitud_id", "estado_asignatura")
+        .first()
+    )
+
+
+@receiver(post_save, sender=DetalleSolicitud)
+def actualizar_progreso_al_guardar(sender, instance, created, raw=False, **kwargs):
+    """Mantiene los contadores de progreso de la solicitud"""
+    if raw:
+        return
+
+    previo = getattr(instance, "_estado_previo", None)
+    dictaminada = _es_dictaminada(instance.estado_asignatura)
+
+    if created or previo is None:
+        SolicitudEquivalencia.ajustar_progreso(
+            instance.solicitud_id, total=1, dictaminadas=dictaminada
+        )
+        return
+
+    solicitud_previa, estado_previo = previo
+    dictaminada_previa = _es_dictaminada(estado_previo)
+
+    if solicitud_previa != instance.solicitud_id:
+        SolicitudEquivalencia.ajustar_progreso(
+            solicitud_previa, total=-1, dictaminadas=-dictaminada_previa
+        )
+        SolicitudEquivalencia.ajustar_progreso(
+            instance.solicitud_id, total=1, dictaminadas=dictaminada
+        )
+    elif dictaminada != dictaminada_previa:
+        SolicitudEquivalencia.ajustar_progreso(
+            instance.solicitud_id, dictaminadas=dictaminada - dictaminada_previa
+        )
+
+
+@receiver(post_delete, sender=DetalleSolicitud)
+def actualizar_progreso_al_eliminar(sender, instance, **kwargs):
+    """Descuenta el detalle eliminado de los contadores de la solicitud"""
+    SolicitudEquivalencia.ajustar_progreso(
+        instance.solicitud_id,
+        total=-1,
+        dictaminadas=-_es_dictaminada(instance.estado_asignatura),
+    )
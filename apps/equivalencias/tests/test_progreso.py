@@ -0,0 +1,73 @@
+import pytest
+from django.urls import reverse
+
+from apps.equivalencias.models import DetalleSolicitud, SolicitudEquivalencia
+
+
+def _contadores(solicitud):
+    solicitud.refresh_from_db()
+    return solicitud.total_asignaturas, solicitud.asignaturas_dictaminadas
+
+
+@pytest.mark.django_db
+def test_contadores_se_mantienen_con_los_detalles(crear_solicitud):
+    solicitud = crear_solicitud("pendiente", "aprobada", "denegada")
+    assert _contadores(solicitud) == (3, 2)
+    assert solicitud.progreso == "2 de 3"
+    assert solicitud.porcentaje_progreso == 66
+
+    detalle = DetalleSolicitud.objects.filter(
+        solicitud=solicitud, estado_asignatura="pendiente"
+    ).get()
+    detalle.estado_asignatura = "aprobada_pc"
+    detalle.save()
+    assert _contadores(solicitud) == (3, 3)
+
+    detalle.observaciones_docente = "Sin cambios de estado"
+    detalle.save()
+    assert _contadores(solicitud) == (3, 3)
+
+    detalle.delete()
+    assert _contadores(solicitud) == (2, 2)
+
+
+@pytest.mark.django_db
+def test_guardar_solicitud_no_pisa_contadores(crear_solicitud):
+    solicitud = crear_solicitud()
+    desactualizada = SolicitudEquivalencia.objects.get(pk=solicitud.pk)
+
+    otra = crear_solicitud("aprobada")
+    DetalleSolicitud.objects.filter(solicitud=otra).update(solicitud=solicitud)
+    SolicitudEquivalencia.objects.recalcular_progreso()
+
+    desactualizada.observaciones = "Editada"
+    desactualizada.save()
+    assert _contadores(solicitud) == (1, 1)
+    assert _contadores(otra) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_listado_ordena_por_proporcion_dictaminada(client, admin_user, estudiante):
+    contadores = {"completa": (1, 1), "avanzada": (4, 3), "empezada": (10, 3)}
+    ids = {}
+    for nombre, (total, dictaminadas) in contadores.items():
+        ids[nombre] = SolicitudEquivalencia.objects.create(estudiante=estudiante).pk
+        SolicitudEquivalencia.objects.filter(pk=ids[nombre]).update(
+            total_asignaturas=total, asignaturas_dictaminadas=dictaminadas
+        )
+    client.force_login(admin_user)
+
+    respuesta = client.get(
+        reverse("equivalencias:solicitud_list"), {"orden": "progreso"}
+    )
+
+    assert [s.pk for s in respuesta.context["solicitudes"]] == [
+        ids["empezada"],
+        ids["avanzada"],
+        ids["completa"],
+    ]
+    assert [s.porcentaje_dictaminado for s in respuesta.context["solicitudes"]] == [
+        30,
+        75,
+        100,
+    ]
@@ -7,7 +7,7 @@ from django.views.generic import (
 )
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse_lazy
-from django.db.models import Q, Count
+from django.db.models import Q, Count, F
 from django.contrib import messages
 from django.shortcuts import redirect
 from datetime import date
@@ -19,7 +19,10 @@ from .models import (
     DocumentoAdjunto,
 )
 from .forms import EstudianteForm, SolicitudEquivalenciaForm, DocumentoAdjuntoForm
-from apps.core.mixins import DepartamentoAccessMixin
+from apps.core.busqueda import filtrar_busqueda
+from apps.core.cache import estadisticas_cacheadas
+from apps.core.mixins import DepartamentoAccessMixin, RespuestaCondicionalMixin
+from apps.core.paginacion import PaginacionKeysetMixin
 
 
 class EquivalenciasDashboardView(LoginRequiredMixin, TemplateView):
@@ -31,14 +34,11 @@ class EquivalenciasDashboardView(LoginRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
 
         # Estadísticas
-        context["total_solicitudes"] = SolicitudEquivalencia.objects.count()
-        context["en_proceso"] = SolicitudEquivalencia.objects.filter(
-            estado_general="proceso"
-        ).count()
-        context["completadas"] = SolicitudEquivalencia.objects.filter(
-            estado_general="completada"
-        ).count()
-        context["total_estudiantes"] = Estudiante.objects.count()
+        context.update(
+            estadisticas_cacheadas(
+                "equivalencias", [SolicitudEquivalencia, Estudiante], self.estadisticas
+            )
+        )
 
         # Solicitudes recientes
         context["solicitudes_recientes"] = SolicitudEquivalencia.objects.select_related(
@@ -47,6 +47,16 @@ class EquivalenciasDashboardView(LoginRequiredMixin, TemplateView):
 
         return context
 
+    @staticmethod
+    def estadisticas():
+        estadisticas = SolicitudEquivalencia.objects.aggregate(
+            total_solicitudes=Count("id"),
+            en_proceso=Count("id", filter=Q(estado_general="proceso")),
+            completadas=Count("id", filter=Q(estado_general="completada")),
+        )
+        estadisticas["total_estudiantes"] = Estudiante.objects.count()
+        return estadisticas
+
 
 class EstudianteListView(LoginRequiredMixin, ListView):
     """Lista de estudiantes"""
@@ -57,16 +67,14 @@ class EstudianteListView(LoginRequiredMixin, ListView):
     paginate_by = 20
 
     def get_queryset(self):
-        queryset = Estudiante.objects.all()
+        queryset = Estudiante.objects.select_related("carrera").annotate(
+            cantidad_solicitudes=Count("solicitudequivalencia")
+        )
 
         # Búsqueda
         search = self.request.GET.get("search")
         if search:
-            queryset = queryset.filter(
-                Q(nombre_completo__icontains=search)
-                | Q(dni_pasaporte__icontains=search)
-                | Q(email_estudiante__icontains=search)
-            )
+            queryset = filtrar_busqueda(queryset, search)
 
         return queryset.order_by("nombre_completo")
 
@@ -75,6 +83,7 @@ class EstudianteDetailView(LoginRequiredMixin, DetailView):
     """Detalle de un estudiante"""
 
     model = Estudiante
+    queryset = Estudiante.objects.select_related("carrera")
     template_name = "equivalencias/estudiante_detail.html"
     context_object_name = "estudiante"
 
@@ -116,13 +125,17 @@ class EstudianteUpdateView(LoginRequiredMixin, UpdateView):
         return super().form_valid(form)
 
 
-class SolicitudListView(LoginRequiredMixin, ListView):
+class SolicitudListView(
+    LoginRequiredMixin, RespuestaCondicionalMixin, PaginacionKeysetMixin, ListView
+):
     """Lista de solicitudes de equivalencia"""
 
     model = SolicitudEquivalencia
     template_name = "equivalencias/solicitud_list.html"
     context_object_name = "solicitudes"
     paginate_by = 20
+    conteo_aproximado = True
+    campos_modificacion = ["fecha_modificacion", "estudiante__fecha_modificacion"]
 
     def get_queryset(self):
         queryset = SolicitudEquivalencia.objects.select_related("estudiante")
@@ -132,27 +145,47 @@ class SolicitudListView(LoginRequiredMixin, ListView):
         if estado:
             queryset = queryset.filter(estado_general=estado)
 
-        search = self.request.GET.get("search")
-        if search:
+        progreso = self.request.GET.get("progreso")
+        if progreso == "sin_dictamen":
+            queryset = queryset.filter(asignaturas_dictaminadas=0)
+        elif progreso == "parcial":
+            queryset = queryset.filter(
+                asignaturas_dictaminadas__gt=0,
+                asignaturas_dictaminadas__lt=F("total_asignaturas"),
+            )
+        elif progreso == "dictaminada":
             queryset = queryset.filter(
-                Q(estudiante__nombre_completo__icontains=search)
-                | Q(estudiante__dni_pasaporte__icontains=search)
+                total_asignaturas__gt=0,
+                asignaturas_dictaminadas=F("total_asignaturas"),
             )
 
+        search = self.request.GET.get("search")
+        if search:
+            queryset = filtrar_busqueda(queryset, search, "estudiante__busqueda")
+
+        if self.request.GET.get("orden") == "progreso":
+            # Menor avance primero (dictaminadas sobre el total)
+            return queryset.order_by("porcentaje_dictaminado", "-fecha_inicio")
         return queryset.order_by("-fecha_inicio")
 
 
-class SolicitudDetailView(LoginRequiredMixin, DetailView):
+class SolicitudDetailView(LoginRequiredMixin, RespuestaCondicionalMixin, DetailView):
     """Detalle de una solicitud de equivalencia"""
 
     model = SolicitudEquivalencia
     template_name = "equivalencias/solicitud_detail.html"
     context_object_name = "solicitud"
+    campos_modificacion = [
+        "fecha_modificacion",
+        "estudiante__fecha_modificacion",
+        "detallesolicitud__fecha_modificacion",
+        "documentoadjunto__fecha_carga",
+    ]
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["detalles"] = self.object.detallesolicitud_set.select_related(
-            "asignatura__asignatura", "asignatura__docente_responsable"
+            "asignatura__asignatura__departamento", "asignatura__docente_responsable"
         ).all()
         context["documentos"] = self.object.documentoadjunto_set.all()
         return context
@@ -1,5 +1,21 @@
-from django.contrib import admin
-from .models import Docente, Correo, Asignatura, Resolucion, Cargo
+from django.contrib import admin, messages
+from django.contrib.admin import helpers
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path
+
+from .forms import ImportarPlantaForm, RenovarInterinosForm
+from .importacion import COLUMNAS, importar_planta, leer_planilla
+from .models import (
+    Docente,
+    Correo,
+    Asignatura,
+    Resolucion,
+    Cargo,
+    RenovacionCargo,
+    ResumenPlanta,
+)
+from . import renovacion
 
 
 class CorreoInline(admin.TabularInline):
@@ -32,10 +48,29 @@ class AsignaturaAdmin(admin.ModelAdmin):
 
 @admin.register(Resolucion)
 class ResolucionAdmin(admin.ModelAdmin):
-    list_display = ["numero", "anio", "origen", "objeto", "fecha_emision"]
+    list_display = [
+        "numero",
+        "anio",
+        "origen",
+        "objeto",
+        "fecha_emision",
+        "cargos",
+        "cargos_activos",
+    ]
     list_filter = ["anio", "origen", "objeto"]
     search_fields = ["numero", "observaciones"]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).con_cargos_count()
+
+    @admin.display(description="Cargos", ordering="cargos_count")
+    def cargos(self, obj):
+        return obj.cargos_count
+
+    @admin.display(description="Activos", ordering="cargos_activos_count")
+    def cargos_activos(self, obj):
+        return obj.cargos_activos_count
+
 
 @admin.register(Cargo)
 class CargoAdmin(admin.ModelAdmin):
@@ -50,3 +85,106 @@ class CargoAdmin(admin.ModelAdmin):
     list_filter = ["estado", "caracter", "categoria", "dedicacion"]
     search_fields = ["docente__apellido", "docente__nombre", "asignatura__nombre"]
     date_hierarchy = "fecha_inicio"
+    change_list_template = "admin/planta_docente/cargo/change_list.html"
+    actions = ["renovar_interinos"]
+
+    @admin.action(
+        description="Renovar interinos seleccionados hasta el 31/3 siguiente",
+        permissions=["change"],
+    )
+    def renovar_interinos(self, request, queryset):
+        form = RenovarInterinosForm(request.POST if "aplicar" in request.POST else None)
+        if form.is_valid():
+            cantidad = renovacion.renovar_interinos(
+                queryset, form.cleaned_data["resolucion"], usuario=request.user
+            )
+            self.message_user(
+                request, f"{cantidad} cargos interinos renovados.", messages.SUCCESS
+            )
+            return None
+
+        context = {
+            **self.admin_site.each_context(request),
+            "title": "Renovar cargos interinos",
+            "opts": self.model._meta,
+            "form": form,
+            "ids": list(queryset.values_list("pk", flat=True)),
+            "renovables": queryset.filter(caracter="interino", estado="activo").count(),
+            "action_checkbox_name": helpers.ACTION_CHECKBOX_NAME,
+        }
+        return TemplateResponse(
+            request, "admin/planta_docente/cargo/renovar_interinos.html", context
+        )
+
+    def get_urls(self):
+        return [
+            path(
+                "importar/",
+                self.admin_site.admin_view(self.importar_view),
+                name="planta_docente_cargo_importar",
+            ),
+        ] + super().get_urls()
+
+    def importar_view(self, request):
+        """Importación masiva de docentes, resoluciones y cargos"""
+        if not self.has_add_permission(request):
+            return redirect("admin:planta_docente_cargo_changelist")
+
+        form = ImportarPlantaForm(request.POST or None, request.FILES or None)
+        resultado = None
+        if request.method == "POST" and form.is_valid():
+            archivo = form.cleaned_data["archivo"]
+            try:
+                filas = leer_planilla(archivo, archivo.name)
+            except ValueError as error:
+                form.add_error("archivo", str(error))
+            else:
+                resultado = importar_planta(filas, simular=form.cleaned_data["simular"])
+                if not resultado.errores and not form.cleaned_data["simular"]:
+                    self.message_user(
+                        request, f"Importados {resultado}", messages.SUCCESS
+                    )
+                    return redirect("admin:planta_docente_cargo_changelist")
+
+        context = {
+            **self.admin_site.each_context(request),
+            "title": "Importar planta docente",
+            "opts": self.model._meta,
+            "form": form,
+            "resultado": resultado,
+            "columnas": COLUMNAS,
+        }
+        return TemplateResponse(
+            request, "admin/planta_docente/cargo/importar.html", context
+        )
+
+
+@admin.register(ResumenPlanta)
+class ResumenPlantaAdmin(admin.ModelAdmin):
+    list_display = ["departamento", "caracter", "dedicacion", "cantidad_cargos"]
+    list_filter = ["departamento", "caracter", "dedicacion"]
+    readonly_fields = ["departamento", "caracter", "dedicacion", "cantidad_cargos"]
+
+
+@admin.register(RenovacionCargo)
+class RenovacionCargoAdmin(admin.ModelAdmin):
+    list_display = [
+        "cargo",
+        "resolucion",
+        "vencimiento_anterior",
+        "vencimiento_nuevo",
+        "usuario",
+        "fecha",
+    ]
+    list_filter = ["resolucion", "vencimiento_nuevo"]
+    search_fields = ["cargo__docente__apellido", "cargo__docente__documento"]
+    list_select_related = [
+        "cargo__docente",
+        "cargo__asignatura__carrera",
+        "resolucion",
+        "usuario",
+    ]
+    readonly_fields = list_display
+
+    def has_add_permission(self, request):
+        return False
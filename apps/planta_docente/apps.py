@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PlantaDocenteConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.planta_docente"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -83,6 +83,13 @@ class CargoForm(forms.ModelForm):
             "observaciones": forms.Textarea(attrs={"class": "form-control", "rows": 3}),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Asignatura.__str__ muestra la carrera de cada opción
+        self.fields["asignatura"].queryset = Asignatura.objects.select_related(
+            "carrera"
+        )
+
 
 class ResolucionForm(forms.ModelForm):
     """Formulario para resoluciones"""
@@ -104,3 +111,21 @@ class ResolucionForm(forms.ModelForm):
             ),
             "observaciones": forms.Textarea(attrs={"class": "form-control", "rows": 3}),
         }
+
+
+class ImportarPlantaForm(forms.Form):
+    """Formulario de carga de la planilla de planta docente"""
+
+    archivo = forms.FileField(help_text="Planilla .csv o .xlsx con una fila por cargo")
+    simular = forms.BooleanField(
+        required=False, help_text="Validar la planilla sin guardar nada"
+    )
+
+
+class RenovarInterinosForm(forms.Form):
+    """Resolución de prórroga para la renovación masiva de interinos"""
+
+    resolucion = forms.ModelChoiceField(
+        queryset=Resolucion.objects.order_by("-anio", "-numero"),
+        help_text="Resolución que prorroga los cargos seleccionados",
+    )
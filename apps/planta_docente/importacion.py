@@ -0,0 +1,374 @@
+import csv
+import io
+from collections import Counter
+from datetime import date, datetime
+from pathlib import Path
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.cache import invalidar_modelo
+
+from .models import Asignatura, Cargo, Docente, Resolucion, ResumenPlanta
+
+COLUMNAS = [
+    "documento",
+    "apellido",
+    "nombre",
+    "fecha_nacimiento",
+    "legajo",
+    "asignatura",
+    "comision",
+    "caracter",
+    "categoria",
+    "dedicacion",
+    "cantidad_horas",
+    "estado",
+    "fecha_inicio",
+    "fecha_vencimiento",
+    "resolucion_numero",
+    "resolucion_anio",
+    "resolucion_origen",
+    "resolucion_objeto",
+    "resolucion_fecha",
+    "resolucion_detalle",
+]
+
+OBLIGATORIAS = [
+    "documento",
+    "apellido",
+    "nombre",
+    "fecha_nacimiento",
+    "asignatura",
+    "caracter",
+    "categoria",
+    "dedicacion",
+    "cantidad_horas",
+    "fecha_inicio",
+    "resolucion_numero",
+    "resolucion_anio",
+    "resolucion_origen",
+]
+
+CAMPOS_DOCENTE = ["apellido", "nombre", "fecha_nacimiento", "legajo"]
+
+
+class ResultadoImportacion:
+    """Cantidades escritas (o a escribir, al simular) y errores por fila"""
+
+    def __init__(self):
+        self.docentes_creados = 0
+        self.docentes_actualizados = 0
+        self.resoluciones_creadas = 0
+        self.cargos_creados = 0
+        self.errores = []
+
+    def __str__(self):
+        return (
+            f"{self.cargos_creados} cargos, {self.docentes_creados} docentes nuevos, "
+            f"{self.docentes_actualizados} docentes actualizados, "
+            f"{self.resoluciones_creadas} resoluciones nuevas"
+        )
+
+
+def _texto(valor):
+    if valor is None:
+        return ""
+    if isinstance(valor, datetime):
+        valor = valor.date()
+    if isinstance(valor, date):
+        return valor.isoformat()
+    if isinstance(valor, float) and valor.is_integer():
+        valor = int(valor)
+    return str(valor).strip()
+
+
+def leer_planilla(archivo, nombre):
+    """
+    Devuelve las filas de un archivo binario .csv o .xlsx como diccionarios
+    con las columnas en minúsculas y los valores como texto.
+    """
+    extension = Path(nombre).suffix.lower()
+    if extension == ".csv":
+        texto = io.TextIOWrapper(archivo, encoding="utf-8-sig", newline="")
+        muestra = texto.read(4096)
+        texto.seek(0)
+        try:
+            dialecto = csv.Sniffer().sniff(muestra, delimiters=",;")
+        except csv.Error:
+            dialecto = csv.excel
+        filas = list(csv.reader(texto, dialecto))
+    elif extension == ".xlsx":
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValueError("Para importar archivos .xlsx hay que instalar openpyxl.")
+        libro = load_workbook(archivo, read_only=True, data_only=True)
+        filas = list(libro.active.iter_rows(values_only=True))
+        libro.close()
+    else:
+        raise ValueError(f"Formato no soportado: {nombre} (se espera .csv o .xlsx)")
+
+    if not filas:
+        return []
+    encabezado = [_texto(columna).lower() for columna in filas[0]]
+    faltantes = [columna for columna in OBLIGATORIAS if columna not in encabezado]
+    if faltantes:
+        raise ValueError(f"Faltan columnas: {', '.join(faltantes)}")
+    return [
+        dict(zip(encabezado, (_texto(valor) for valor in fila)))
+        for fila in filas[1:]
+        if any(valor not in (None, "") for valor in fila)
+    ]
+
+
+def _fecha(texto):
+    for formato in ("%Y-%m-%d", "%d/%m/%Y"):
+        try:
+            return datetime.strptime(texto, formato).date()
+        except ValueError:
+            continue
+    raise ValueError(f"fecha inválida '{texto}'")
+
+
+def _opcion(texto, choices, campo):
+    if texto not in dict(choices):
+        raise ValueError(f"{campo} inválido '{texto}'")
+    return texto
+
+
+def _parsear(fila):
+    """Valida el formato de una fila y devuelve sus valores tipados"""
+    faltantes = [campo for campo in OBLIGATORIAS if not fila.get(campo)]
+    if faltantes:
+        raise ValueError(f"faltan valores en {', '.join(faltantes)}")
+    try:
+        cantidad_horas = int(fila["cantidad_horas"])
+        resolucion_anio = int(fila["resolucion_anio"])
+    except ValueError:
+        raise ValueError("cantidad_horas y resolucion_anio deben ser enteros")
+    return {
+        "docente": {
+            "apellido": fila["apellido"],
+            "nombre": fila["nombre"],
+            "fecha_nacimiento": _fecha(fila["fecha_nacimiento"]),
+            "legajo": fila.get("legajo") or None,
+        },
+        "documento": fila["documento"],
+        "asignatura": fila["asignatura"],
+        "resolucion": (
+            fila["resolucion_numero"],
+            resolucion_anio,
+            _opcion(fila["resolucion_origen"], Resolucion.ORIGEN_CHOICES, "origen"),
+        ),
+        "resolucion_objeto": fila.get("resolucion_objeto") or "alta",
+        "resolucion_fecha": fila.get("resolucion_fecha"),
+        "resolucion_detalle": fila.get("resolucion_detalle", ""),
+        "cargo": {
+            "comision": fila.get("comision") or "1",
+            "caracter": _opcion(fila["caracter"], Cargo.CARACTER_CHOICES, "caracter"),
+            "categoria": _opcion(
+                fila["categoria"], Cargo.CATEGORIA_CHOICES, "categoria"
+            ),
+            "dedicacion": _opcion(
+                fila["dedicacion"], Cargo.DEDICACION_CHOICES, "dedicacion"
+            ),
+            "cantidad_horas": cantidad_horas,
+            "estado": _opcion(
+                fila.get("estado") or "activo", Cargo.ESTADO_CHOICES, "estado"
+            ),
+            "fecha_inicio": _fecha(fila["fecha_inicio"]),
+            "fecha_vencimiento": (
+                _fecha(fila["fecha_vencimiento"])
+                if fila.get("fecha_vencimiento")
+                else None
+            ),
+        },
+    }
+
+
+def importar_planta(filas, simular=False, lote=500):
+    """
+    Valida e importa las filas leídas con ``leer_planilla``. Con errores, o
+    con ``simular``, no escribe nada.
+    """
+    resultado = ResultadoImportacion()
+    datos = []
+    for numero, fila in enumerate(filas, start=2):
+        try:
+            datos.append((numero, _parsear(fila)))
+        except ValueError as error:
+            resultado.errores.append((numero, str(error)))
+
+    # Precarga de todo lo existente que referencian las filas
+    documentos = {d["documento"] for _, d in datos}
+    docentes = {
+        d.documento: d for d in Docente.objects.filter(documento__in=documentos)
+    }
+    legajos = dict(
+        Docente.objects.filter(
+            legajo__in={d["docente"]["legajo"] for _, d in datos} - {None}
+        ).values_list("legajo", "documento")
+    )
+    asignaturas = {
+        a.codigo: a
+        for a in Asignatura.objects.filter(
+            codigo__in={d["asignatura"] for _, d in datos}
+        )
+    }
+    resoluciones = {
+        (r.numero, r.anio, r.origen): r
+        for r in Resolucion.objects.filter(
+            numero__in={d["resolucion"][0] for _, d in datos},
+            anio__in={d["resolucion"][1] for _, d in datos},
+        )
+    }
+    # Unicidad de Cargo.clean: un cargo activo por docente-asignatura-comisión
+    activos = set(
+        Cargo.objects.filter(estado="activo", docente__documento__in=documentos)
+        .values_list("docente__documento", "asignatura__codigo", "comision")
+        .order_by()
+    )
+
+    docentes_fila = {}
+    nuevas_resoluciones = {}
+    cargos = []
+    for numero, d in datos:
+        try:
+            documento = d["documento"]
+            legajo = d["docente"]["legajo"]
+            if documento in docentes_fila:
+                previo_numero, previo = docentes_fila[documento]
+                if previo != d["docente"]:
+                    raise ValueError(
+                        f"los datos del docente {documento} difieren de la fila "
+                        f"{previo_numero}"
+                    )
+            elif legajo and legajos.setdefault(legajo, documento) != documento:
+                raise ValueError(f"el legajo {legajo} pertenece a otro docente")
+
+            asignatura = asignaturas.get(d["asignatura"])
+            if asignatura is None:
+                raise ValueError(f"no existe la asignatura '{d['asignatura']}'")
+
+            clave_resolucion = d["resolucion"]
+            resolucion = resoluciones.get(clave_resolucion) or nuevas_resoluciones.get(
+                clave_resolucion
+            )
+            if resolucion is None:
+                if not d["resolucion_fecha"]:
+                    raise ValueError(
+                        "falta resolucion_fecha para crear la resolución "
+                        f"{clave_resolucion[0]}/{clave_resolucion[1]}"
+                    )
+                resolucion = Resolucion(
+                    numero=clave_resolucion[0],
+                    anio=clave_resolucion[1],
+                    origen=clave_resolucion[2],
+                    objeto=_opcion(
+                        d["resolucion_objeto"], Resolucion.OBJETO_CHOICES, "objeto"
+                    ),
+                    fecha_emision=_fecha(d["resolucion_fecha"]),
+                    detalle_funciones_sustantivas=d["resolucion_detalle"] or None,
+                )
+
+            cargo = Cargo(asignatura=asignatura, **d["cargo"])
+            cargo.fecha_vencimiento = (
+                cargo.fecha_vencimiento or cargo.calcular_vencimiento()
+            )
+            if cargo.fecha_vencimiento is None:
+                raise ValueError(
+                    f"falta fecha_vencimiento para un cargo {cargo.caracter}"
+                )
+            if (
+                asignatura.horas_semanales < 4
+                and not resolucion.detalle_funciones_sustantivas
+            ):
+                raise ValueError(
+                    "se requiere detalle de funciones sustantivas en la resolución "
+                    "para asignaturas con menos de 4 horas semanales"
+                )
+            if cargo.estado == "activo":
+                clave = (documento, asignatura.codigo, cargo.comision)
+                if clave in activos:
+                    raise ValueError(
+                        "ya existe un cargo activo para este docente en esta "
+                        "asignatura y comisión"
+                    )
+                activos.add(clave)
+        except ValueError as error:
+            resultado.errores.append((numero, str(error)))
+            continue
+
+        docentes_fila.setdefault(documento, (numero, d["docente"]))
+        if resolucion.pk is None:
+            nuevas_resoluciones[clave_resolucion] = resolucion
+        cargos.append((documento, clave_resolucion, cargo))
+
+    nuevos_docentes = []
+    docentes_modificados = []
+    ahora = timezone.now()
+    for documento, (_, valores) in docentes_fila.items():
+        docente = docentes.get(documento)
+        if docente is None:
+            docente = Docente(documento=documento, **valores)
+            nuevos_docentes.append(docente)
+            docente.busqueda = docente.texto_busqueda()
+            continue
+        # Un legajo vacío en la planilla no borra el existente
+        valores = {campo: valor for campo, valor in valores.items() if valor}
+        if any(getattr(docente, campo) != valor for campo, valor in valores.items()):
+            for campo, valor in valores.items():
+                setattr(docente, campo, valor)
+            # bulk_update no actualiza los campos auto_now
+            docente.fecha_modificacion = ahora
+            docente.busqueda = docente.texto_busqueda()
+            docentes_modificados.append(docente)
+
+    resultado.errores.sort()
+    resultado.docentes_creados = len(nuevos_docentes)
+    resultado.docentes_actualizados = len(docentes_modificados)
+    resultado.resoluciones_creadas = len(nuevas_resoluciones)
+    resultado.cargos_creados = len(cargos)
+    if resultado.errores or simular or not cargos:
+        return resultado
+
+    with transaction.atomic():
+        Docente.objects.bulk_create(nuevos_docentes, batch_size=lote)
+        Docente.objects.bulk_update(
+            docentes_modificados,
+            CAMPOS_DOCENTE + ["busqueda", "fecha_modificacion"],
+            batch_size=lote,
+        )
+        Resolucion.objects.bulk_create(nuevas_resoluciones.values(), batch_size=lote)
+
+        # No todos los motores devuelven las claves de bulk_create
+        ids_docentes = dict(
+            Docente.objects.filter(documento__in=docentes_fila).values_list(
+                "documento", "id"
+            )
+        )
+        ids_resoluciones = {
+            (r.numero, r.anio, r.origen): r.pk
+            for r in Resolucion.objects.filter(
+                numero__in={clave[0] for _, clave, _ in cargos},
+                anio__in={clave[1] for _, clave, _ in cargos},
+            )
+        }
+        resumen = Counter()
+        for documento, clave_resolucion, cargo in cargos:
+            cargo.docente_id = ids_docentes[documento]
+            cargo.resolucion_alta_id = ids_resoluciones[clave_resolucion]
+            if cargo.estado == "activo":
+                resumen[
+                    (cargo.asignatura.departamento_id, cargo.caracter, cargo.dedicacion)
+                ] += 1
+        Cargo.objects.bulk_create([cargo for _, _, cargo in cargos], batch_size=lote)
+
+        # bulk_create no dispara las señales que mantienen el resumen y la caché
+        for clave, cantidad in resumen.items():
+            ResumenPlanta.ajustar(*clave, delta=cantidad)
+        for model in (Docente, Resolucion, Cargo, ResumenPlanta):
+            invalidar_modelo(model)
+
+    return resultado
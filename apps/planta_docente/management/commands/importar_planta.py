@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.planta_docente.importacion import importar_planta, leer_planilla
+
+
+class Command(BaseCommand):
+    help = "Importa docentes, resoluciones y cargos desde una planilla CSV o XLSX"
+
+    def add_arguments(self, parser):
+        parser.add_argument("archivo", help="Ruta al archivo .csv o .xlsx")
+        parser.add_argument(
+            "--simular",
+            action="store_true",
+            help="Validar la planilla sin guardar nada",
+        )
+        parser.add_argument(
+            "--lote",
+            type=int,
+            default=500,
+            help="Filas por INSERT/UPDATE (default 500)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["archivo"], "rb") as archivo:
+                filas = leer_planilla(archivo, options["archivo"])
+        except (OSError, ValueError) as error:
+            raise CommandError(error)
+
+        resultado = importar_planta(
+            filas, simular=options["simular"], lote=options["lote"]
+        )
+        for numero, mensaje in resultado.errores:
+            self.stderr.write(self.style.ERROR(f"Fila {numero}: {mensaje}"))
+        if resultado.errores:
+            raise CommandError(
+                f"{len(resultado.errores)} filas con errores; no se importó nada"
+            )
+
+        if options["simular"]:
+            self.stdout.write(self.style.SUCCESS(f"✓ Planilla válida: {resultado}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✓ Importados {resultado}"))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from apps.planta_docente.models import ResumenPlanta
+
+
+class Command(BaseCommand):
+    help = "Reconstruye el resumen materializado de planta docente por departamento"
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.HTTP_INFO("Reconstruyendo resumen de planta..."))
+
+        ResumenPlanta.reconstruir()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Resumen reconstruido: {ResumenPlanta.objects.count()} combinaciones"
+            )
+        )
@@ -0,0 +1,64 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.planta_docente.models import Cargo, Resolucion
+from apps.planta_docente.renovacion import (
+    interinos_renovables,
+    renovar_interinos,
+    vencimiento_renovado,
+)
+
+
+class Command(BaseCommand):
+    help = "Prorroga un año los cargos interinos activos que vencen en una fecha"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "resolucion", type=int, help="ID de la resolución de prórroga"
+        )
+        parser.add_argument(
+            "--vencimiento",
+            type=date.fromisoformat,
+            default=date(date.today().year, 3, 31),
+            help="Vencimiento actual de los cargos (AAAA-MM-DD, default 31/3 de este año)",
+        )
+        parser.add_argument(
+            "--departamento",
+            help="Código del departamento de las asignaturas (default todos)",
+        )
+        parser.add_argument(
+            "--simular",
+            action="store_true",
+            help="Mostrar cuántos cargos se renovarían sin guardar nada",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            resolucion = Resolucion.objects.get(pk=options["resolucion"])
+        except Resolucion.DoesNotExist:
+            raise CommandError(f"No existe la resolución {options['resolucion']}")
+
+        cargos = Cargo.objects.filter(fecha_vencimiento=options["vencimiento"])
+        if options["departamento"]:
+            cargos = cargos.filter(
+                asignatura__departamento__codigo=options["departamento"]
+            )
+
+        nuevo = vencimiento_renovado(options["vencimiento"])
+        if options["simular"]:
+            cantidad = interinos_renovables(cargos, resolucion).count()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"✓ Se renovarían {cantidad} cargos interinos hasta {nuevo:%d/%m/%Y}"
+                )
+            )
+            return
+
+        cantidad = renovar_interinos(cargos, resolucion)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ {cantidad} cargos interinos renovados hasta {nuevo:%d/%m/%Y} "
+                f"({resolucion})"
+            )
+        )
@@ -0,0 +1,89 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def poblar_resumen(apps, schema_editor):
+    Cargo = apps.get_model("planta_docente", "Cargo")
+    ResumenPlanta = apps.get_model("planta_docente", "ResumenPlanta")
+    filas = (
+        Cargo.objects.filter(estado="activo")
+        .values("asignatura__departamento", "caracter", "dedicacion")
+        .annotate(cantidad=Count("id"))
+        .order_by()
+    )
+    ResumenPlanta.objects.bulk_create(
+        ResumenPlanta(
+            departamento_id=fila["asignatura__departamento"],
+            caracter=fila["caracter"],
+            dedicacion=fila["dedicacion"],
+            cantidad_cargos=fila["cantidad"],
+        )
+        for fila in filas
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+        ("planta_docente", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResumenPlanta",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "caracter",
+                    models.CharField(
+                        choices=[
+                            ("ordinario", "Ordinario"),
+                            ("regular", "Regular"),
+                            ("interino", "Interino"),
+                            ("extraordinario", "Extraordinario"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "dedicacion",
+                    models.CharField(
+                        choices=[
+                            ("simple", "Simple"),
+                            ("semiexclusiva", "Semiexclusiva"),
+                            ("exclusiva", "Exclusiva"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                ("cantidad_cargos", models.IntegerField(default=0)),
+                (
+                    "departamento",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="resumen_planta",
+                        to="core.departamento",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumen de Planta",
+                "verbose_name_plural": "Resúmenes de Planta",
+                "ordering": ["departamento", "caracter", "dedicacion"],
+                "unique_together": {("departamento", "caracter", "dedicacion")},
+            },
+        ),
+        migrations.RunPython(poblar_resumen, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planta_docente", "0002_resumenplanta"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cargo",
+            index=models.Index(
+                condition=models.Q(("estado", "activo")),
+                fields=["fecha_vencimiento"],
+                name="cargo_activo_vencimiento_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cargo",
+            index=models.Index(
+                condition=models.Q(("estado", "activo")),
+                fields=["docente", "asignatura", "comision"],
+                name="cargo_activo_unicidad_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cargo",
+            index=models.Index(
+                fields=["asignatura", "estado"], name="cargo_asignatura_estado_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cargo",
+            index=models.Index(
+                fields=["estado", "-fecha_inicio"], name="cargo_estado_inicio_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:13
+
+import unicodedata
+
+from django.db import migrations, models
+
+CAMPOS = ["apellido", "nombre", "documento", "legajo"]
+
+
+def normalizar(texto):
+    descompuesto = unicodedata.normalize("NFKD", texto or "")
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).lower()
+
+
+def poblar_busqueda(apps, schema_editor):
+    Docente = apps.get_model("planta_docente", "Docente")
+    pendientes = []
+    for obj in Docente.objects.only("pk", *CAMPOS).iterator(chunk_size=1000):
+        valores = (getattr(obj, campo) for campo in CAMPOS)
+        obj.busqueda = normalizar(" ".join(str(valor) for valor in valores if valor))
+        pendientes.append(obj)
+        if len(pendientes) >= 1000:
+            Docente.objects.bulk_update(pendientes, ["busqueda"])
+            pendientes = []
+    Docente.objects.bulk_update(pendientes, ["busqueda"])
+
+
+def crear_indice_trigram(apps, schema_editor):
+    # En otros motores la columna normalizada sirve sin índice
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS "docente_busqueda_trgm_idx" '
+        'ON "planta_docente_docente" USING gin ("busqueda" gin_trgm_ops)'
+    )
+
+
+def eliminar_indice_trigram(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute('DROP INDEX IF EXISTS "docente_busqueda_trgm_idx"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planta_docente", "0003_indices_cargo"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="docente",
+            name="busqueda",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(poblar_busqueda, migrations.RunPython.noop),
+        migrations.RunPython(crear_indice_trigram, eliminar_indice_trigram),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planta_docente", "0004_busqueda_normalizada"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="asignatura",
+            name="fecha_modificacion",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="cargo",
+            name="fecha_modificacion",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="correo",
+            name="fecha_modificacion",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planta_docente", "0005_fecha_modificacion"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="docente",
+            index=models.Index(
+                fields=["apellido", "nombre", "id"], name="docente_orden_idx"
+            ),
+        ),
+    ]
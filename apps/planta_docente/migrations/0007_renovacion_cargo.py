@@ -0,0 +1,64 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planta_docente", "0006_keyset_indices"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RenovacionCargo",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("vencimiento_anterior", models.DateField()),
+                ("vencimiento_nuevo", models.DateField()),
+                ("fecha", models.DateTimeField(auto_now_add=True)),
+                (
+                    "cargo",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="renovaciones",
+                        to="planta_docente.cargo",
+                    ),
+                ),
+                (
+                    "resolucion",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="renovaciones",
+                        to="planta_docente.resolucion",
+                    ),
+                ),
+                (
+                    "usuario",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Renovación de Cargo",
+                "verbose_name_plural": "Renovaciones de Cargos",
+                "ordering": ["-fecha"],
+                "unique_together": {("cargo", "resolucion")},
+            },
+        ),
+    ]
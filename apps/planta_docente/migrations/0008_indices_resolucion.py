@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planta_docente", "0007_renovacion_cargo"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="resolucion",
+            index=models.Index(fields=["anio", "numero"], name="resolucion_anio_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="resolucion",
+            index=models.Index(fields=["origen", "anio"], name="resolucion_origen_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="resolucion",
+            index=models.Index(fields=["objeto", "anio"], name="resolucion_objeto_idx"),
+        ),
+    ]
@@ -1,12 +1,27 @@
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Count, F, Q
 from django.core.exceptions import ValidationError
 from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
 
+from apps.core.busqueda import ModeloConBusqueda
+from apps.core.managers import DepartamentoFilterManager
 
-class Docente(models.Model):
+
+class DocenteQuerySet(models.QuerySet):
+    def con_cargos_activos_count(self):
+        """Anota la cantidad de cargos activos en la misma consulta"""
+        return self.annotate(
+            cargos_activos_count=Count("cargos", filter=Q(cargos__estado="activo"))
+        )
+
+
+class Docente(ModeloConBusqueda):
     """Información básica del docente"""
 
+    campos_busqueda = ["apellido", "nombre", "documento", "legajo"]
+
     apellido = models.CharField(max_length=100)
     nombre = models.CharField(max_length=100)
     documento = models.CharField(max_length=20, unique=True)
@@ -18,10 +33,18 @@ class Docente(models.Model):
     fecha_creacion = models.DateTimeField(auto_now_add=True)
     fecha_modificacion = models.DateTimeField(auto_now=True)
 
+    objects = DepartamentoFilterManager.from_queryset(DocenteQuerySet)(
+        "cargos__asignatura__departamento"
+    )
+
     class Meta:
         verbose_name = "Docente"
         verbose_name_plural = "Docentes"
         ordering = ["apellido", "nombre"]
+        indexes = [
+            # Paginación por keyset del listado (orden + desempate por id)
+            models.Index(fields=["apellido", "nombre", "id"], name="docente_orden_idx"),
+        ]
 
     def __str__(self):
         return f"{self.apellido}, {self.nombre}"
@@ -52,9 +75,15 @@ class Docente(models.Model):
 
     @property
     def cargos_activos_count(self):
-        """Cuenta los cargos activos del docente"""
+        """Cuenta los cargos activos del docente (usa la anotación si existe)"""
+        if hasattr(self, "_cargos_activos_count"):
+            return self._cargos_activos_count
         return self.cargos.filter(estado="activo").count()
 
+    @cargos_activos_count.setter
+    def cargos_activos_count(self, value):
+        self._cargos_activos_count = value
+
 
 class Correo(models.Model):
     """Correos electrónicos del docente"""
@@ -64,6 +93,7 @@ class Correo(models.Model):
     )
     email = models.EmailField(unique=True)
     es_principal = models.BooleanField(default=False)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Correo Electrónico"
@@ -81,6 +111,14 @@ class Correo(models.Model):
         super().save(*args, **kwargs)
 
 
+class AsignaturaQuerySet(models.QuerySet):
+    def con_cargos_activos_count(self):
+        """Anota la cantidad de cargos activos en la misma consulta"""
+        return self.annotate(
+            cargos_activos_count=Count("cargo", filter=Q(cargo__estado="activo"))
+        )
+
+
 class Asignatura(models.Model):
     """Asignaturas de las carreras"""
 
@@ -111,6 +149,9 @@ class Asignatura(models.Model):
     forma_dictado = models.CharField(max_length=10, choices=FORMA_DICTADO_CHOICES)
     areas = models.ManyToManyField("core.Area", blank=True)
     bloques = models.ManyToManyField("core.Bloque", blank=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
+
+    objects = DepartamentoFilterManager.from_queryset(AsignaturaQuerySet)()
 
     class Meta:
         verbose_name = "Asignatura"
@@ -122,15 +163,32 @@ class Asignatura(models.Model):
 
     @property
     def cargos_activos_count(self):
-        """Cuenta los cargos activos de la asignatura"""
+        """Cuenta los cargos activos de la asignatura (usa la anotación si existe)"""
+        if hasattr(self, "_cargos_activos_count"):
+            return self._cargos_activos_count
         return self.cargo_set.filter(estado="activo").count()
 
+    @cargos_activos_count.setter
+    def cargos_activos_count(self, value):
+        self._cargos_activos_count = value
+
     @property
     def cargos_activos(self):
         """Retorna los cargos activos de la asignatura"""
         return self.cargo_set.filter(estado="activo").select_related("docente")
 
 
+class ResolucionQuerySet(models.QuerySet):
+    def con_cargos_count(self):
+        """Anota la cantidad de cargos dados de alta, en total y por estado"""
+        return self.annotate(
+            cargos_count=Count("cargo"),
+            cargos_activos_count=Count("cargo", filter=Q(cargo__estado="activo")),
+            cargos_licencia_count=Count("cargo", filter=Q(cargo__estado="licencia")),
+            cargos_baja_count=Count("cargo", filter=Q(cargo__estado="baja")),
+        )
+
+
 class Resolucion(models.Model):
     """Resoluciones administrativas"""
 
@@ -163,11 +221,22 @@ class Resolucion(models.Model):
     )
     observaciones = models.TextField(blank=True)
 
+    objects = DepartamentoFilterManager.from_queryset(ResolucionQuerySet)(
+        "cargo__asignatura__departamento"
+    )
+
     class Meta:
         verbose_name = "Resolución"
         verbose_name_plural = "Resoluciones"
         ordering = ["-anio", "-numero"]
         unique_together = ["numero", "anio", "origen"]
+        indexes = [
+            # Orden del listado y filtro por año
+            models.Index(fields=["anio", "numero"], name="resolucion_anio_idx"),
+            # Filtros del listado por origen u objeto, ordenados por año
+            models.Index(fields=["origen", "anio"], name="resolucion_origen_idx"),
+            models.Index(fields=["objeto", "anio"], name="resolucion_objeto_idx"),
+        ]
 
     def __str__(self):
         return f"Res. {self.numero}/{self.anio} ({self.get_origen_display()})"
@@ -221,11 +290,36 @@ class Cargo(models.Model):
     fecha_vencimiento = models.DateField()
     resolucion_alta = models.ForeignKey(Resolucion, on_delete=models.PROTECT)
     observaciones = models.TextField(blank=True)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
+
+    objects = DepartamentoFilterManager("asignatura__departamento")
 
     class Meta:
         verbose_name = "Cargo"
         verbose_name_plural = "Cargos"
         ordering = ["-fecha_inicio"]
+        indexes = [
+            # Dashboards y reportes de vencimientos
+            models.Index(
+                fields=["fecha_vencimiento"],
+                condition=Q(estado="activo"),
+                name="cargo_activo_vencimiento_idx",
+            ),
+            # Unicidad de cargo activo validada en Cargo.clean
+            models.Index(
+                fields=["docente", "asignatura", "comision"],
+                condition=Q(estado="activo"),
+                name="cargo_activo_unicidad_idx",
+            ),
+            # Cargos activos por asignatura (y por departamento vía asignatura)
+            models.Index(
+                fields=["asignatura", "estado"], name="cargo_asignatura_estado_idx"
+            ),
+            # Listado de cargos filtrado por estado
+            models.Index(
+                fields=["estado", "-fecha_inicio"], name="cargo_estado_inicio_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.docente} - {self.get_categoria_display()} - {self.asignatura}"
@@ -254,16 +348,148 @@ class Cargo(models.Model):
                     "para asignaturas con menos de 4 horas semanales."
                 )
 
+    def calcular_vencimiento(self):
+        """Fecha de vencimiento según carácter y categoría (None si no aplica)"""
+        if self.caracter == "interino":
+            # Interinos vencen el 31 de marzo del año siguiente
+            return date(self.fecha_inicio.year + 1, 3, 31)
+        if self.caracter in ["regular", "ordinario"]:
+            # Regulares/Ordinarios: 5 o 7 años según categoría
+            anios = 7 if "profesor" in self.categoria else 5
+            return self.fecha_inicio + relativedelta(years=anios)
+        return None
+
     def save(self, *args, **kwargs):
         """Calcular fecha de vencimiento automáticamente"""
         if not self.fecha_vencimiento:
-            if self.caracter == "interino":
-                # Interinos vencen el 31 de marzo del año siguiente
-                anio_vencimiento = self.fecha_inicio.year + 1
-                self.fecha_vencimiento = date(anio_vencimiento, 3, 31)
-            elif self.caracter in ["regular", "ordinario"]:
-                # Regulares/Ordinarios: 5 o 7 años según categoría
-                anios = 7 if "profesor" in self.categoria else 5
-                self.fecha_vencimiento = self.fecha_inicio + relativedelta(years=anios)
+            self.fecha_vencimiento = self.calcular_vencimiento()
 
         super().save(*args, **kwargs)
+
+
+class RenovacionCargo(models.Model):
+    """Registro de cada prórroga de vencimiento de un cargo"""
+
+    cargo = models.ForeignKey(
+        Cargo, on_delete=models.CASCADE, related_name="renovaciones"
+    )
+    resolucion = models.ForeignKey(
+        Resolucion, on_delete=models.PROTECT, related_name="renovaciones"
+    )
+    vencimiento_anterior = models.DateField()
+    vencimiento_nuevo = models.DateField()
+    usuario = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True
+    )
+    fecha = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Renovación de Cargo"
+        verbose_name_plural = "Renovaciones de Cargos"
+        ordering = ["-fecha"]
+        unique_together = ["cargo", "resolucion"]
+
+    def __str__(self):
+        return (
+            f"{self.cargo} ({self.vencimiento_anterior:%d/%m/%Y} → "
+            f"{self.vencimiento_nuevo:%d/%m/%Y})"
+        )
+
+
+class ResumenPlanta(models.Model):
+    """Resumen materializado de cargos activos por departamento"""
+
+    CARACTERES_REGULARES = ["regular", "ordinario"]
+
+    departamento = models.ForeignKey(
+        "core.Departamento", on_delete=models.CASCADE, related_name="resumen_planta"
+    )
+    caracter = models.CharField(max_length=50, choices=Cargo.CARACTER_CHOICES)
+    dedicacion = models.CharField(max_length=50, choices=Cargo.DEDICACION_CHOICES)
+    cantidad_cargos = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Resumen de Planta"
+        verbose_name_plural = "Resúmenes de Planta"
+        ordering = ["departamento", "caracter", "dedicacion"]
+        unique_together = ["departamento", "caracter", "dedicacion"]
+
+    def __str__(self):
+        return (
+            f"{self.departamento} - {self.get_caracter_display()} - "
+            f"{self.get_dedicacion_display()}: {self.cantidad_cargos}"
+        )
+
+    @classmethod
+    def ajustar(cls, departamento_id, caracter, dedicacion, delta):
+        """Suma `delta` al contador de la combinación indicada"""
+        with transaction.atomic():
+            cls.objects.get_or_create(
+                departamento_id=departamento_id,
+                caracter=caracter,
+                dedicacion=dedicacion,
+            )
+            cls.objects.filter(
+                departamento_id=departamento_id,
+                caracter=caracter,
+                dedicacion=dedicacion,
+            ).update(cantidad_cargos=F("cantidad_cargos") + delta)
+
+    @classmethod
+    def reconstruir(cls):
+        """Recalcula el resumen completo a partir de los cargos activos"""
+        filas = (
+            Cargo.objects.filter(estado="activo")
+            .values("asignatura__departamento", "caracter", "dedicacion")
+            .annotate(cantidad=Count("id"))
+            .order_by()
+        )
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(
+                cls(
+                    departamento_id=fila["asignatura__departamento"],
+                    caracter=fila["caracter"],
+                    dedicacion=fila["dedicacion"],
+                    cantidad_cargos=fila["cantidad"],
+                )
+                for fila in filas
+            )
+
+    @classmethod
+    def totales_por_departamento(cls):
+        """
+        Devuelve un diccionario {departamento_id: totales} con los mismos
+        contadores que usa el reporte de planta completa.
+        """
+        resumen = {}
+        for fila in cls.objects.filter(cantidad_cargos__gt=0).select_related(
+            "departamento"
+        ):
+            totales = resumen.setdefault(
+                fila.departamento_id,
+                {
+                    "departamento": fila.departamento,
+                    "total_cargos": 0,
+                    "total_cargos_reg": 0,
+                    "total_exclusivas": 0,
+                    "total_exclusivas_reg": 0,
+                    "total_semis": 0,
+                    "total_semis_reg": 0,
+                    "total_simples": 0,
+                    "total_simples_reg": 0,
+                },
+            )
+            clave = {
+                "exclusiva": "total_exclusivas",
+                "semiexclusiva": "total_semis",
+                "simple": "total_simples",
+            }[fila.dedicacion]
+            es_regular = fila.caracter in cls.CARACTERES_REGULARES
+
+            totales["total_cargos"] += fila.cantidad_cargos
+            totales[clave] += fila.cantidad_cargos
+            if es_regular:
+                totales["total_cargos_reg"] += fila.cantidad_cargos
+                totales[f"{clave}_reg"] += fila.cantidad_cargos
+        return resumen
@@ -0,0 +1,67 @@
+from datetime import date
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.cache import invalidar_modelo
+
+from .models import Cargo, RenovacionCargo
+
+
+def vencimiento_renovado(vencimiento):
+    """31 de marzo del año siguiente al vencimiento actual"""
+    return date(vencimiento.year + 1, 3, 31)
+
+
+def interinos_renovables(cargos, resolucion):
+    """Interinos activos de `cargos` que aún no renovó `resolucion`"""
+    return cargos.filter(caracter="interino", estado="activo").exclude(
+        renovaciones__resolucion=resolucion
+    )
+
+
+def renovar_interinos(cargos, resolucion, usuario=None, lote=500):
+    """
+    Prorroga un año los interinos activos de `cargos` con `resolucion` y
+    devuelve la cantidad de cargos renovados.
+    """
+    with transaction.atomic():
+        filas = list(
+            interinos_renovables(cargos, resolucion)
+            .select_for_update(of=("self",))
+            .order_by()
+            .values_list("id", "fecha_vencimiento")
+        )
+        if not filas:
+            return 0
+
+        RenovacionCargo.objects.bulk_create(
+            (
+                RenovacionCargo(
+                    cargo_id=cargo_id,
+                    resolucion=resolucion,
+                    vencimiento_anterior=vencimiento,
+                    vencimiento_nuevo=vencimiento_renovado(vencimiento),
+                    usuario=usuario,
+                )
+                for cargo_id, vencimiento in filas
+            ),
+            batch_size=lote,
+        )
+        # Sólo los cargos bloqueados arriba, en lotes por fecha de vencimiento
+        por_vencimiento = {}
+        for cargo_id, vencimiento in filas:
+            por_vencimiento.setdefault(vencimiento, []).append(cargo_id)
+        ahora = timezone.now()
+        for vencimiento, ids in por_vencimiento.items():
+            for inicio in range(0, len(ids), lote):
+                Cargo.objects.filter(pk__in=ids[inicio : inicio + lote]).update(
+                    fecha_vencimiento=vencimiento_renovado(vencimiento),
+                    # update() no actualiza los campos auto_now
+                    fecha_modificacion=ahora,
+                )
+
+        # Ni bulk_create ni update disparan las señales que invalidan la caché
+        invalidar_modelo(Cargo)
+        invalidar_modelo(RenovacionCargo)
+    return len(filas)
@@ -0,0 +1,108 @@
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.core.cache import invalidar_modelo
+
+from .models import Asignatura, Cargo, ResumenPlanta
+
+
+def _clave_resumen(departamento_id, caracter, dedicacion, estado):
+    """Clave del resumen que afecta un cargo, o None si no está activo"""
+    if estado != "activo":
+        return None
+    return (departamento_id, caracter, dedicacion)
+
+
+@receiver(pre_save, sender=Cargo)
+def guardar_clave_resumen_previa(sender, instance, raw=False, **kwargs):
+    """Recuerda la combinación que tenía el cargo antes de guardarse"""
+    instance._clave_resumen_previa = None
+    if raw or not instance.pk:
+        return
+
+    previo = (
+        Cargo.objects.filter(pk=instance.pk)
+        .values_list("asignatura__departamento", "caracter", "dedicacion", "estado")
+        .first()
+    )
+    if previo:
+        instance._clave_resumen_previa = _clave_resumen(*previo)
+
+
+@receiver(post_save, sender=Cargo)
+def actualizar_resumen_al_guardar(sender, instance, raw=False, **kwargs):
+    """Actualiza incrementalmente el resumen de planta"""
+    if raw:
+        return
+
+    clave_previa = getattr(instance, "_clave_resumen_previa", None)
+    clave_nueva = _clave_resumen(
+        instance.asignatura.departamento_id,
+        instance.caracter,
+        instance.dedicacion,
+        instance.estado,
+    )
+    if clave_previa == clave_nueva:
+        return
+
+    if clave_previa:
+        ResumenPlanta.ajustar(*clave_previa, delta=-1)
+    if clave_nueva:
+        ResumenPlanta.ajustar(*clave_nueva, delta=1)
+
+
+@receiver(post_delete, sender=Cargo)
+def actualizar_resumen_al_eliminar(sender, instance, **kwargs):
+    """Descuenta el cargo eliminado del resumen de planta"""
+    departamento_id = (
+        Asignatura.objects.filter(pk=instance.asignatura_id)
+        .values_list("departamento", flat=True)
+        .first()
+    )
+    clave = _clave_resumen(
+        departamento_id, instance.caracter, instance.dedicacion, instance.estado
+    )
+    if clave and departamento_id:
+        ResumenPlanta.ajustar(*clave, delta=-1)
+
+
+@receiver(pre_save, sender=Asignatura)
+def guardar_departamento_previo(sender, instance, raw=False, **kwargs):
+    """Recuerda el departamento que tenía la asignatura antes de guardarse"""
+    instance._departamento_previo = None
+    if raw or not instance.pk:
+        return
+
+    instance._departamento_previo = (
+        Asignatura.objects.filter(pk=instance.pk)
+        .values_list("departamento", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Asignatura)
+def mover_resumen_al_cambiar_departamento(sender, instance, raw=False, **kwargs):
+    """Pasa los cargos activos de la asignatura al resumen del nuevo departamento"""
+    previo = getattr(instance, "_departamento_previo", None)
+    if raw or previo is None or previo == instance.departamento_id:
+        return
+
+    grupos = (
+        Cargo.objects.filter(asignatura=instance, estado="activo")
+        .values("caracter", "dedicacion")
+        .annotate(cantidad=Count("id"))
+        .order_by()
+    )
+    for grupo in grupos:
+        ResumenPlanta.ajustar(
+            previo, grupo["caracter"], grupo["dedicacion"], -grupo["cantidad"]
+        )
+        ResumenPlanta.ajustar(
+            instance.departamento_id,
+            grupo["caracter"],
+            grupo["dedicacion"],
+            grupo["cantidad"],
+        )
+    # ajustar usa update(), que no invalida las estadísticas del reporte
+    invalidar_modelo(ResumenPlanta)
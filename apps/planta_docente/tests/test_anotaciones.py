@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+import pytest
+from django.urls import reverse
+
+from apps.planta_docente.models import Asignatura, Docente, Resolucion
+from apps.usuarios.models import UserProfile
+
+
+@pytest.mark.django_db
+def test_cargos_activos_count_reutiliza_anotacion(
+    asignatura, crear_cargo, django_assert_num_queries
+):
+    crear_cargo()
+    crear_cargo()
+    crear_cargo(estado="baja")
+
+    with django_assert_num_queries(1):
+        asignaturas = list(Asignatura.objects.con_cargos_activos_count())
+        assert [a.cargos_activos_count for a in asignaturas] == [2]
+
+    with django_assert_num_queries(1):
+        docentes = list(Docente.objects.con_cargos_activos_count())
+        assert sorted(d.cargos_activos_count for d in docentes) == [0, 1, 1]
+
+
+@pytest.mark.django_db
+def test_cargos_activos_count_sin_anotacion_consulta(asignatura, crear_cargo):
+    crear_cargo()
+
+    assert Asignatura.objects.get(pk=asignatura.pk).cargos_activos_count == 1
+
+
+@pytest.mark.django_db
+def test_reporte_vencimientos_en_una_consulta(
+    client, admin_user, crear_cargo, django_assert_num_queries
+):
+    hoy = date.today()
+    crear_cargo(fecha_vencimiento=hoy - timedelta(days=5))
+    crear_cargo(fecha_vencimiento=hoy + timedelta(days=10))
+    crear_cargo(fecha_vencimiento=hoy + timedelta(days=60))
+    crear_cargo(fecha_vencimiento=hoy + timedelta(days=200))
+    UserProfile.objects.create(user=admin_user, es_superadmin=True)
+    client.force_login(admin_user)
+
+    # sesión + usuario + perfil + cargos
+    with django_assert_num_queries(4):
+        response = client.get(reverse("planta_docente:reporte_vencimientos"))
+
+    assert [len(response.context[k]) for k in ("vencidos", "proximos_30")] == [1, 1]
+    assert len(response.context["proximos_90"]) == 1
+
+
+@pytest.mark.django_db
+def test_resoluciones_anotan_cargos_por_estado(
+    client, admin_user, resolucion, crear_cargo, django_assert_max_num_queries
+):
+    crear_cargo()
+    crear_cargo()
+    crear_cargo(estado="licencia")
+    crear_cargo(estado="baja")
+    Resolucion.objects.create(
+        numero="7",
+        anio=2023,
+        objeto="baja",
+        origen="rector",
+        fecha_emision=date.today(),
+    )
+    UserProfile.objects.create(user=admin_user, es_superadmin=True)
+    client.force_login(admin_user)
+
+    # sesión + usuario + perfil + conteo + página, sin una consulta por fila
+    with django_assert_max_num_queries(5):
+        response = client.get(reverse("planta_docente:resolucion_list"))
+    primera = response.context["resoluciones"][0]
+    assert primera == resolucion
+    assert (primera.cargos_count, primera.cargos_activos_count) == (4, 2)
+    assert (primera.cargos_licencia_count, primera.cargos_baja_count) == (1, 1)
+
+    response = client.get(
+        reverse("planta_docente:resolucion_list"), {"anio": "2023", "origen": "rector"}
+    )
+    assert [r.numero for r in response.context["resoluciones"]] == ["7"]
+
+    response = client.get(reverse("admin:planta_docente_resolucion_changelist"))
+    assert response.status_code == 200
+    assert [r.cargos_activos_count for r in response.context["cl"].result_list] == [
+        2,
+        0,
+    ]
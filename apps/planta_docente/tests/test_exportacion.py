@@ -0,0 +1,108 @@
+import csv
+import io
+from datetime import date, datetime
+
+import pytest
+from django.urls import reverse
+
+from apps.planta_docente.models import Docente
+
+URL = reverse("planta_docente:reporte_planta_exportar")
+
+
+def _exportar(client):
+    respuesta = client.get(URL)
+    contenido = b"".join(respuesta.streaming_content).decode()
+    return respuesta, contenido
+
+
+@pytest.mark.django_db
+def test_exporta_los_cargos_activos_con_valores_legibles(
+    client, admin_user, crear_cargo
+):
+    crear_cargo(
+        caracter="interino",
+        categoria="profesor_adjunto",
+        dedicacion="exclusiva",
+        fecha_inicio=date(2024, 4, 1),
+        fecha_vencimiento=date(2025, 3, 31),
+    )
+    crear_cargo(estado="baja")
+    client.force_login(admin_user)
+
+    respuesta, contenido = _exportar(client)
+
+    assert respuesta["Content-Type"] == "text/csv; charset=utf-8"
+    assert contenido.startswith("﻿Departamento;Apellido;Nombre;")
+    encabezado, *filas = list(csv.reader(contenido[1:].splitlines(), delimiter=";"))
+    assert encabezado[-2:] == ["Fecha Inicio", "Vencimiento"]
+    (fila,) = filas
+    datos = dict(zip(encabezado, fila))
+    assert datos["Apellido"] == "Apellido1"
+    assert datos["Cargo"] == "Profesor Adjunto"
+    assert datos["Dedicación"] == "Exclusiva"
+    assert datos["Carácter"] == "Interino"
+    assert datos["Fecha Inicio"] == "01/04/2024"
+    assert datos["Vencimiento"] == "31/03/2025"
+    # Los valores nulos (el docente no tiene legajo) quedan vacíos
+    assert datos["Legajo"] == ""
+
+
+@pytest.mark.django_db
+def test_escapa_celdas_que_excel_tomaria_como_formula(client, admin_user, crear_cargo):
+    cargo = crear_cargo()
+    Docente.objects.filter(pk=cargo.docente_id).update(
+        apellido="=HYPERLINK(1)", nombre="@Ana"
+    )
+    client.force_login(admin_user)
+
+    _, contenido = _exportar(client)
+
+    fila = next(csv.reader(contenido.splitlines()[1:], delimiter=";"))
+    assert fila[1:3] == ["'=HYPERLINK(1)", "'@Ana"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("cargos", [1, 25])
+def test_cantidad_de_consultas_fija(
+    client, admin_user, crear_cargo, django_assert_num_queries, cargos
+):
+    for _ in range(cargos):
+        crear_cargo()
+    client.force_login(admin_user)
+
+    # Sesión, usuario y un único SELECT recorrido con iterator()
+    with django_assert_num_queries(3):
+        _, contenido = _exportar(client)
+    assert len(contenido.splitlines()) == cargos + 1
+
+
+@pytest.mark.django_db
+def test_exporta_xlsx_con_fechas_y_sin_formulas(
+    client, admin_user, crear_cargo, django_assert_num_queries
+):
+    openpyxl = pytest.importorskip("openpyxl")
+    cargo = crear_cargo(caracter="interino", fecha_vencimiento=date(2025, 3, 31))
+    Docente.objects.filter(pk=cargo.docente_id).update(apellido="=HYPERLINK(1)")
+    crear_cargo(estado="baja")
+    client.force_login(admin_user)
+
+    with django_assert_num_queries(3):
+        respuesta = client.get(URL, {"formato": "xlsx"})
+        contenido = b"".join(respuesta.streaming_content)
+
+    assert respuesta["Content-Disposition"].endswith('.xlsx"')
+    hoja = openpyxl.load_workbook(io.BytesIO(contenido)).active
+    encabezado, *filas = [list(fila) for fila in hoja.iter_rows()]
+    assert [celda.value for celda in encabezado][:3] == [
+        "Departamento",
+        "Apellido",
+        "Nombre",
+    ]
+    (fila,) = filas
+    datos = {titulo.value: celda for titulo, celda in zip(encabezado, fila)}
+    assert datos["Apellido"].value == "=HYPERLINK(1)"
+    assert datos["Apellido"].data_type == "s"
+    assert datos["Carácter"].value == "Interino"
+    assert datos["Vencimiento"].value == datetime(2025, 3, 31)
+    assert datos["Vencimiento"].number_format == "DD/MM/YYYY"
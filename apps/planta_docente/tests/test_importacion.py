@@ -0,0 +1,128 @@
+import io
+from datetime import date
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+from apps.planta_docente.importacion import importar_planta, leer_planilla
+from apps.planta_docente.models import Cargo, Docente, Resolucion, ResumenPlanta
+
+ENCABEZADO = (
+    "documento;apellido;nombre;fecha_nacimiento;legajo;asignatura;comision;"
+    "caracter;categoria;dedicacion;cantidad_horas;fecha_inicio;"
+    "resolucion_numero;resolucion_anio;resolucion_origen;resolucion_fecha\n"
+)
+
+
+def _planilla(*filas):
+    return io.BytesIO((ENCABEZADO + "".join(f"{fila}\n" for fila in filas)).encode())
+
+
+@pytest.mark.django_db
+def test_importa_planilla_en_lote(asignatura, resolucion, crear_cargo, departamento):
+    existente = crear_cargo().docente
+    filas = leer_planilla(
+        _planilla(
+            f"{existente.documento};Pérez;Juan;1980-01-01;;EST1;2;interino;"
+            "ayudante_diplomado;simple;10;01/04/2025;100;2024;decano;",
+            "40111222;Núñez;Ana;15/05/1990;L-1;EST1;1;regular;"
+            "profesor_adjunto;exclusiva;40;2025-04-01;7;2025;consejo_academico;"
+            "2025-03-20",
+            "40111222;Núñez;Ana;15/05/1990;L-1;EST1;3;regular;"
+            "profesor_adjunto;simple;10;2025-04-01;7;2025;consejo_academico;",
+        ),
+        "planta.csv",
+    )
+
+    resultado = importar_planta(filas, lote=2)
+
+    assert resultado.errores == []
+    assert resultado.cargos_creados == 3
+    assert resultado.docentes_creados == 1
+    assert resultado.docentes_actualizados == 1
+    assert resultado.resoluciones_creadas == 1
+
+    existente.refresh_from_db()
+    assert existente.apellido == "Pérez"
+    assert "perez" in existente.busqueda
+    nueva = Docente.objects.get(documento="40111222")
+    assert nueva.busqueda.startswith("nunez ana")
+
+    interino = Cargo.objects.get(docente=existente, comision="2")
+    assert interino.fecha_vencimiento == date(2026, 3, 31)
+    assert interino.resolucion_alta == resolucion
+    assert Resolucion.objects.get(numero="7").cargo_set.count() == 2
+    # bulk_create no dispara señales: el resumen se ajusta aparte
+    assert (
+        ResumenPlanta.objects.get(
+            departamento=departamento, caracter="regular", dedicacion="simple"
+        ).cantidad_cargos
+        == 2
+    )
+
+
+@pytest.mark.django_db
+def test_errores_por_fila_no_importan_nada(asignatura, resolucion, crear_cargo):
+    existente = crear_cargo(comision="1").docente
+    filas = leer_planilla(
+        _planilla(
+            # Repite el cargo activo de la base (regla de Cargo.clean)
+            f"{existente.documento};Apellido1;Nombre;1980-01-01;;EST1;1;regular;"
+            "profesor_adjunto;simple;10;2025-04-01;100;2024;decano;",
+            "40111222;Núñez;Ana;1990-05-15;;EST1;1;regular;"
+            "profesor_adjunto;simple;10;2025-04-01;100;2024;decano;",
+            # Repite el cargo activo de la fila anterior
+            "40111222;Núñez;Ana;1990-05-15;;EST1;1;regular;"
+            "profesor_adjunto;simple;10;2025-04-01;100;2024;decano;",
+            "40111223;Gómez;Luis;1990-05-15;;XXX;1;regular;"
+            "profesor_adjunto;simple;10;2025-04-01;100;2024;decano;",
+            "40111224;Gómez;Eva;1990-05-15;;EST1;1;eterno;"
+            "profesor_adjunto;simple;10;2025-04-01;100;2024;decano;",
+        ),
+        "planta.csv",
+    )
+
+    resultado = importar_planta(filas)
+
+    assert [numero for numero, _ in resultado.errores] == [2, 4, 5, 6]
+    assert "ya existe un cargo activo" in resultado.errores[0][1]
+    assert "no existe la asignatura" in resultado.errores[2][1]
+    assert Cargo.objects.count() == 1
+    assert not Docente.objects.filter(documento="40111222").exists()
+
+
+@pytest.mark.django_db
+def test_comando_importar_planta(tmp_path, asignatura, resolucion):
+    archivo = tmp_path / "planta.csv"
+    archivo.write_bytes(
+        _planilla(
+            "40111222;Núñez;Ana;1990-05-15;;EST1;1;regular;"
+            "profesor_adjunto;simple;10;2025-04-01;100;2024;decano;"
+        ).getvalue()
+    )
+
+    call_command("importar_planta", str(archivo), "--simular", stdout=io.StringIO())
+    assert not Cargo.objects.exists()
+
+    call_command("importar_planta", str(archivo), stdout=io.StringIO())
+    assert Cargo.objects.count() == 1
+
+    with pytest.raises(CommandError, match="no se importó nada"):
+        call_command("importar_planta", str(archivo), stderr=io.StringIO())
+
+
+@pytest.mark.django_db
+def test_admin_importar(admin_client, asignatura, resolucion):
+    url = reverse("admin:planta_docente_cargo_importar")
+    assert admin_client.get(url).status_code == 200
+
+    archivo = _planilla(
+        "40111222;Núñez;Ana;1990-05-15;;EST1;1;regular;"
+        "profesor_adjunto;simple;10;2025-04-01;100;2024;decano;"
+    )
+    archivo.name = "planta.csv"
+    respuesta = admin_client.post(url, {"archivo": archivo})
+
+    assert respuesta.status_code == 302
+    assert Cargo.objects.count() == 1
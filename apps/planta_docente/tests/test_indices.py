@@ -0,0 +1,72 @@
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.planta_docente.models import Asignatura
+from apps.usuarios.models import UserProfile
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="Los planes de ejecución se verifican sobre PostgreSQL",
+)
+
+
+def _consultas(ejecutar, patron):
+    """SQL de las consultas que ejecuta `ejecutar()` y coinciden con `patron`"""
+    with CaptureQueriesContext(connection) as contexto:
+        ejecutar()
+    consultas = [
+        consulta["sql"]
+        for consulta in contexto.captured_queries
+        if re.search(patron, consulta["sql"])
+    ]
+    assert consultas, f"Ninguna consulta coincide con {patron!r}"
+    return consultas
+
+
+def _plan(sql):
+    """Plan de ejecución sin seq scans (las tablas de prueba son mínimas)"""
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"EXPLAIN {sql}")
+        return "\n".join(fila[0] for fila in cursor.fetchall())
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "vista", ["planta_docente:dashboard", "planta_docente:reporte_vencimientos"]
+)
+def test_vencimientos_usan_indice_parcial(client, admin_user, crear_cargo, vista):
+    crear_cargo()
+    UserProfile.objects.create(user=admin_user, es_superadmin=True)
+    client.force_login(admin_user)
+
+    # Los listados ordenados por vencimiento (no los contadores agregados)
+    consultas = _consultas(
+        lambda: client.get(reverse(vista)),
+        r'ORDER BY "planta_docente_cargo"\."fecha_vencimiento"',
+    )
+
+    for sql in consultas:
+        assert "cargo_activo_vencimiento_idx" in _plan(sql)
+
+
+@pytest.mark.django_db
+def test_unicidad_de_cargo_activo_usa_indice(crear_cargo):
+    cargo = crear_cargo()
+
+    (sql,) = _consultas(cargo.clean, r'"comision" = ')
+
+    assert "cargo_activo_unicidad_idx" in _plan(sql)
+
+
+@pytest.mark.django_db
+def test_cargos_activos_por_asignatura_usan_indice(crear_cargo):
+    asignatura = Asignatura.objects.get(pk=crear_cargo().asignatura_id)
+
+    (sql,) = _consultas(lambda: asignatura.cargos_activos_count, r"COUNT\(")
+
+    assert "cargo_asignatura_estado_idx" in _plan(sql)
@@ -0,0 +1,112 @@
+import io
+from datetime import date
+
+import pytest
+from django.contrib.admin import helpers
+from django.core.management import call_command
+from django.urls import reverse
+
+from apps.planta_docente.models import Cargo, RenovacionCargo, Resolucion
+from apps.planta_docente.renovacion import renovar_interinos
+
+
+@pytest.fixture
+def prorroga():
+    return Resolucion.objects.create(
+        numero="300",
+        anio=2025,
+        objeto="prorroga",
+        origen="decano",
+        fecha_emision=date(2025, 3, 15),
+    )
+
+
+@pytest.mark.django_db
+def test_renueva_interinos_con_auditoria(
+    crear_cargo, prorroga, admin_user, django_assert_max_num_queries
+):
+    interinos = [crear_cargo(caracter="interino") for _ in range(5)]
+    regular = crear_cargo(caracter="regular")
+    baja = crear_cargo(caracter="interino", estado="baja")
+
+    # Una lectura, un INSERT y un UPDATE sin importar la cantidad de cargos
+    with django_assert_max_num_queries(5):
+        cantidad = renovar_interinos(Cargo.objects.all(), prorroga, usuario=admin_user)
+
+    assert cantidad == 5
+    assert set(
+        Cargo.objects.filter(fecha_vencimiento=date(2026, 3, 31)).values_list(
+            "pk", flat=True
+        )
+    ) == {cargo.pk for cargo in interinos}
+    regular.refresh_from_db()
+    baja.refresh_from_db()
+    assert regular.fecha_vencimiento != date(2026, 3, 31)
+    assert baja.fecha_vencimiento == date(2025, 3, 31)
+
+    renovacion = RenovacionCargo.objects.get(cargo=interinos[0])
+    assert renovacion.vencimiento_anterior == date(2025, 3, 31)
+    assert renovacion.usuario == admin_user
+
+    # Repetir con la misma resolución no vuelve a prorrogar
+    assert renovar_interinos(Cargo.objects.all(), prorroga) == 0
+
+
+@pytest.mark.django_db
+def test_solo_prorroga_los_cargos_bloqueados(crear_cargo, prorroga):
+    interino = crear_cargo(caracter="interino")
+    # Renovado antes por la misma resolución y vuelto a su vencimiento a mano
+    corregido = crear_cargo(caracter="interino")
+    RenovacionCargo.objects.create(
+        cargo=corregido,
+        resolucion=prorroga,
+        vencimiento_anterior=date(2025, 3, 31),
+        vencimiento_nuevo=date(2026, 3, 31),
+    )
+
+    assert renovar_interinos(Cargo.objects.all(), prorroga) == 1
+
+    interino.refresh_from_db()
+    corregido.refresh_from_db()
+    assert interino.fecha_vencimiento == date(2026, 3, 31)
+    assert corregido.fecha_vencimiento == date(2025, 3, 31)
+
+
+@pytest.mark.django_db
+def test_comando_renovar_interinos(crear_cargo, prorroga):
+    crear_cargo(caracter="interino")
+    crear_cargo(caracter="interino", fecha_inicio=date(2023, 4, 1))
+
+    call_command(
+        "renovar_interinos",
+        str(prorroga.pk),
+        "--vencimiento=2025-03-31",
+        stdout=io.StringIO(),
+    )
+
+    assert list(
+        Cargo.objects.order_by("fecha_vencimiento").values_list(
+            "fecha_vencimiento", flat=True
+        )
+    ) == [date(2024, 3, 31), date(2026, 3, 31)]
+
+
+@pytest.mark.django_db
+def test_accion_admin(admin_client, crear_cargo, prorroga):
+    cargo = crear_cargo(caracter="interino")
+    datos = {
+        "action": "renovar_interinos",
+        helpers.ACTION_CHECKBOX_NAME: [cargo.pk],
+    }
+    url = reverse("admin:planta_docente_cargo_changelist")
+
+    respuesta = admin_client.post(url, datos)
+    assert respuesta.status_code == 200
+    assert b"Renovar" in respuesta.content
+
+    respuesta = admin_client.post(
+        url, {**datos, "aplicar": "1", "resolucion": prorroga.pk}
+    )
+    assert respuesta.status_code == 302
+    cargo.refresh_from_db()
+    assert cargo.fecha_vencimiento == date(2026, 3, 31)
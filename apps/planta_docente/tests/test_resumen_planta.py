@@ -0,0 +1,75 @@
+import pytest
+
+from apps.core.models import Departamento
+from apps.planta_docente.models import ResumenPlanta
+
+
+def _cantidad(departamento, caracter, dedicacion):
+    fila = ResumenPlanta.objects.filter(
+        departamento=departamento, caracter=caracter, dedicacion=dedicacion
+    ).first()
+    return fila.cantidad_cargos if fila else 0
+
+
+@pytest.mark.django_db
+def test_alta_de_cargo_incrementa_resumen(departamento, crear_cargo):
+    crear_cargo(caracter="regular", dedicacion="exclusiva")
+    crear_cargo(caracter="regular", dedicacion="exclusiva")
+    crear_cargo(caracter="interino", dedicacion="simple")
+
+    assert _cantidad(departamento, "regular", "exclusiva") == 2
+    assert _cantidad(departamento, "interino", "simple") == 1
+
+
+@pytest.mark.django_db
+def test_cambios_y_bajas_ajustan_resumen(departamento, crear_cargo):
+    cargo = crear_cargo(caracter="regular", dedicacion="simple")
+
+    cargo.dedicacion = "semiexclusiva"
+    cargo.save()
+    assert _cantidad(departamento, "regular", "simple") == 0
+    assert _cantidad(departamento, "regular", "semiexclusiva") == 1
+
+    cargo.estado = "baja"
+    cargo.save()
+    assert _cantidad(departamento, "regular", "semiexclusiva") == 0
+
+    otro = crear_cargo(caracter="ordinario", dedicacion="exclusiva")
+    otro.delete()
+    assert _cantidad(departamento, "ordinario", "exclusiva") == 0
+
+
+@pytest.mark.django_db
+def test_reconstruir_coincide_con_mantenimiento_incremental(departamento, crear_cargo):
+    crear_cargo(caracter="regular", dedicacion="exclusiva")
+    crear_cargo(caracter="interino", dedicacion="simple")
+    incremental = ResumenPlanta.totales_por_departamento()
+
+    ResumenPlanta.objects.update(cantidad_cargos=0)
+    ResumenPlanta.reconstruir()
+
+    totales = ResumenPlanta.totales_por_departamento()[departamento.pk]
+    assert totales["total_cargos"] == 2
+    assert totales["total_cargos_reg"] == 1
+    assert totales["total_exclusivas_reg"] == 1
+    assert totales["total_simples"] == 1
+    assert totales == incremental[departamento.pk]
+
+
+@pytest.mark.django_db
+def test_mover_asignatura_de_departamento_mueve_sus_cargos(
+    departamento, asignatura, crear_cargo
+):
+    crear_cargo(caracter="regular", dedicacion="simple")
+    crear_cargo(caracter="regular", dedicacion="simple")
+    crear_cargo(caracter="regular", dedicacion="simple", estado="baja")
+    otro = Departamento.objects.create(nombre="Mecánica", codigo="MEC")
+
+    asignatura.departamento = otro
+    asignatura.save()
+    assert _cantidad(departamento, "regular", "simple") == 0
+    assert _cantidad(otro, "regular", "simple") == 2
+
+    asignatura.nombre = "Estabilidad II"
+    asignatura.save()
+    assert _cantidad(otro, "regular", "simple") == 2
@@ -60,6 +60,11 @@ urlpatterns = [
         views.ReportePlantaCompletaView.as_view(),
         name="reporte_planta",
     ),
+    path(
+        "reportes/planta-completa/exportar/",
+        views.ReportePlantaExportarView.as_view(),
+        name="reporte_planta_exportar",
+    ),
     path(
         "reportes/vencimientos/",
         views.ReporteVencimientosView.as_view(),
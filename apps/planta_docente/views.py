@@ -8,16 +8,23 @@ from django.views.generic import (
     UpdateView,
     DeleteView,
     TemplateView,
+    View,
 )
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse_lazy
 from django.db.models import Q, Count, Sum
 from django.contrib import messages
+from django.http import FileResponse, StreamingHttpResponse
+import csv
+import tempfile
 from datetime import date, timedelta
 
-from .models import Docente, Asignatura, Cargo, Resolucion
+from .models import Docente, Asignatura, Cargo, Resolucion, ResumenPlanta
 from .forms import DocenteForm, AsignaturaForm, CargoForm, ResolucionForm
-from apps.core.mixins import DepartamentoAccessMixin
+from apps.core.busqueda import filtrar_busqueda
+from apps.core.cache import alcance_usuario, estadisticas_cacheadas
+from apps.core.mixins import DepartamentoAccessMixin, RespuestaCondicionalMixin
+from apps.core.paginacion import PaginacionKeysetMixin
 
 
 class PlantaDocenteDashboardView(LoginRequiredMixin, TemplateView):
@@ -35,17 +42,30 @@ class PlantaDocenteDashboardView(LoginRequiredMixin, TemplateView):
                 cargos = Cargo.objects.all()
             else:
                 cargos = Cargo.objects.filter(
-                    asignatura__departamento__in=user.profile.departamentos.all()
+                    asignatura__departamento_id__in=user.profile.departamentos_ids
                 )
         else:
             cargos = Cargo.objects.none()
 
-        # Estadísticas
-        context["total_docentes"] = cargos.values("docente").distinct().count()
-        context["cargos_activos"] = cargos.filter(estado="activo").count()
-        context["cargos_por_vencer"] = cargos.filter(
-            estado="activo", fecha_vencimiento__lte=date.today() + timedelta(days=90)
-        ).count()
+        # Estadísticas (una sola consulta, cacheada por alcance del usuario)
+        context.update(
+            estadisticas_cacheadas(
+                "planta_docente",
+                [Cargo],
+                lambda: cargos.aggregate(
+                    total_docentes=Count("docente", distinct=True),
+                    cargos_activos=Count("id", filter=Q(estado="activo")),
+                    cargos_por_vencer=Count(
+                        "id",
+                        filter=Q(
+                            estado="activo",
+                            fecha_vencimiento__lte=date.today() + timedelta(days=90),
+                        ),
+                    ),
+                ),
+                alcance=alcance_usuario(user),
+            )
+        )
 
         # Cargos próximos a vencer
         context["vencimientos_proximos"] = (
@@ -60,41 +80,46 @@ class PlantaDocenteDashboardView(LoginRequiredMixin, TemplateView):
         return context
 
 
-class DocenteListView(LoginRequiredMixin, ListView):
+class DocenteListView(
+    LoginRequiredMixin, RespuestaCondicionalMixin, PaginacionKeysetMixin, ListView
+):
     """Lista de docentes con búsqueda y filtros"""
 
     model = Docente
     template_name = "planta_docente/docente_list.html"
     context_object_name = "docentes"
     paginate_by = 20
+    conteo_aproximado = True
+    campos_modificacion = ["fecha_modificacion", "cargos__fecha_modificacion"]
 
     def get_queryset(self):
-        queryset = Docente.objects.all()
+        queryset = Docente.objects.con_cargos_activos_count()
 
         # Búsqueda
         search = self.request.GET.get("search")
         if search:
-            queryset = queryset.filter(
-                Q(apellido__icontains=search)
-                | Q(nombre__icontains=search)
-                | Q(documento__icontains=search)
-                | Q(legajo__icontains=search)
-            )
+            queryset = filtrar_busqueda(queryset, search)
 
         return queryset.order_by("apellido", "nombre")
 
 
-class DocenteDetailView(LoginRequiredMixin, DetailView):
+class DocenteDetailView(LoginRequiredMixin, RespuestaCondicionalMixin, DetailView):
     """Detalle de un docente"""
 
     model = Docente
     template_name = "planta_docente/docente_detail.html"
     context_object_name = "docente"
+    campos_modificacion = [
+        "fecha_modificacion",
+        "correos__fecha_modificacion",
+        "cargos__fecha_modificacion",
+        "cargos__asignatura__fecha_modificacion",
+    ]
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["cargos"] = self.object.cargos.select_related(
-            "asignatura", "resolucion_alta"
+            "asignatura__carrera", "resolucion_alta"
         ).order_by("-fecha_inicio")
         return context
 
@@ -136,6 +161,9 @@ class DocenteDeleteView(LoginRequiredMixin, DeleteView):
     template_name = "planta_docente/docente_confirm_delete.html"
     success_url = reverse_lazy("planta_docente:docente_list")
 
+    def get_queryset(self):
+        return Docente.objects.con_cargos_activos_count()
+
     def delete(self, request, *args, **kwargs):
         messages.success(request, "Docente eliminado exitosamente.")
         return super().delete(request, *args, **kwargs)
@@ -150,7 +178,9 @@ class AsignaturaListView(LoginRequiredMixin, ListView):
     paginate_by = 20
 
     def get_queryset(self):
-        queryset = Asignatura.objects.select_related("departamento", "carrera")
+        queryset = Asignatura.objects.select_related(
+            "departamento", "carrera"
+        ).con_cargos_activos_count()
 
         # Filtros
         departamento = self.request.GET.get("departamento")
@@ -206,17 +236,18 @@ class AsignaturaUpdateView(LoginRequiredMixin, UpdateView):
         )
 
 
-class CargoListView(LoginRequiredMixin, ListView):
+class CargoListView(LoginRequiredMixin, PaginacionKeysetMixin, ListView):
     """Lista de cargos"""
 
     model = Cargo
     template_name = "planta_docente/cargo_list.html"
     context_object_name = "cargos"
     paginate_by = 20
+    conteo_aproximado = True
 
     def get_queryset(self):
         queryset = Cargo.objects.select_related(
-            "docente", "asignatura", "resolucion_alta"
+            "docente", "asignatura__carrera", "resolucion_alta"
         )
 
         # Filtros
@@ -234,6 +265,11 @@ class CargoDetailView(LoginRequiredMixin, DetailView):
     template_name = "planta_docente/cargo_detail.html"
     context_object_name = "cargo"
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["renovaciones"] = self.object.renovaciones.select_related("resolucion")
+        return context
+
 
 class CargoCreateView(LoginRequiredMixin, CreateView):
     """Crear nuevo cargo"""
@@ -284,7 +320,27 @@ class ResolucionListView(LoginRequiredMixin, ListView):
     paginate_by = 20
 
     def get_queryset(self):
-        return Resolucion.objects.all().order_by("-anio", "-numero")
+        queryset = Resolucion.objects.con_cargos_count()
+
+        # Filtros
+        anio = self.request.GET.get("anio", "")
+        origen = self.request.GET.get("origen")
+        objeto = self.request.GET.get("objeto")
+
+        if anio.isdigit():
+            queryset = queryset.filter(anio=anio)
+        if origen:
+            queryset = queryset.filter(origen=origen)
+        if objeto:
+            queryset = queryset.filter(objeto=objeto)
+
+        return queryset.order_by("-anio", "-numero")
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["origenes"] = Resolucion.ORIGEN_CHOICES
+        context["objetos"] = Resolucion.OBJETO_CHOICES
+        return context
 
 
 class ResolucionCreateView(LoginRequiredMixin, CreateView):
@@ -304,96 +360,185 @@ class ReportePlantaCompletaView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # Queryset base que usaremos para todo
-        cargos_qs = Cargo.objects.filter(estado="activo")
+        # Totales cacheados hasta que cambie algún cargo
+        context.update(
+            estadisticas_cacheadas(
+                "reporte_planta", [Cargo, ResumenPlanta], self.estadisticas
+            )
+        )
 
-        # --- 1. CÁLCULO DE TOTALES POR DEPARTAMENTO (LA MAGIA DE ANNOTATE) ---
-        # Agrupamos por departamento y calculamos todos los totales para cada uno en una sola consulta.
-        resumen_por_departamento = (
-            cargos_qs.values(
-                "asignatura__departamento__pk",  # Usamos el ID para búsquedas
-                "asignatura__departamento__nombre",  # y el nombre para mostrar
+        # Lista completa de cargos para la tabla detallada.
+        # El queryset es perezoso: si el template sirve la tabla desde la caché
+        # de fragmentos, la consulta no llega a ejecutarse.
+        context["cargos"] = (
+            Cargo.objects.filter(estado="activo")
+            .select_related(
+                "docente",
+                "asignatura",
+                "asignatura__departamento",
+                "asignatura__carrera",
             )
-            .annotate(
-                total_cargos=Count("id"),
-                total_cargos_reg=Count(
-                    "id", filter=Q(caracter__in=["regular", "concursado"])
-                ),
-                total_exclusivas=Count("id", filter=Q(dedicacion="exclusiva")),
-                total_exclusivas_reg=Count(
-                    "id",
-                    filter=Q(
-                        dedicacion="exclusiva", caracter__in=["regular", "concursado"]
-                    ),
-                ),
-                # Ajustado a 'semidedicacion'
-                total_semis=Count("id", filter=Q(dedicacion="semidedicacion")),
-                total_semis_reg=Count(
-                    "id",
-                    filter=Q(
-                        dedicacion="semidedicacion",
-                        caracter__in=["regular", "concursado"],
-                    ),
-                ),
-                total_simples=Count("id", filter=Q(dedicacion="simple")),
-                total_simples_reg=Count(
-                    "id",
-                    filter=Q(
-                        dedicacion="simple", caracter__in=["regular", "concursado"]
-                    ),
-                ),
+            .order_by(
+                "asignatura__departamento__nombre",
+                "docente__apellido",
+                "docente__nombre",
             )
-            .order_by("asignatura__departamento__nombre")
         )
 
-        # Convertimos la lista de resultados en un diccionario para buscar fácilmente en el template
-        # La llave será el ID del departamento
-        context["resumen_por_depto_dict"] = {
-            item["asignatura__departamento__pk"]: item
-            for item in resumen_por_departamento
+        return context
+
+    @staticmethod
+    def estadisticas():
+        # --- 1. TOTALES POR DEPARTAMENTO (RESUMEN MATERIALIZADO) ---
+        # Se leen de ResumenPlanta, que se mantiene al guardar/eliminar cargos,
+        # en lugar de agregar toda la tabla de cargos en cada carga.
+        resumen_por_depto = ResumenPlanta.totales_por_departamento()
+
+        # --- 2. TOTALES GENERALES ---
+        resumen_general = {
+            clave: 0
+            for clave in (
+                "total_cargos",
+                "total_cargos_reg",
+                "total_exclusivas",
+                "total_exclusivas_reg",
+                "total_semis",
+                "total_semis_reg",
+                "total_simples",
+                "total_simples_reg",
+            )
+        }
+        for totales in resumen_por_depto.values():
+            for clave in resumen_general:
+                resumen_general[clave] += totales[clave]
+
+        return {
+            "resumen_por_depto_dict": resumen_por_depto,
+            "resumen_general": resumen_general,
+            "total_docentes": Cargo.objects.filter(estado="activo")
+            .values("docente")
+            .distinct()
+            .count(),
+            "total_departamentos": len(resumen_por_depto),
         }
 
-        # --- 2. CÁLCULO DE TOTALES GENERALES (COMO YA LO TENÍAS) ---
-        # Usamos la misma lógica que ya tenías para el resumen general.
-        resumen_general = cargos_qs.aggregate(
-            total_cargos=Count("id"),
-            total_cargos_reg=Count(
-                "id", filter=Q(caracter__in=["regular", "concursado"])
-            ),
-            total_exclusivas=Count("id", filter=Q(dedicacion="exclusiva")),
-            total_exclusivas_reg=Count(
-                "id",
-                filter=Q(
-                    dedicacion="exclusiva", caracter__in=["regular", "concursado"]
-                ),
-            ),
-            total_semis=Count("id", filter=Q(dedicacion="semidedicacion")),
-            total_semis_reg=Count(
-                "id",
-                filter=Q(
-                    dedicacion="semidedicacion", caracter__in=["regular", "concursado"]
+
+class _Echo:
+    """Pseudo-buffer que devuelve lo escrito, para usar csv.writer en streaming"""
+
+    def write(self, value):
+        return value
+
+
+# Excel interpreta como fórmula una celda que empieza con estos caracteres
+_INICIOS_FORMULA = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _celda_csv(valor):
+    """Fecha dd/mm/AAAA y texto a salvo de inyección de fórmulas"""
+    if isinstance(valor, date):
+        return valor.strftime("%d/%m/%Y")
+    if isinstance(valor, str) and valor.startswith(_INICIOS_FORMULA):
+        return "'" + valor
+    return valor
+
+
+class ReportePlantaExportarView(LoginRequiredMixin, View):
+    """Exportación de la planta docente completa: CSV en streaming o ?formato=xlsx"""
+
+    chunk_size = 2000
+
+    columnas = [
+        ("asignatura__departamento__nombre", "Departamento"),
+        ("docente__apellido", "Apellido"),
+        ("docente__nombre", "Nombre"),
+        ("docente__legajo", "Legajo"),
+        ("asignatura__nombre", "Asignatura"),
+        ("asignatura__carrera__nombre", "Carrera"),
+        ("comision", "Comisión"),
+        ("categoria", "Cargo"),
+        ("dedicacion", "Dedicación"),
+        ("cantidad_horas", "Horas"),
+        ("caracter", "Carácter"),
+        ("fecha_inicio", "Fecha Inicio"),
+        ("fecha_vencimiento", "Vencimiento"),
+    ]
+
+    def get(self, request, *args, **kwargs):
+        nombre = f"planta_docente_{date.today():%Y%m%d}"
+        if request.GET.get("formato") == "xlsx":
+            return FileResponse(
+                self.archivo_xlsx(),
+                as_attachment=True,
+                filename=f"{nombre}.xlsx",
+                content_type=(
+                    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                 ),
-            ),
-            total_simples=Count("id", filter=Q(dedicacion="simple")),
-            total_simples_reg=Count(
-                "id",
-                filter=Q(dedicacion="simple", caracter__in=["regular", "concursado"]),
-            ),
-        )
-        context["resumen_general"] = resumen_general
-        context["total_docentes"] = cargos_qs.values("docente").distinct().count()
-        context["total_departamentos"] = (
-            cargos_qs.values("asignatura__departamento").distinct().count()
+            )
+        response = StreamingHttpResponse(
+            self.filas_csv(), content_type="text/csv; charset=utf-8"
         )
-
-        # --- 3. PASAMOS LA LISTA COMPLETA DE CARGOS PARA LA TABLA DETALLADA ---
-        context["cargos"] = cargos_qs.select_related(
-            "docente", "asignatura", "asignatura__departamento", "asignatura__carrera"
-        ).order_by(
-            "asignatura__departamento__nombre", "docente__apellido", "docente__nombre"
+        response["Content-Disposition"] = f'attachment; filename="{nombre}.csv"'
+        return response
+
+    def filas(self):
+        """Cargos activos con los valores legibles de las opciones"""
+        displays = {
+            "categoria": dict(Cargo.CATEGORIA_CHOICES),
+            "dedicacion": dict(Cargo.DEDICACION_CHOICES),
+            "caracter": dict(Cargo.CARACTER_CHOICES),
+        }
+        campos = [campo for campo, _ in self.columnas]
+        indices_display = [
+            (campos.index(campo), opciones) for campo, opciones in displays.items()
+        ]
+
+        filas = (
+            Cargo.objects.filter(estado="activo")
+            .order_by(
+                "asignatura__departamento__nombre",
+                "docente__apellido",
+                "docente__nombre",
+            )
+            .values_list(*campos)
         )
-
-        return context
+        for fila in filas.iterator(chunk_size=self.chunk_size):
+            fila = list(fila)
+            for indice, opciones in indices_display:
+                fila[indice] = opciones.get(fila[indice], fila[indice])
+            yield fila
+
+    def filas_csv(self):
+        writer = csv.writer(_Echo(), delimiter=";")
+        # BOM para que Excel detecte UTF-8
+        yield "\ufeff" + writer.writerow([titulo for _, titulo in self.columnas])
+        for fila in self.filas():
+            yield writer.writerow(_celda_csv(valor) for valor in fila)
+
+    def archivo_xlsx(self):
+        """Libro en modo write-only: las filas se vuelcan a disco a medida que llegan"""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+
+        libro = Workbook(write_only=True)
+        hoja = libro.create_sheet("Planta docente")
+        hoja.append([titulo for _, titulo in self.columnas])
+        for fila in self.filas():
+            celdas = []
+            for valor in fila:
+                celda = WriteOnlyCell(hoja, value=valor)
+                if isinstance(valor, date):
+                    celda.number_format = "DD/MM/YYYY"
+                elif celda.data_type == "f":
+                    # Texto que empieza con "=": se guarda como texto, no como fórmula
+                    celda.data_type = "s"
+                celdas.append(celda)
+            hoja.append(celdas)
+
+        archivo = tempfile.TemporaryFile()
+        libro.save(archivo)
+        archivo.seek(0)
+        return archivo
 
 
 class ReporteVencimientosView(LoginRequiredMixin, TemplateView):
@@ -405,21 +550,28 @@ class ReporteVencimientosView(LoginRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
 
         hoy = date.today()
+        limite_30 = hoy + timedelta(days=30)
+
+        # Una sola consulta (índice parcial de vencimientos) y agrupado en memoria
+        cargos = (
+            Cargo.objects.filter(
+                estado="activo", fecha_vencimiento__lte=hoy + timedelta(days=90)
+            )
+            .select_related("docente", "asignatura", "resolucion_alta")
+            .order_by("fecha_vencimiento")
+        )
+
+        vencidos, proximos_30, proximos_90 = [], [], []
+        for cargo in cargos:
+            if cargo.fecha_vencimiento < hoy:
+                vencidos.append(cargo)
+            elif cargo.fecha_vencimiento <= limite_30:
+                proximos_30.append(cargo)
+            else:
+                proximos_90.append(cargo)
 
-        context["vencidos"] = Cargo.objects.filter(
-            estado="activo", fecha_vencimiento__lt=hoy
-        ).select_related("docente", "asignatura")
-
-        context["proximos_30"] = Cargo.objects.filter(
-            estado="activo",
-            fecha_vencimiento__gte=hoy,
-            fecha_vencimiento__lte=hoy + timedelta(days=30),
-        ).select_related("docente", "asignatura")
-
-        context["proximos_90"] = Cargo.objects.filter(
-            estado="activo",
-            fecha_vencimiento__gt=hoy + timedelta(days=30),
-            fecha_vencimiento__lte=hoy + timedelta(days=90),
-        ).select_related("docente", "asignatura")
+        context["vencidos"] = vencidos
+        context["proximos_30"] = proximos_30
+        context["proximos_90"] = proximos_90
 
         return context
@@ -1,8 +1,9 @@
 from django.db import models
-from django.core.mail import send_mail
-from django.conf import settings
 from datetime import date
 
+from apps.core.correo import encolar_correos
+from apps.planta_docente.models import Correo
+
 
 class EtiquetaPS(models.Model):
     """Etiquetas para clasificar prácticas supervisadas"""
@@ -63,8 +64,7 @@ class PSolicitud(models.Model):
         return f"PS {self.id} - {self.estudiante} - {self.tema}"
 
     def notificar_jurados(self, tipo="plan"):
-        """Notifica a los jurados sobre nueva documentación"""
-        jurados = self.jurados.all()
+        """Encola un aviso a los jurados sobre nueva documentación"""
         asunto = f"Nueva documentación - Práctica Supervisada: {self.tema}"
 
         if tipo == "plan":
@@ -72,19 +72,10 @@ class PSolicitud(models.Model):
         else:
             mensaje = f"Se ha cargado el informe final para la práctica supervisada '{self.tema}'."
 
-        for jurado in jurados:
-            if (
-                jurado.docente
-                and jurado.docente.correos.filter(es_principal=True).exists()
-            ):
-                email = jurado.docente.correos.get(es_principal=True).email
-                send_mail(
-                    asunto,
-                    mensaje,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [email],
-                    fail_silently=True,
-                )
+        emails = Correo.objects.filter(
+            docente__juradops__solicitud=self, es_principal=True
+        ).values_list("email", flat=True)
+        return encolar_correos(asunto, mensaje, emails)
 
 
 class JuradoPS(models.Model):
@@ -0,0 +1,115 @@
+import pytest
+from datetime import date, timedelta
+from django.core import mail
+from django.utils import timezone
+
+from apps.core.correo import enviar_pendientes
+from apps.core.models import CorreoPendiente
+from apps.planta_docente.models import Correo, Docente
+from apps.practica_supervisada.models import JuradoPS, PSolicitud
+
+
+@pytest.fixture
+def solicitud_ps(estudiante):
+    tutor = Docente.objects.create(
+        apellido="Tutor", nombre="Ana", documento="1", fecha_nacimiento=date(1970, 1, 1)
+    )
+    solicitud = PSolicitud.objects.create(
+        estudiante=estudiante, tutor=tutor, tema="Puentes", plan_trabajo="plan.pdf"
+    )
+    for numero in range(3):
+        docente = Docente.objects.create(
+            apellido=f"Jurado{numero}",
+            nombre="Luis",
+            documento=f"2{numero}",
+            fecha_nacimiento=date(1970, 1, 1),
+        )
+        Correo.objects.create(
+            docente=docente, email=f"jurado{numero}@utn.edu.ar", es_principal=True
+        )
+        Correo.objects.create(docente=docente, email=f"otro{numero}@utn.edu.ar")
+        JuradoPS.objects.create(solicitud=solicitud, docente=docente)
+    JuradoPS.objects.create(solicitud=solicitud, nombre_externo="Externo")
+    return solicitud
+
+
+@pytest.mark.django_db
+def test_notificar_jurados_encola_sin_enviar(solicitud_ps, django_assert_num_queries):
+    with django_assert_num_queries(2):
+        solicitud_ps.notificar_jurados()
+
+    assert mail.outbox == []
+    assert sorted(CorreoPendiente.objects.values_list("destinatario", flat=True)) == [
+        "jurado0@utn.edu.ar",
+        "jurado1@utn.edu.ar",
+        "jurado2@utn.edu.ar",
+    ]
+
+
+@pytest.mark.django_db
+def test_enviar_pendientes_despacha_y_reintenta(solicitud_ps, monkeypatch):
+    solicitud_ps.notificar_jurados(tipo="informe")
+
+    assert enviar_pendientes() == (3, 0)
+    assert len(mail.outbox) == 3
+    assert "informe final" in mail.outbox[0].body
+    assert not CorreoPendiente.objects.exclude(estado="enviado").exists()
+
+    def fallar(self, mensajes):
+        raise OSError("SMTP no disponible")
+
+    monkeypatch.setattr(
+        "django.core.mail.backends.locmem.EmailBackend.send_messages", fallar
+    )
+    solicitud_ps.notificar_jurados()
+
+    assert enviar_pendientes() == (0, 3)
+    correo = CorreoPendiente.objects.filter(estado="pendiente").first()
+    assert correo.intentos == 1
+    assert correo.proximo_intento > timezone.now()
+    assert "SMTP no disponible" in correo.ultimo_error
+    # Hasta que venza la espera no se vuelve a intentar
+    assert enviar_pendientes() == (0, 0)
+
+
+@pytest.mark.django_db
+def test_reserva_los_correos_antes_de_enviarlos(solicitud_ps, monkeypatch):
+    solicitud_ps.notificar_jurados()
+    durante_el_envio = []
+
+    def enviar(self, mensajes):
+        # Reservados y visibles para otros procesos: nadie más los toma
+        durante_el_envio.append(
+            (
+                CorreoPendiente.objects.filter(estado="enviando").count(),
+                enviar_pendientes(),
+            )
+        )
+        return len(mensajes)
+
+    monkeypatch.setattr(
+        "django.core.mail.backends.locmem.EmailBackend.send_messages", enviar
+    )
+
+    assert enviar_pendientes() == (3, 0)
+    assert durante_el_envio[0] == (3, (0, 0))
+    assert set(CorreoPendiente.objects.values_list("estado", flat=True)) == {"enviado"}
+
+
+@pytest.mark.django_db
+def test_reserva_vencida_vuelve_a_la_cola(solicitud_ps, settings):
+    solicitud_ps.notificar_jurados()
+    vencida = timezone.now() - timedelta(seconds=1)
+    # Un proceso que murió enviando deja los correos reservados
+    CorreoPendiente.objects.update(
+        estado="enviando", intentos=1, proximo_intento=vencida
+    )
+    agotado = CorreoPendiente.objects.first()
+    CorreoPendiente.objects.filter(pk=agotado.pk).update(
+        intentos=settings.CORREO_MAX_INTENTOS
+    )
+
+    assert enviar_pendientes() == (2, 0)
+    agotado.refresh_from_db()
+    assert agotado.estado == "fallido"
+    assert CorreoPendiente.objects.filter(estado="enviado", intentos=2).count() == 2
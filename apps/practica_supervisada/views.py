@@ -7,11 +7,12 @@ from django.views.generic import (
 )
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse_lazy
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.contrib import messages
 
 from .models import PSolicitud, JuradoPS, EtiquetaPS
 from .forms import PSolicitudForm, JuradoPSForm, DictamenPlanForm, DictamenInformeForm
+from apps.core.cache import estadisticas_cacheadas
 
 
 class PracticaSupervisadaDashboardView(LoginRequiredMixin, TemplateView):
@@ -22,16 +23,23 @@ class PracticaSupervisadaDashboardView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        context["total_solicitudes"] = PSolicitud.objects.count()
-        context["en_proceso"] = PSolicitud.objects.filter(
-            estado_general="en proceso"
-        ).count()
-        context["completadas"] = PSolicitud.objects.filter(
-            estado_general="completada"
-        ).count()
-        context["pendientes_dictamen"] = PSolicitud.objects.filter(
-            estado_general__in=["en proceso", "informe_presentado"]
-        ).count()
+        context.update(
+            estadisticas_cacheadas(
+                "practica_supervisada",
+                [PSolicitud],
+                lambda: PSolicitud.objects.aggregate(
+                    total_solicitudes=Count("id"),
+                    en_proceso=Count("id", filter=Q(estado_general="en_proceso")),
+                    completadas=Count("id", filter=Q(estado_general="completada")),
+                    pendientes_dictamen=Count(
+                        "id",
+                        filter=Q(
+                            estado_general__in=["en_proceso", "informe_presentado"]
+                        ),
+                    ),
+                ),
+            )
+        )
 
         context["solicitudes_recientes"] = PSolicitud.objects.select_related(
             "estudiante", "tutor"
@@ -74,7 +82,7 @@ class PSolicitudDetailView(LoginRequiredMixin, DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["jurados"] = self.object.jurados.all()
+        context["jurados"] = self.object.jurados.select_related("docente")
         return context
 
 
@@ -1,5 +1,11 @@
+from functools import cached_property
+
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import m2m_changed, post_delete
+from django.dispatch import receiver
 
 
 class UserProfile(models.Model):
@@ -21,8 +27,59 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"Perfil de {self.user.username}"
 
+    @staticmethod
+    def cache_key_departamentos(profile_id):
+        return f"usuarios:perfil:{profile_id}:departamentos"
+
+    @cached_property
+    def departamentos_ids(self):
+        """IDs de departamentos asignados, consultados una vez por request"""
+        timeout = settings.DEPARTAMENTOS_CACHE_TIMEOUT
+        key = self.cache_key_departamentos(self.pk)
+        if timeout:
+            ids = cache.get(key)
+            if ids is not None:
+                return ids
+
+        ids = frozenset(self.departamentos.values_list("id", flat=True))
+        if timeout:
+            cache.set(key, ids, timeout)
+        return ids
+
+    def invalidar_departamentos(self):
+        """Descarta los IDs de departamentos cacheados"""
+        self.__dict__.pop("departamentos_ids", None)
+        cache.delete(self.cache_key_departamentos(self.pk))
+
     def tiene_acceso_departamento(self, departamento):
         """Verifica si el usuario tiene acceso a un departamento"""
         if self.es_superadmin:
             return True
-        return self.departamentos.filter(id=departamento.id).exists()
+        return departamento.id in self.departamentos_ids
+
+
+@receiver(m2m_changed, sender=UserProfile.departamentos.through)
+def invalidar_departamentos_perfil(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalida la caché de departamentos al modificar la asignación"""
+    if action not in ("pre_clear", "post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        if action != "pre_clear":
+            instance.invalidar_departamentos()
+        return
+
+    # Cambio desde el lado del departamento: instance es un Departamento
+    if action == "pre_clear":
+        instance._perfiles_a_invalidar = list(
+            instance.usuarios.values_list("pk", flat=True)
+        )
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_perfiles_a_invalidar", [])
+    cache.delete_many([UserProfile.cache_key_departamentos(pk) for pk in pk_set])
+
+
+@receiver(post_delete, sender=UserProfile)
+def invalidar_departamentos_perfil_eliminado(sender, instance, **kwargs):
+    cache.delete(UserProfile.cache_key_departamentos(instance.pk))
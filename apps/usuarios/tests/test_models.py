@@ -40,3 +40,20 @@ def test_superadmin_tiene_acceso_a_todo():
 
     # Aunque no tenga asignado el departamento, debe tener acceso
     assert perfil.tiene_acceso_departamento(dep) is True
+
+
+@pytest.mark.django_db
+def test_acceso_departamento_consulta_una_sola_vez(django_assert_num_queries):
+    user = User.objects.create_user(username="lucia", password="abcd")
+    perfil = UserProfile.objects.create(user=user)
+    civil = Departamento.objects.create(nombre="Civil")
+    mecanica = Departamento.objects.create(nombre="Mecánica")
+    perfil.departamentos.add(civil)
+
+    with django_assert_num_queries(1):
+        assert perfil.tiene_acceso_departamento(civil) is True
+        assert perfil.tiene_acceso_departamento(mecanica) is False
+
+    # Modificar la asignación invalida lo cacheado
+    perfil.departamentos.add(mecanica)
+    assert perfil.tiene_acceso_departamento(mecanica) is True
@@ -52,9 +52,12 @@ INSTALLED_APPS = [
     "apps.equivalencias",
     "apps.practica_supervisada",
     "apps.carrera_academica",
+    "apps.api",
 ]
 
 MIDDLEWARE = [
+    # Primero, para incluir las consultas de sesión y autenticación
+    "apps.core.perfilado.PerfiladoMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -167,6 +170,19 @@ EMAIL_USE_TLS = config("EMAIL_USE_TLS", default=True, cast=bool)
 EMAIL_HOST_USER = config("EMAIL_HOST_USER", default="")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD", default="")
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", default="noreply@example.com")
+# Reintentos de la bandeja de salida (manage.py enviar_correos_pendientes)
+CORREO_MAX_INTENTOS = config("CORREO_MAX_INTENTOS", default=5, cast=int)
+CORREO_BACKOFF_SEGUNDOS = config("CORREO_BACKOFF_SEGUNDOS", default=60, cast=int)
+# Segundos tras los que un correo reservado y no confirmado vuelve a la cola
+CORREO_RESERVA_SEGUNDOS = config("CORREO_RESERVA_SEGUNDOS", default=300, cast=int)
+
+# Cola de tareas en segundo plano (manage.py run_worker)
+TAREAS_CONCURRENCIA = config("TAREAS_CONCURRENCIA", default=4, cast=int)
+TAREAS_VISIBILIDAD_SEGUNDOS = config(
+    "TAREAS_VISIBILIDAD_SEGUNDOS", default=300, cast=int
+)
+TAREAS_MAX_INTENTOS = config("TAREAS_MAX_INTENTOS", default=3, cast=int)
+TAREAS_BACKOFF_SEGUNDOS = config("TAREAS_BACKOFF_SEGUNDOS", default=30, cast=int)
 
 # Security Settings
 if not DEBUG:
@@ -188,8 +204,8 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
-    "PAGE_SIZE": 20,
+    "DEFAULT_PAGINATION_CLASS": "apps.api.pagination.CursorPaginacion",
+    "PAGE_SIZE": 100,
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
         "rest_framework.filters.SearchFilter",
@@ -231,6 +247,63 @@ LOGGING = {
     },
 }
 
+# Caché: "file" (por defecto) se comparte entre los procesos del servidor, y con
+# ella los contadores de versión que invalidan estadísticas y fragmentos.
+# "locmem" es local a cada proceso: una escritura sólo invalida la caché del
+# proceso que la hizo, así que sirve sólo con un único proceso
+CACHE_BACKEND = config("CACHE_BACKEND", default="file")
+CACHES = {
+    "default": {
+        "BACKEND": {
+            "locmem": "django.core.cache.backends.locmem.LocMemCache",
+            "file": "django.core.cache.backends.filebased.FileBasedCache",
+        }[CACHE_BACKEND],
+        "LOCATION": config(
+            "CACHE_LOCATION",
+            default=(
+                str(BASE_DIR / "cache")
+                if CACHE_BACKEND == "file"
+                else "gestion-academica"
+            ),
+        ),
+        "OPTIONS": {
+            "MAX_ENTRIES": config("CACHE_MAX_ENTRIES", default=1000, cast=int),
+        },
+    }
+}
+
+# Segundos que se cachean entre requests los departamentos de cada usuario
+# (0 = solo se cachean durante el request)
+DEPARTAMENTOS_CACHE_TIMEOUT = config("DEPARTAMENTOS_CACHE_TIMEOUT", default=0, cast=int)
+
+# Segundos que se cachean las estadísticas de los dashboards (0 = sin caché)
+DASHBOARD_CACHE_TIMEOUT = config("DASHBOARD_CACHE_TIMEOUT", default=60, cast=int)
+
+# Hasta cuántas filas estimadas se cuenta con COUNT(*) exacto en los listados
+# con paginación por keyset (PostgreSQL; por encima se usa pg_class.reltuples)
+PAGINACION_CONTEO_EXACTO_HASTA = config(
+    "PAGINACION_CONTEO_EXACTO_HASTA", default=10000, cast=int
+)
+
+# Segundos que se cachean los fragmentos de templates {% fragmento %} (0 = sin caché)
+FRAGMENTOS_CACHE_TIMEOUT = config("FRAGMENTOS_CACHE_TIMEOUT", default=300, cast=int)
+
+# Perfilado de requests (apps.core.perfilado), desactivado por defecto: se
+# loguean los requests que tardan al menos PERFILADO_LOG_DESDE_MS y el reporte
+# /perfilado/ muestra las últimas PERFILADO_VENTANA_HORAS horas
+PERFILADO_ACTIVO = config("PERFILADO_ACTIVO", default=False, cast=bool)
+PERFILADO_LOG_DESDE_MS = config("PERFILADO_LOG_DESDE_MS", default=500, cast=int)
+PERFILADO_VENTANA_HORAS = config("PERFILADO_VENTANA_HORAS", default=24, cast=int)
+PERFILADO_SINCRONIZAR_SEGUNDOS = config(
+    "PERFILADO_SINCRONIZAR_SEGUNDOS", default=10, cast=int
+)
+
+# Consultas lentas y repetidas (apps.core.consultas): se avisa en el log de las
+# que tardan al menos CONSULTAS_LENTAS_MS y de las que se repiten más de
+# CONSULTAS_REPETIDAS_MAX veces en un request o tarea (0 = sin aviso)
+CONSULTAS_LENTAS_MS = config("CONSULTAS_LENTAS_MS", default=500, cast=int)
+CONSULTAS_REPETIDAS_MAX = config("CONSULTAS_REPETIDAS_MAX", default=10, cast=int)
+
 # Configuración de LOGIN
 LOGIN_URL = "login"
 LOGIN_REDIRECT_URL = "home"
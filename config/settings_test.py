@@ -0,0 +1,16 @@
+from .settings import *  # noqa: F401,F403
+
+# Las pruebas no escriben en logs/ ni perfilan cada request
+LOGGING["handlers"].pop("file")
+LOGGING["root"]["handlers"] = ["console"]
+LOGGING["loggers"]["django"]["handlers"] = ["console"]
+
+PERFILADO_ACTIVO = False
+
+# Un único proceso: la caché en memoria alcanza y no deja archivos
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "gestion-academica-pruebas",
+    }
+}
@@ -22,6 +22,8 @@ from django.conf.urls.static import static
 from django.views.generic import TemplateView
 from django.contrib.auth import views as auth_views
 
+from apps.core.views import PerfiladoView
+
 urlpatterns = [
     # Admin de Django
     path("admin/", admin.site.urls),
@@ -39,8 +41,10 @@ urlpatterns = [
     path("equivalencias/", include("apps.equivalencias.urls")),
     path("practica-supervisada/", include("apps.practica_supervisada.urls")),
     path("carrera-academica/", include("apps.carrera_academica.urls")),
-    # API REST (opcional)
-    # path('api/', include('apps.api.urls')),
+    # API REST (solo lectura)
+    path("api/", include("apps.api.urls")),
+    # Reporte de rendimiento por vista (superadmins)
+    path("perfilado/", PerfiladoView.as_view(), name="perfilado"),
 ]
 
 # Servir archivos media en desarrollo
@@ -0,0 +1,135 @@
+import pytest
+from datetime import date
+from django.core.cache import cache
+
+from apps.carrera_academica.models import CarreraAcademica
+from apps.core.models import Carrera, Departamento
+from apps.equivalencias.models import (
+    AsignaturaParaEquivalencia,
+    DetalleSolicitud,
+    Estudiante,
+    SolicitudEquivalencia,
+)
+from apps.planta_docente.models import Asignatura, Cargo, Docente, Resolucion
+
+
+@pytest.fixture(autouse=True)
+def cache_limpia():
+    """La caché local persiste entre tests; cada test arranca con una vacía"""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def cliente(client, admin_user):
+    client.force_login(admin_user)
+    return client
+
+
+@pytest.fixture
+def departamento():
+    return Departamento.objects.create(nombre="Ingeniería Civil", codigo="CIV")
+
+
+@pytest.fixture
+def asignatura(departamento):
+    carrera = Carrera.objects.create(
+        nombre="Ingeniería Civil", departamento_cabecera=departamento
+    )
+    return Asignatura.objects.create(
+        nombre="Estabilidad I",
+        codigo="EST1",
+        nivel="II",
+        puntaje=10,
+        horas_semanales=6,
+        horas_totales=192,
+        departamento=departamento,
+        carrera=carrera,
+        forma_dictado="anual",
+    )
+
+
+@pytest.fixture
+def resolucion():
+    return Resolucion.objects.create(
+        numero="100",
+        anio=2024,
+        objeto="alta",
+        origen="decano",
+        fecha_emision=date(2024, 3, 1),
+    )
+
+
+@pytest.fixture
+def crear_cargo(asignatura, resolucion):
+    """Fábrica de cargos con un docente nuevo por llamada"""
+    contador = {"n": 0}
+
+    def _crear_cargo(**kwargs):
+        contador["n"] += 1
+        datos = {
+            "docente": Docente.objects.create(
+                apellido=f"Apellido{contador['n']}",
+                nombre="Nombre",
+                documento=f"3000000{contador['n']}",
+                fecha_nacimiento=date(1980, 1, 1),
+            ),
+            "asignatura": asignatura,
+            "caracter": "regular",
+            "categoria": "profesor_adjunto",
+            "dedicacion": "simple",
+            "cantidad_horas": 10,
+            "fecha_inicio": date(2024, 4, 1),
+            "resolucion_alta": resolucion,
+        }
+        datos.update(kwargs)
+        return Cargo.objects.create(**datos)
+
+    return _crear_cargo
+
+
+@pytest.fixture
+def carrera(crear_cargo):
+    return CarreraAcademica.objects.create(
+        cargo=crear_cargo(),
+        numero_expediente="EXP-1",
+        fecha_inicio=date(2022, 4, 1),
+        fecha_vencimiento_original=date(2029, 1, 30),
+        resolucion_designacion="R1",
+        resolucion_puesta_en_funcion="P1",
+    )
+
+
+@pytest.fixture
+def estudiante():
+    return Estudiante.objects.create(
+        nombre_completo="Ana Pérez", dni_pasaporte="40111222"
+    )
+
+
+@pytest.fixture
+def crear_solicitud(estudiante, asignatura):
+    """Fábrica de solicitudes con una asignatura por estado indicado"""
+
+    def _crear_solicitud(*estados):
+        solicitud = SolicitudEquivalencia.objects.create(estudiante=estudiante)
+        for indice, estado in enumerate(estados):
+            config = AsignaturaParaEquivalencia.objects.create(
+                asignatura=Asignatura.objects.create(
+                    nombre=f"Asignatura {solicitud.pk}-{indice}",
+                    nivel=asignatura.nivel,
+                    puntaje=asignatura.puntaje,
+                    horas_semanales=asignatura.horas_semanales,
+                    horas_totales=asignatura.horas_totales,
+                    departamento=asignatura.departamento,
+                    carrera=asignatura.carrera,
+                    forma_dictado=asignatura.forma_dictado,
+                )
+            )
+            DetalleSolicitud.objects.create(
+                solicitud=solicitud, asignatura=config, estado_asignatura=estado
+            )
+        return solicitud
+
+    return _crear_solicitud